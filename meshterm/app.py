@@ -5,30 +5,42 @@ import time
 import threading
 import logging
 import logging.handlers
-import os
-from typing import Optional
+import queue
+from collections import deque
+from pathlib import Path
+from typing import ClassVar, Optional
 
 from textual.app import App, ComposeResult
 from textual import on
 
 # Set up file-based error logging
-_log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tmp')
-os.makedirs(_log_dir, exist_ok=True)
-_log_file = os.path.join(_log_dir, 'error.log')
-
-_file_handler = logging.handlers.RotatingFileHandler(
-    _log_file,
-    maxBytes=1024 * 1024,  # 1 MB
-    backupCount=3,
-)
-_file_handler.setLevel(logging.ERROR)
-_file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-))
-logging.getLogger().addHandler(_file_handler)
+_log_dir = Path(__file__).resolve().parent.parent / 'tmp'
+_log_dir.mkdir(exist_ok=True)
+_log_file = _log_dir / 'error.log'
+
+_FILE_HANDLER_NAME = 'meshterm_error_file'
+
+# Re-importing the module (e.g. dev reloads) must not attach a second handler
+_root_logger = logging.getLogger()
+if not any(
+    h.get_name() == _FILE_HANDLER_NAME or getattr(h, 'baseFilename', None) == str(_log_file)
+    for h in _root_logger.handlers
+):
+    _file_handler = logging.handlers.RotatingFileHandler(
+        str(_log_file),
+        maxBytes=1024 * 1024,  # 1 MB
+        backupCount=3,
+    )
+    _file_handler.set_name(_FILE_HANDLER_NAME)
+    _file_handler.setLevel(logging.ERROR)
+    _file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    _root_logger.addHandler(_file_handler)
 from textual.binding import Binding  # noqa: E402
 from textual.widgets import TabbedContent, TabPane  # noqa: E402
 
+from .formatting import node_display_name  # noqa: E402
 from .state import AppState  # noqa: E402
 from .connection import MeshtasticConnection  # noqa: E402
 from .storage import LogStorage, PlainTextLogger  # noqa: E402
@@ -36,11 +48,11 @@ from .views import LogView, NodesView, DetailView, ChatView, SettingsView  # noq
 from .widgets.status_bar import StatusBar  # noqa: E402
 from .widgets.header_bar import HeaderBar  # noqa: E402
 from .widgets.chat_input import ChatInput  # noqa: E402
+from .widgets.node_table import NodeTable  # noqa: E402
 from .widgets.dm_input import DMInput  # noqa: E402
 from .widgets.help_modal import HelpModal  # noqa: E402
 from .widgets.reconnecting_modal import ReconnectingModal  # noqa: E402
 
-
 # ASCII art logo
 LOGO = r"""
 #     #                      #######
@@ -53,6 +65,23 @@ LOGO = r"""
 """
 
 
+def _build_tx_packet(from_id, to, text: str, channel: int, request_id,
+                     reply_to: Optional[int] = None) -> dict:
+    """Build the local record of a sent text message."""
+    packet = {
+        'from': from_id,
+        'to': to,
+        'decoded': {'portnum': 'TEXT_MESSAGE_APP', 'text': text},
+        'channel': channel,
+        '_tx': True,  # Mark as transmitted
+        '_delivered': None,  # None = pending, True = delivered, False = failed
+        'id': request_id,  # Store packet ID for delivery tracking
+    }
+    if reply_to:
+        packet['_reply_to_packet_id'] = reply_to
+    return packet
+
+
 class MeshtermApp(App):
     """Meshterm - TUI for Meshtastic monitoring."""
 
@@ -115,6 +144,37 @@ class MeshtermApp(App):
         Binding("a", "subtab_settings('advanced')", show=False),
     ]
 
+    # DM toasts are held until the burst goes quiet, but never longer than the max delay
+    DM_DEBOUNCE = 0.15
+    DM_MAX_DELAY = 1.0
+    # Sends within this window are added to the buffer together
+    TX_BATCH_DELAY = 0.05
+
+    # Main tab cycle order for next/prev tab
+    _MAIN_TABS = ("nodes", "log", "chat", "detail", "settings")
+    _TAB_INDEX: ClassVar[dict] = {name: i for i, name in enumerate(_MAIN_TABS)}
+
+    # Header (context, default sub-tab) per tab; anything else is "main"
+    _TAB_CONTEXTS: ClassVar[dict] = {
+        "detail": ("detail", "info"),
+        "settings": ("settings", "radio"),
+        "chat": ("chat", "0"),
+    }
+    # Cached view attribute per tab
+    _TAB_VIEWS: ClassVar[dict] = {
+        "log": "_log_view",
+        "nodes": "_nodes_view",
+        "detail": "_detail_view",
+        "chat": "_chat_view",
+        "settings": "_settings_view",
+    }
+    # (view attribute, method) that handles a header sub-tab pick per tab
+    _SUBTAB_ACTIONS: ClassVar[dict] = {
+        "detail": ("_detail_view", "action_switch_subtab"),
+        "settings": ("_settings_view", "action_switch_subtab"),
+        "chat": ("_chat_view", "action_switch_channel"),
+    }
+
     def __init__(self, state: AppState, connection: MeshtasticConnection, **kwargs):
         super().__init__(**kwargs)
         self.state = state
@@ -126,6 +186,29 @@ class MeshtermApp(App):
         self._intentional_disconnect = False
         # Track if reconnect modal is already showing
         self._reconnect_modal_showing = False
+        # Header needs a redraw on the next flush tick
+        self._header_dirty = False
+        # Incoming DMs waiting to be announced (filled from the receive thread)
+        self._pending_dms: deque = deque()
+        self._dm_first_at = 0.0
+        self._dm_last_at = 0.0
+        # Latest activated tab, applied once after the next refresh
+        self._pending_tab: Optional[str] = None
+        self._tab_drain_scheduled = False
+        self._current_tab_idx = 0
+        self._last_connected: Optional[bool] = None
+        self._tx_batch: list = []
+        self._tx_flush_scheduled = False
+
+        # Widget references, cached once compose has mounted them
+        self._header: Optional[HeaderBar] = None
+        self._status_bar: Optional[StatusBar] = None
+        self._tabs: Optional[TabbedContent] = None
+        self._nodes_view: Optional[NodesView] = None
+        self._log_view: Optional[LogView] = None
+        self._detail_view: Optional[DetailView] = None
+        self._chat_view: Optional[ChatView] = None
+        self._settings_view: Optional[SettingsView] = None
 
         # Subscribe to DM notifications
         self.state.messages.subscribe(self._handle_message_event)
@@ -135,21 +218,49 @@ class MeshtermApp(App):
         with TabbedContent(id="main-tabs", initial="nodes"):
             with TabPane("Nodes", id="nodes"):
                 yield NodesView(self.state, id="nodes-view")
-            with TabPane("Log", id="log"):
-                yield LogView(self.state, id="log-view")
-            with TabPane("Detail", id="detail"):
-                yield DetailView(self.state, id="detail-view")
-            with TabPane("Chat", id="chat"):
-                yield ChatView(self.state, id="chat-view")
-            with TabPane("Settings", id="settings"):
-                yield SettingsView(self.state, self.connection, id="settings-view")
+            # Remaining views are mounted on first activation (see _ensure_view)
+            yield TabPane("Log", id="log")
+            yield TabPane("Detail", id="detail")
+            yield TabPane("Chat", id="chat")
+            yield TabPane("Settings", id="settings")
         yield StatusBar(self.state, id="status-bar")
 
+    def on_mount(self):
+        """Cache widget lookups and start the redraw flush timer."""
+        self._header = self.query_one("#header-bar", HeaderBar)
+        self._status_bar = self.query_one("#status-bar", StatusBar)
+        self._tabs = self.query_one("#main-tabs", TabbedContent)
+        self._nodes_view = self.query_one("#nodes-view", NodesView)
+
+        # Coalesce header redraws to at most one per frame
+        self.set_interval(1 / 30, self._flush_dirty)
+
+    def on_resize(self, event):
+        """Always redraw the header after a resize."""
+        self._header_dirty = True
+
+    def _flush_dirty(self):
+        """Redraw the header if anything marked it dirty since the last tick."""
+        self._flush_dm_notifications()
+        if not self._header_dirty:
+            return
+        self._header_dirty = False
+        if self._header is not None:
+            self._header.refresh()
+
     def _on_connection_status(self, status: str, info: dict):
         """Handle connection status changes."""
-        status_bar = self.query_one("#status-bar", StatusBar)
+        status_bar = self._status_bar
+        if status_bar is None:
+            return
+
+        # Repeated callbacks for the state we already show are no-ops
+        connected = status == "connected"
+        if connected == self._last_connected:
+            return
+        self._last_connected = connected
 
-        if status == "connected":
+        if connected:
             status_bar.set_connected(True)
             node_id = info.get('my_node_id', '?')
             self.notify(f"Connected: {node_id}", timeout=3)
@@ -178,11 +289,9 @@ class MeshtermApp(App):
             if success:
                 self.notify("Reconnected to device", timeout=3)
                 # Update status bar
-                try:
-                    status_bar = self.query_one("#status-bar", StatusBar)
-                    status_bar.set_connected(True)
-                except Exception:
-                    pass
+                self._last_connected = True
+                if self._status_bar is not None:
+                    self._status_bar.set_connected(True)
             else:
                 self.notify("Could not reconnect. Please reconnect manually.", severity="error", timeout=5)
 
@@ -196,110 +305,119 @@ class MeshtermApp(App):
     def _handle_message_event(self, event_type: str, data):
         """Handle message events including DM notifications."""
         if event_type == "dm_received" and data:
-            from_name = data.get('from_name', '?')
-            preview = data.get('preview', '')
+            # Queue it; the flush tick announces the whole burst at once
+            now = time.monotonic()
+            if not self._pending_dms:
+                self._dm_first_at = now
+            self._dm_last_at = now
+            self._pending_dms.append(data)
+
+    def _flush_dm_notifications(self):
+        """Show one toast and ring the bell once for a burst of DMs."""
+        if not self._pending_dms:
+            return
+        now = time.monotonic()
+        if now - self._dm_last_at < self.DM_DEBOUNCE and now - self._dm_first_at < self.DM_MAX_DELAY:
+            return
 
-            # Show toast notification
+        pending = []
+        while self._pending_dms:
+            pending.append(self._pending_dms.popleft())
+
+        if len(pending) == 1:
+            from_name = pending[0].get('from_name', '?')
+            preview = pending[0].get('preview', '')
             self.notify(f"DM from {from_name}: {preview}", timeout=5)
+        else:
+            names = list(dict.fromkeys(dm.get('from_name', '?') for dm in pending))
+            self.notify(f"{len(pending)} DMs from {', '.join(names)}", timeout=5)
 
-            # Audio alert
-            self.bell()
+        # Audio alert
+        self.bell()
 
-            # Refresh header bar to show notification badge
-            try:
-                header = self.query_one("#header-bar", HeaderBar)
-                header.refresh()
-            except Exception:
-                pass
+        # Refresh header bar to show notification badge
+        self._header_dirty = True
 
     def action_switch_tab(self, tab_id: str):
         """Switch to a different tab."""
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        tabs.active = tab_id
+        self._ensure_view(tab_id)
+        self._tabs.active = tab_id
         self.current_view = tab_id
+        self._current_tab_idx = self._TAB_INDEX.get(tab_id, self._current_tab_idx)
+        # Header and view updates happen once, from the TabActivated handler
 
-        # Update header bar context and active tab
-        header = self.query_one("#header-bar", HeaderBar)
+    def _ensure_view(self, tab_id: str):
+        """Mount the view for tab_id into its pane the first time it is needed."""
+        attr = self._TAB_VIEWS.get(tab_id)
+        if attr is None or getattr(self, attr) is not None:
+            return
+        if tab_id == "settings":
+            view = SettingsView(self.state, self.connection, id="settings-view")
+        else:
+            view_cls = {"log": LogView, "detail": DetailView, "chat": ChatView}[tab_id]
+            view = view_cls(self.state, id=f"{tab_id}-view")
+        setattr(self, attr, view)
+        self._tabs.get_pane(tab_id).mount(view)
+
+    def _apply_tab(self, tab_id: str):
+        """Sync the header with tab_id and run the view's on_show."""
+        header = self._header
         header.set_active_tab(tab_id)
 
-        if tab_id == "detail":
-            header.set_context("detail", "info")
-        elif tab_id == "settings":
-            header.set_context("settings", "radio")
-        elif tab_id == "chat":
-            header.set_context("chat", "0")
+        ctx = self._TAB_CONTEXTS.get(tab_id)
+        if ctx:
+            header.set_context(*ctx)
         else:
             header.set_context("main")
 
+        view = getattr(self, self._TAB_VIEWS.get(tab_id, ''), None)
+        on_show = getattr(view, 'on_show', None)
+        # A freshly mounted view gets its first Show event from Textual
+        if on_show and view.is_mounted:
+            on_show()
+
     def action_next_tab(self):
         """Switch to next main tab."""
-        tabs = ["nodes", "log", "chat", "detail", "settings"]
-        try:
-            current_idx = tabs.index(self.current_view)
-            next_idx = (current_idx + 1) % len(tabs)
-        except ValueError:
-            next_idx = 0
-        self.action_switch_tab(tabs[next_idx])
+        self._current_tab_idx = (self._current_tab_idx + 1) % len(self._MAIN_TABS)
+        self.action_switch_tab(self._MAIN_TABS[self._current_tab_idx])
 
     def action_prev_tab(self):
         """Switch to previous main tab."""
-        tabs = ["nodes", "log", "chat", "detail", "settings"]
-        try:
-            current_idx = tabs.index(self.current_view)
-            prev_idx = (current_idx - 1) % len(tabs)
-        except ValueError:
-            prev_idx = 0
-        self.action_switch_tab(tabs[prev_idx])
+        self._current_tab_idx = (self._current_tab_idx - 1) % len(self._MAIN_TABS)
+        self.action_switch_tab(self._MAIN_TABS[self._current_tab_idx])
 
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated):
         """Handle tab changes."""
         tab_id = event.pane.id
+        self._ensure_view(tab_id)
         self.current_view = tab_id
+        self._current_tab_idx = self._TAB_INDEX.get(tab_id, self._current_tab_idx)
+
+        # Rapid cycling fires one event per keystroke - only the last one gets applied
+        self._pending_tab = tab_id
+        if not self._tab_drain_scheduled:
+            self._tab_drain_scheduled = True
+            self.call_after_refresh(self._apply_tab_change)
+
+    def _apply_tab_change(self):
+        """Update the header and show the most recently activated tab."""
+        tab_id = self._pending_tab
+        self._pending_tab = None
+        self._tab_drain_scheduled = False
+        if tab_id is None:
+            return
 
-        # Update header bar context and active tab
-        header = self.query_one("#header-bar", HeaderBar)
-        header.set_active_tab(tab_id)
-
-        if tab_id == "detail":
-            header.set_context("detail", "info")
-        elif tab_id == "settings":
-            header.set_context("settings", "radio")
-        elif tab_id == "chat":
-            header.set_context("chat", "0")
-        else:
-            header.set_context("main")
+        self._apply_tab(tab_id)
 
-        # Trigger on_show for the view and focus appropriate widget
-        if tab_id == "log":
-            view = self.query_one("#log-view", LogView)
-            if hasattr(view, 'on_show'):
-                view.on_show()
-        elif tab_id == "nodes":
-            view = self.query_one("#nodes-view", NodesView)
-            if hasattr(view, 'on_show'):
-                view.on_show()
-            try:
-                from .widgets.node_table import NodeTable
-                table = view.query_one(NodeTable)
-                table.focus()
-            except Exception:
-                pass
-        elif tab_id == "detail":
-            view = self.query_one("#detail-view", DetailView)
-            if hasattr(view, 'on_show'):
-                view.on_show()
-        elif tab_id == "chat":
-            view = self.query_one("#chat-view", ChatView)
-            if hasattr(view, 'on_show'):
-                view.on_show()
-        elif tab_id == "settings":
-            view = self.query_one("#settings-view", SettingsView)
-            if hasattr(view, 'on_show'):
-                view.on_show()
+        # Nodes tab hands focus straight to the table
+        if tab_id == "nodes":
+            tables = self._nodes_view.query(NodeTable)
+            if tables:
+                tables.first().focus()
 
     def action_go_back(self):
         """Go back by focusing header bar, or to nodes if already in tab selection."""
-        header = self.query_one("#header-bar", HeaderBar)
+        header = self._header
         if header.has_focus:
             # Already in tab selection, go back to nodes
             self.action_switch_tab("nodes")
@@ -317,23 +435,23 @@ class MeshtermApp(App):
 
     def on_header_bar_sub_tab_selected(self, event: HeaderBar.SubTabSelected):
         """Handle sub-tab selection from header bar."""
-        header = self.query_one("#header-bar", HeaderBar)
-        header.set_active_subtab(event.subtab_id)
-
-        if self.current_view == "detail":
-            view = self.query_one("#detail-view", DetailView)
-            view.action_switch_subtab(event.subtab_id)
-        elif self.current_view == "settings":
-            view = self.query_one("#settings-view", SettingsView)
-            view.action_switch_subtab(event.subtab_id)
-        elif self.current_view == "chat":
-            view = self.query_one("#chat-view", ChatView)
-            view.action_switch_channel(event.subtab_id)
+        subtab_id = event.subtab_id
+        header = self._header
+        if header.active_subtab != subtab_id:
+            header.set_active_subtab(subtab_id)
+            self._header_dirty = True
+
+        # Re-selecting the active sub-tab still runs the view action: that is
+        # how Enter on the header hands focus back to the content
+        target = self._SUBTAB_ACTIONS.get(self.current_view)
+        if target:
+            view_attr, action = target
+            getattr(getattr(self, view_attr), action)(subtab_id)
 
     def on_header_bar_dm_closed(self, event: HeaderBar.DMClosed):
         """Handle DM closed from header bar."""
         if self.current_view == "chat":
-            view = self.query_one("#chat-view", ChatView)
+            view = self._chat_view
             # If we were on the closed DM, switch to channel 0
             if isinstance(view.current_channel, str) and view.current_channel == f"dm:{event.node_id}":
                 view.action_switch_channel("0")
@@ -343,7 +461,6 @@ class MeshtermApp(App):
         self.state.settings.toggle_verbose()
         mode = "ON" if self.state.settings.verbose else "OFF"
         self.notify(f"Verbose mode: {mode}", timeout=1)
-        self.query_one("#header-bar", HeaderBar).refresh()
 
     def on_nodes_view_node_selected(self, event: NodesView.NodeSelected):
         """Handle node selection from nodes view."""
@@ -354,7 +471,6 @@ class MeshtermApp(App):
         self.state.settings.toggle_favorites_highlight()
         mode = "ON" if self.state.settings.favorites_highlight else "OFF"
         self.notify(f"Favorites highlight: {mode}", timeout=2)
-        self.query_one("#header-bar", HeaderBar).refresh()
 
     def action_show_help(self):
         """Show context-aware help modal."""
@@ -363,23 +479,26 @@ class MeshtermApp(App):
     def action_subtab_detail(self, subtab: str):
         """Switch detail view sub-tab if on detail view."""
         if self.current_view == "detail":
-            view = self.query_one("#detail-view", DetailView)
+            view = self._detail_view
+            # Auto-repeat of a held hotkey re-selects the same sub-tab
+            if view.current_subtab == subtab:
+                return
             view.action_switch_subtab(subtab)
-            header = self.query_one("#header-bar", HeaderBar)
+            header = self._header
             header.set_active_subtab(subtab)
 
     def action_subtab_settings(self, subtab: str):
         """Switch settings view sub-tab if on settings view."""
         if self.current_view == "settings":
-            view = self.query_one("#settings-view", SettingsView)
+            view = self._settings_view
+            if view.current_subtab == subtab:
+                return
             view.action_switch_subtab(subtab)
-            header = self.query_one("#header-bar", HeaderBar)
+            header = self._header
             header.set_active_subtab(subtab)
 
     def on_chat_input_message_submitted(self, event: ChatInput.MessageSubmitted):
         """Handle message sent from chat input."""
-        import time as time_module
-
         if event.dest_node_id:
             # DM mode: send to specific node on channel 0
             dest = event.dest_node_id
@@ -387,8 +506,7 @@ class MeshtermApp(App):
             # Get node name for notification
             node = self.state.nodes.get_node(event.dest_node_id)
             if node:
-                user = node.get('user', {})
-                dest_name = user.get('shortName') or user.get('longName') or event.dest_node_id
+                dest_name = node_display_name(node, event.dest_node_id)
             else:
                 dest_name = event.dest_node_id
 
@@ -412,34 +530,13 @@ class MeshtermApp(App):
             success, request_id = self.connection.send_message(text_to_send, dest, channel)
 
         if success:
-            # Add a TX marker to the log
-            tx_packet = {
-                'from': self.state.my_node_id,
-                'to': dest,
-                'decoded': {
-                    'portnum': 'TEXT_MESSAGE_APP',
-                    'text': event.text  # Display without prefix
-                },
-                'channel': channel,
-                '_tx': True,  # Mark as transmitted
-                '_delivered': None,  # None = pending, True = delivered, False = failed
-                'id': request_id,  # Store packet ID for delivery tracking
-            }
-
-            # Mark as reply if applicable
-            if event.reply_to_packet_id:
-                tx_packet['_reply_to_packet_id'] = event.reply_to_packet_id
-
-            timestamp = time_module.time()
-            db_id = self.state.messages.add(tx_packet)
-
-            # Store reply reference if this is a reply
-            if event.reply_to_packet_id and db_id and self.state.storage:
-                self.state.storage.store_reply_ref(db_id, event.reply_to_packet_id, timestamp)
-
-            # Log to plain text file
-            if self.state.text_logger:
-                self.state.text_logger.log_packet(tx_packet, timestamp)
+            # Add a TX marker to the log (displayed without the reply prefix)
+            tx_packet = _build_tx_packet(
+                self.state.my_node_id, dest, event.text, channel, request_id,
+                reply_to=event.reply_to_packet_id,
+            )
+
+            self._queue_tx(tx_packet, time.time())
 
             # Track pending message for ACK
             if request_id:
@@ -447,13 +544,9 @@ class MeshtermApp(App):
 
             # Lock input until delivery confirmed
             if self.current_view == "chat":
-                try:
-                    from .views.chat import ChatView
-                    chat_view = self.query_one("#chat-view", ChatView)
-                    chat_input_widget = chat_view.query_one("#chat-input", ChatInput)
+                inputs = self._chat_view.query("#chat-input").results(ChatInput)
+                for chat_input_widget in inputs:
                     chat_input_widget.lock_input()
-                except Exception:
-                    pass
         else:
             if dest_name:
                 self.notify("Failed to send DM", severity="error", timeout=3)
@@ -463,7 +556,6 @@ class MeshtermApp(App):
     @on(DMInput.MessageSubmitted)
     def on_dm_input_message_submitted(self, event: DMInput.MessageSubmitted):
         """Handle DM sent from DM input."""
-        import time as time_module
         # DMs use channel 0
         success, request_id = self.connection.send_message(event.text, event.dest_node_id, 0)
 
@@ -471,8 +563,7 @@ class MeshtermApp(App):
             # Get node name for notification
             node = self.state.nodes.get_node(event.dest_node_id)
             if node:
-                user = node.get('user', {})
-                dest_name = user.get('shortName') or user.get('longName') or event.dest_node_id
+                dest_name = node_display_name(node, event.dest_node_id)
             else:
                 dest_name = event.dest_node_id
 
@@ -480,24 +571,10 @@ class MeshtermApp(App):
             self.state.open_dms.open_dm(event.dest_node_id, dest_name)
 
             # Add a TX marker to the log
-            tx_packet = {
-                'from': self.state.my_node_id,
-                'to': event.dest_node_id,
-                'decoded': {
-                    'portnum': 'TEXT_MESSAGE_APP',
-                    'text': event.text
-                },
-                'channel': 0,
-                '_tx': True,  # Mark as transmitted
-                '_delivered': None,  # None = pending, True = delivered, False = failed
-                'id': request_id,  # Store packet ID for delivery tracking
-            }
-            timestamp = time_module.time()
-            self.state.messages.add(tx_packet)
-
-            # Log to plain text file
-            if self.state.text_logger:
-                self.state.text_logger.log_packet(tx_packet, timestamp)
+            tx_packet = _build_tx_packet(
+                self.state.my_node_id, event.dest_node_id, event.text, 0, request_id
+            )
+            self._queue_tx(tx_packet, time.time())
 
             # Track pending message for ACK
             if request_id:
@@ -505,49 +582,92 @@ class MeshtermApp(App):
         else:
             self.notify("Failed to send DM", severity="error", timeout=3)
 
+    def _queue_tx(self, tx_packet: dict, timestamp: float):
+        """Queue a sent packet; a burst of sends is buffered and stored together."""
+        self._tx_batch.append((tx_packet, timestamp))
+        if not self._tx_flush_scheduled:
+            self._tx_flush_scheduled = True
+            self.set_timer(self.TX_BATCH_DELAY, self._flush_tx_batch)
+
+    def _flush_tx_batch(self):
+        """Add queued TX packets to the buffer and persist them together."""
+        batch = self._tx_batch
+        self._tx_batch = []
+        self._tx_flush_scheduled = False
+        if not batch:
+            return
+
+        # Persisted by the storage worker along with received packets; it
+        # links replies from each packet's '_reply_to_packet_id'
+        messages = self.state.messages
+        worker = self.state.storage_worker
+        for packet, ts in batch:
+            entry = messages.append(packet, ts)
+            if worker:
+                worker.submit(entry)
+
     def on_unmount(self):
         """Cleanup when app exits."""
+        self._flush_tx_batch()
         self.state.messages.unsubscribe(self._handle_message_event)
         self.connection.cleanup()
 
 
+# Pre-encoded colored status prefixes (✓, ✗, →)
+_ANSI_OK = b"\x1b[32m\xe2\x9c\x93\x1b[0m "
+_ANSI_ERR = b"\x1b[31m\xe2\x9c\x97\x1b[0m "
+_ANSI_INFO = b"\x1b[36m\xe2\x86\x92\x1b[0m "
+_STATUS_PREFIX = {"success": _ANSI_OK, "error": _ANSI_ERR}
+
+
+def _write_stdout(data: bytes):
+    """Write pre-encoded bytes to stdout in a single call."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        print(data.decode("utf-8", "replace"), end="", flush=True)
+        return
+    out.write(data)
+    out.flush()
+
+
 def print_status(message: str, status: str = "info"):
     """Print a status message with color."""
-    if status == "success":
-        print(f"\033[32m✓\033[0m {message}")
-    elif status == "error":
-        print(f"\033[31m✗\033[0m {message}")
-    else:
-        print(f"\033[36m→\033[0m {message}")
+    # Keep ordering with anything already buffered in the text layer
+    sys.stdout.flush()
+    prefix = _STATUS_PREFIX.get(status, _ANSI_INFO)
+    _write_stdout(prefix + message.encode("utf-8", "replace") + b"\n")
 
 
 class Spinner:
     """Animated spinner for long operations."""
 
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    # Line-clear + colored frame prefixes, encoded once
+    _FRAME_BYTES = tuple(f"\r\033[K\033[36m{f}\033[0m ".encode() for f in FRAMES)
 
     def __init__(self, message: str):
         self.message = message
+        self._message_bytes = message.encode("utf-8", "replace")
         self.running = False
         self.thread = None
         self.frame = 0
-        self._lock = threading.Lock()
 
     def update(self, message: str):
         """Update the spinner message."""
-        with self._lock:
-            self.message = message
+        # Rebinding attributes is atomic, no lock needed
+        self._message_bytes = message.encode("utf-8", "replace")
+        self.message = message
 
     def _animate(self):
+        frames = self._FRAME_BYTES
         while self.running:
-            with self._lock:
-                msg = self.message
-            frame = self.FRAMES[self.frame % len(self.FRAMES)]
-            print(f"\r\033[K\033[36m{frame}\033[0m {msg}", end="", flush=True)
+            _write_stdout(frames[self.frame % len(frames)] + self._message_bytes)
             self.frame += 1
             time.sleep(0.1)
 
     def start(self):
+        # Drain pending text output before writing frames to the raw buffer
+        sys.stdout.flush()
         self.running = True
         self.thread = threading.Thread(target=self._animate, daemon=True)
         self.thread.start()
@@ -592,29 +712,17 @@ def connect_to_device(port: Optional[str] = None) -> Optional[tuple]:
 
     print_status(f"Found: {', '.join(ports)}", "success")
 
-    # Connection state tracking
-    connection_state = {
-        "phase": "connecting",
-        "node_count": 0,
-        "my_info": None,
-        "config_done": False,
-        "interface": None,
-        "error": None,
-    }
-    spinner = None
+    # Pubsub callbacks and the connect thread only post progress here; the
+    # main thread is the single consumer and the only one touching the spinner
+    progress_q: queue.Queue[tuple] = queue.Queue()
 
     def on_node_updated(node, interface):
         """Track nodes being received."""
-        connection_state["node_count"] += 1
-        if spinner:
-            count = connection_state["node_count"]
-            spinner.update(f"Receiving node database... ({count} nodes)")
+        progress_q.put(("node", interface))
 
     def on_connected(interface):
         """Track connection established."""
-        connection_state["config_done"] = True
-        if spinner:
-            spinner.update("Finalizing connection...")
+        progress_q.put(("connected", None))
 
     # Subscribe to events temporarily
     pub.subscribe(on_node_updated, "meshtastic.node.updated")
@@ -622,46 +730,55 @@ def connect_to_device(port: Optional[str] = None) -> Optional[tuple]:
 
     ports_to_try = [port] if port else ports
     connected = False
+    interface = None
 
     try:
         for p in ports_to_try:
-            connection_state["phase"] = "serial"
-            connection_state["node_count"] = 0
-            connection_state["config_done"] = False
-
             spinner = Spinner(f"Opening serial port {p}...")
             spinner.start()
 
-            def try_connect():
+            def try_connect(path=p):
+                progress_q.put(("serial_open", path))
                 try:
-                    spinner.update(f"Connecting to {p} (waiting for device info...)")
-                    connection_state["interface"] = SerialInterface(p)
+                    progress_q.put(("done", SerialInterface(path)))
                 except Exception as e:
-                    connection_state["error"] = str(e)
-                    connection_state["interface"] = None
+                    progress_q.put(("error", str(e)))
 
             connect_thread = threading.Thread(target=try_connect, daemon=True)
             connect_thread.start()
 
-            # Wait for connection with progress updates
-            while connect_thread.is_alive():
-                time.sleep(0.1)
-                iface = connection_state["interface"]
-                if iface:
-                    if iface.myInfo and connection_state["phase"] == "serial":
-                        connection_state["phase"] = "config"
-                        connection_state["my_info"] = iface.myInfo
+            # Block until the next milestone; the spinner animates on its own thread
+            node_count = 0
+            in_config = False
+            error = ""
+            while True:
+                kind, payload = progress_q.get()
+                if kind == "serial_open":
+                    spinner.update(f"Connecting to {payload} (waiting for device info...)")
+                elif kind == "node":
+                    node_count += 1
+                    if not in_config and payload.myInfo:
+                        in_config = True
                         spinner.update(f"Receiving configuration from {p}...")
+                    else:
+                        spinner.update(f"Receiving node database... ({node_count} nodes)")
+                elif kind == "connected":
+                    spinner.update("Finalizing connection...")
+                elif kind == "done":
+                    interface = payload
+                    break
+                elif kind == "error":
+                    error = payload
+                    break
 
             connect_thread.join()
 
-            if connection_state["interface"] is not None:
+            if interface is not None:
                 spinner.stop(f"Connected to {p}", "success")
                 connected = True
                 break
             else:
-                err = connection_state.get("error", "")
-                if "lock" in err.lower():
+                if "lock" in error.lower():
                     spinner.stop(f"Port {p} is busy (in use by another program)", "error")
                 else:
                     spinner.stop(f"No Meshtastic device on {p}", "error" if port else "info")
@@ -681,8 +798,8 @@ def connect_to_device(port: Optional[str] = None) -> Optional[tuple]:
 
     # Create our connection wrapper
     connection = MeshtasticConnection(state)
-    connection.interface = connection_state["interface"]
-    connection.port = ports_to_try[0] if port else connection_state["interface"].devPath
+    connection.interface = interface
+    connection.port = ports_to_try[0] if port else interface.devPath
 
     # Trigger the connected handler manually to populate state
     connection._on_connected(connection.interface)
@@ -1,12 +1,22 @@
 """Meshtastic interface management."""
 
-import glob
+import os
 import re
-from typing import Optional, Callable, Tuple, Union
+import secrets
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, Tuple, Union
+
 from pubsub import pub
 
-from .state import AppState, SUPPORTED_REACTIONS
-from .formatting import format_node_id
+try:
+    import pybase64 as _b64  # optional SIMD-accelerated drop-in
+except ImportError:
+    import base64 as _b64
+
+from .formatting import format_node_id, node_display_name, scale_latlon
+from .state import SUPPORTED_REACTIONS, AppState
 
 # Protocol prefixes for reactions and replies
 # Reaction: [R:<packet_id>:<emoji>] - e.g., [R:123456:👍]
@@ -14,6 +24,83 @@ from .formatting import format_node_id
 REACTION_PATTERN = re.compile(r'^\[R:(\d+):([^\]]+)\]$')
 REPLY_PATTERN = re.compile(r'^\[>:(\d+)\]\s*(.*)$', re.DOTALL)
 
+
+def parse_reaction(text: str) -> Optional[Tuple[int, str]]:
+    """Parse a reaction message into (packet_id, emoji).
+
+    String-method equivalent of REACTION_PATTERN, used on the receive path.
+    """
+    if not text.startswith('[R:'):
+        return None
+    # '$' also matches before a single trailing newline
+    text = text.removesuffix('\n')
+    colon = text.find(':', 3)
+    if colon == -1 or not text.endswith(']'):
+        return None
+    packet_id = text[3:colon]
+    emoji = text[colon + 1:-1]
+    if not packet_id.isdecimal() or not emoji or ']' in emoji:
+        return None
+    return int(packet_id), emoji
+
+
+def parse_reply(text: str) -> Optional[Tuple[int, str]]:
+    """Parse a reply message into (parent_packet_id, message text).
+
+    String-method equivalent of REPLY_PATTERN, used on the receive path.
+    """
+    if not text.startswith('[>:'):
+        return None
+    end = text.find(']', 3)
+    packet_id = text[3:end]
+    if end == -1 or not packet_id.isdecimal():
+        return None
+    return int(packet_id), text[end + 1:].lstrip()
+
+# Receive-path dispatch: portnum name, number or number string -> tag
+_PORT_TEXT, _PORT_ROUTING, _PORT_NODEINFO, _PORT_POSITION, _PORT_TELEMETRY = range(1, 6)
+_PORTNUM_TAG = {
+    key: tag
+    for name, num, tag in (
+        ('TEXT_MESSAGE_APP', 1, _PORT_TEXT),
+        ('ROUTING_APP', 65, _PORT_ROUTING),
+        ('NODEINFO_APP', 4, _PORT_NODEINFO),
+        ('POSITION_APP', 3, _PORT_POSITION),
+        ('TELEMETRY_APP', 67, _PORT_TELEMETRY),
+    )
+    for key in (name, num, str(num))
+}
+
+# Named PSKs accepted by write_channel ('random' is generated per call)
+_NAMED_PSKS = {
+    'default': bytes([1]),  # Default Meshtastic key (AQ==)
+    'none': bytes([0]),
+}
+_NO_PSK = _NAMED_PSKS['none']
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def decode_psk(psk: str) -> bytes:
+    """Decode a PSK given as a name, hex string or base64 string."""
+    key = _NAMED_PSKS.get(psk.lower())
+    if key is not None:
+        return key
+    if psk.lower() == 'random':
+        return secrets.token_bytes(32)
+    if len(psk) % 2 == 0 and _HEX_DIGITS.issuperset(psk):
+        return bytes.fromhex(psk)
+    return _b64.b64decode(psk)
+
+# (section, fields) read by _snapshot_node_config from localConfig and moduleConfig
+_LOCAL_CONFIG_SPEC = (
+    ('lora', ('region', 'modem_preset', 'tx_power', 'hop_limit', 'tx_enabled')),
+    ('position', ('gps_mode', 'position_broadcast_secs', 'fixed_position')),
+    ('device', ('role', 'rebroadcast_mode', 'node_info_broadcast_secs')),
+)
+_MODULE_CONFIG_SPEC = (
+    ('telemetry', ('device_update_interval',)),
+)
+
 # Settings that cause device reboot when changed
 # Maps config_type -> set of field names that trigger reboot
 REBOOT_CAUSING_SETTINGS = {
@@ -22,93 +109,115 @@ REBOOT_CAUSING_SETTINGS = {
     'position': {'gps_mode'},
 }
 
+# Meshtastic pubsub topics, resolved once so cleanup unsubscribes from the
+# exact Topic objects we subscribed to
+_topic_mgr = pub.getDefaultTopicMgr()
+_TOPIC_RECEIVE = _topic_mgr.getOrCreateTopic("meshtastic.receive")
+_TOPIC_CONNECTED = _topic_mgr.getOrCreateTopic("meshtastic.connection.established")
+_TOPIC_DISCONNECTED = _topic_mgr.getOrCreateTopic("meshtastic.connection.lost")
+_TOPIC_NODE_UPDATED = _topic_mgr.getOrCreateTopic("meshtastic.node.updated")
+
 
 class MeshtasticConnection:
     """Manages connection to Meshtastic device."""
 
+    # __weakref__ is needed by pubsub, which holds weak refs to our handlers
+    __slots__ = ('__weakref__', '_config_snapshot', '_on_status_change', 'interface', 'port', 'state')
+
     def __init__(self, state: AppState, on_status_change: Optional[Callable] = None):
         self.state = state
         self.interface = None
         self.port: Optional[str] = None
         self._on_status_change = on_status_change
+        # (node, localConfig, moduleConfig, snapshot) from _snapshot_node_config,
+        # dropped on writes, reconnects and updates to the local node
+        self._config_snapshot: Optional[tuple] = None
+
+        # Running before the first packet can arrive; stopped in cleanup()
+        state.start_storage_worker()
 
         # Subscribe to meshtastic events
-        pub.subscribe(self._on_receive, "meshtastic.receive")
-        pub.subscribe(self._on_connected, "meshtastic.connection.established")
-        pub.subscribe(self._on_disconnected, "meshtastic.connection.lost")
+        _TOPIC_RECEIVE.subscribe(self._on_receive)
+        _TOPIC_CONNECTED.subscribe(self._on_connected)
+        _TOPIC_DISCONNECTED.subscribe(self._on_disconnected)
+        _TOPIC_NODE_UPDATED.subscribe(self._on_node_updated)
 
     def _on_receive(self, packet, interface):
         """Handle received packets."""
-        import time
         timestamp = time.time()
+        state = self.state
 
-        # Check for incoming DMs (TEXT_MESSAGE_APP on channel 0, to=my_node_id)
         decoded = packet.get('decoded', {})
-        portnum = str(decoded.get('portnum', ''))
+        tag = _PORTNUM_TAG.get(decoded.get('portnum'), 0)
+
+        raw_from = packet.get('from', packet.get('fromId'))
+
+        # Unhandled portnum and no signal or hop report: nothing here can
+        # update a node or a message, so count it and skip the buffer and storage
+        if (not tag and 'rxSnr' not in packet and 'rxRssi' not in packet
+                and 'hopStart' not in packet and 'hopLimit' not in packet
+                and not state.settings.log_all_packets):
+            state.stats.record_packet(packet, timestamp)
+            return
 
         # Check for reaction/reply prefixes in TEXT_MESSAGE_APP
-        if portnum in ('TEXT_MESSAGE_APP', '1'):
+        incoming_dm = False
+        if tag == _PORT_TEXT:
+            from_id = format_node_id(raw_from) if raw_from else ''
             text = decoded.get('text', '')
-            from_id = format_node_id(packet.get('from', ''))
 
             # Check for reaction prefix: [R:<packet_id>:<emoji>]
-            reaction_match = REACTION_PATTERN.match(text)
-            if reaction_match:
-                self._handle_reaction(packet, reaction_match, from_id, timestamp)
+            reaction = parse_reaction(text)
+            if reaction:
+                self._handle_reaction(packet, reaction[0], reaction[1], from_id, timestamp)
                 return  # Don't add reaction messages to the log
 
             # Check for reply prefix: [>:<packet_id>] message
-            reply_match = REPLY_PATTERN.match(text)
-            if reply_match:
-                parent_packet_id = int(reply_match.group(1))
-                actual_text = reply_match.group(2)
+            reply = parse_reply(text)
+            if reply:
+                parent_packet_id, actual_text = reply
                 # Store the original text and mark as a reply
                 packet['_reply_to_packet_id'] = parent_packet_id
                 # Update the decoded text to the actual message (without prefix)
                 decoded['text'] = actual_text
                 decoded['_original_text'] = text  # Keep original for debugging
 
-        # Add to message buffer (this also persists to SQLite)
-        db_id = self.state.messages.add(packet)
-
-        # If this is a reply, store the reply reference
-        if packet.get('_reply_to_packet_id') and self.state.storage:
-            parent_packet_id = packet['_reply_to_packet_id']
-            if db_id:
-                self.state.storage.store_reply_ref(db_id, parent_packet_id, timestamp)
+            # DM to us: channel 0, to=my_node_id, from someone else.
+            # Handled below, once the packet is in the buffer.
+            my_id = state.my_node_id
+            incoming_dm = (
+                packet.get('channel', 0) == 0
+                and from_id != my_id
+                and format_node_id(packet.get('to', '')) == my_id
+            )
 
-        # Log to plain text file
-        if self.state.text_logger:
-            self.state.text_logger.log_packet(packet, timestamp)
+        # Add to message buffer; SQLite, reply refs and the text log are
+        # written by the storage worker so bursts don't stall this thread
+        messages = state.messages
+        entry = messages.append(packet, timestamp)
+        worker = state.storage_worker
+        if worker:
+            worker.submit(entry)
 
         # Record stats
-        self.state.stats.record_packet(packet)
-
-        if portnum in ('TEXT_MESSAGE_APP', '1'):
-            channel = packet.get('channel', 0)
-            to_id = format_node_id(packet.get('to', ''))
-            from_id = format_node_id(packet.get('from', ''))
+        state.stats.record_packet(packet, timestamp)
 
-            # Check if this is a DM to us (channel 0, to=my_node_id, from someone else)
-            if channel == 0 and to_id == self.state.my_node_id and from_id != self.state.my_node_id:
-                # This is an incoming DM
-                self._handle_incoming_dm(packet, from_id, decoded)
-
-        if portnum in ('ROUTING_APP', '65'):
+        if incoming_dm:
+            self._handle_incoming_dm(packet, from_id, decoded)
+        elif tag == _PORT_ROUTING:
             request_id = decoded.get('requestId')
             if request_id:
                 routing = decoded.get('routing', {})
                 error = routing.get('errorReason', '')
                 success = (error == '' or error == 'NONE')
-                self.state.messages.resolve_pending(
+                messages.resolve_pending(
                     request_id,
                     success,
                     error_reason=error if not success else None
                 )
 
         # Update node store based on packet type
-        from_id = packet.get('from', packet.get('fromId'))
-        if from_id:
+        if raw_from:
             node_update = {}
 
             # Extract SNR/RSSI/Hops
@@ -122,58 +231,56 @@ class MeshtasticConnection:
             if hop_start is not None and hop_limit is not None:
                 node_update['hops'] = hop_start - hop_limit
 
-            # Extract data from decoded payload
-            decoded = packet.get('decoded', {})
-            portnum = str(decoded.get('portnum', ''))
-
-            if portnum in ('NODEINFO_APP', '4'):
+            if tag == _PORT_NODEINFO:
                 user = decoded.get('user', {})
                 if user:
                     node_update['user'] = user
 
-            elif portnum in ('POSITION_APP', '3'):
+            elif tag == _PORT_POSITION:
                 position = decoded.get('position', {})
                 if position:
                     node_update['position'] = position
                     # Update my_position if this is from our node
-                    if format_node_id(from_id) == self.state.my_node_id:
-                        lat = position.get('latitude', position.get('latitudeI', 0))
-                        lon = position.get('longitude', position.get('longitudeI', 0))
-                        if isinstance(lat, int) and abs(lat) > 1000:
-                            lat = lat / 1e7
-                            lon = lon / 1e7
-                        if lat and lon:
-                            self.state.set_my_position(lat, lon)
-
-            elif portnum in ('TELEMETRY_APP', '67'):
+                    if raw_from == state.my_node_num:
+                        latlon = scale_latlon(position)
+                        if latlon:
+                            state.set_my_position(*latlon)
+
+            elif tag == _PORT_TELEMETRY:
                 telemetry = decoded.get('telemetry', {})
                 device = telemetry.get('deviceMetrics', {})
                 if device:
                     node_update['deviceMetrics'] = device
 
             if node_update:
-                self.state.nodes.update_node(from_id, node_update)
+                state.nodes.update_node(raw_from, node_update, timestamp)
 
-    def _handle_reaction(self, packet: dict, match: re.Match, from_id: str, timestamp: float):
+    def _handle_reaction(self, packet: dict, target_packet_id: int, emoji: str,
+                         from_id: str, timestamp: float):
         """Handle a reaction message: store reaction and notify UI."""
-        target_packet_id = int(match.group(1))
-        emoji = match.group(2)
 
         # Validate emoji is supported
         if emoji not in SUPPORTED_REACTIONS:
             return  # Ignore unsupported reactions
 
         # Find the target message in storage
-        if not self.state.storage:
+        storage = self.state.storage
+        if not storage:
             return
 
-        target_message = self.state.storage.find_message_by_packet_id(target_packet_id)
-        if not target_message:
+        target_db_id = storage.find_db_id_by_packet_id(target_packet_id)
+        if target_db_id is None:
+            # The target may still be queued for writing
+            worker = self.state.storage_worker
+            if worker:
+                worker.flush()
+            target_db_id = storage.find_db_id_by_packet_id(target_packet_id)
+        if target_db_id is None:
             return  # Target message not found
 
         # Store the reaction (handles toggle logic internally)
-        added = self.state.storage.store_reaction(
-            message_db_id=target_message.id,
+        added = storage.store_reaction(
+            message_db_id=target_db_id,
             message_packet_id=target_packet_id,
             reactor_node=from_id,
             emoji=emoji,
@@ -182,7 +289,7 @@ class MeshtasticConnection:
 
         # Notify UI to refresh reactions display
         self.state.messages.notify("reaction_updated", {
-            'message_db_id': target_message.id,
+            'message_db_id': target_db_id,
             'message_packet_id': target_packet_id,
             'emoji': emoji,
             'reactor_node': from_id,
@@ -194,8 +301,7 @@ class MeshtasticConnection:
         # Get sender name from node store
         node = self.state.nodes.get_node(from_id)
         if node:
-            user = node.get('user', {})
-            sender_name = user.get('shortName') or user.get('longName') or from_id
+            sender_name = node_display_name(node, from_id)
         else:
             sender_name = from_id
 
@@ -220,10 +326,13 @@ class MeshtasticConnection:
     def _on_connected(self, interface, topic=None):
         """Handle connection established."""
         info = {}
+        self._config_snapshot = None
 
         try:
-            if interface.myInfo:
-                info['my_node_id'] = format_node_id(interface.myInfo.my_node_num)
+            my_node_num = interface.myInfo.my_node_num if interface.myInfo else None
+            if my_node_num is not None:
+                info['my_node_num'] = my_node_num
+                info['my_node_id'] = format_node_id(my_node_num)
 
             if interface.localNode and interface.localNode.localConfig:
                 config = interface.localNode.localConfig
@@ -242,17 +351,11 @@ class MeshtasticConnection:
                 self.state.nodes.import_nodes(interface.nodes)
 
                 # Try to get my node's position
-                my_node_num = interface.myInfo.my_node_num if interface.myInfo else None
                 if my_node_num and my_node_num in interface.nodes:
                     my_node = interface.nodes[my_node_num]
-                    pos = my_node.get('position', {})
-                    lat = pos.get('latitude', pos.get('latitudeI', 0))
-                    lon = pos.get('longitude', pos.get('longitudeI', 0))
-                    if isinstance(lat, int) and abs(lat) > 1000:
-                        lat = lat / 1e7
-                        lon = lon / 1e7
-                    if lat and lon:
-                        self.state.set_my_position(lat, lon)
+                    latlon = scale_latlon(my_node.get('position', {}))
+                    if latlon:
+                        self.state.set_my_position(*latlon)
 
         except Exception:
             pass
@@ -269,29 +372,69 @@ class MeshtasticConnection:
         if self._on_status_change:
             self._on_status_change("disconnected", None)
 
+    def _on_node_updated(self, node, interface=None):
+        """Drop the config snapshot when the device reports on our own node."""
+        if node and node.get('num') == self.state.my_node_num:
+            self._config_snapshot = None
+
     @staticmethod
     def find_ports() -> list:
         """Find available serial ports."""
-        candidates = sorted(glob.glob('/dev/ttyACM*')) + sorted(glob.glob('/dev/ttyUSB*'))
-        return candidates
+        # One pass over /dev; ACM (native USB) ports are listed before USB-serial
+        acm, usb = [], []
+        try:
+            with os.scandir('/dev') as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('ttyACM'):
+                        acm.append('/dev/' + name)
+                    elif name.startswith('ttyUSB'):
+                        usb.append('/dev/' + name)
+        except OSError:
+            return []
+        acm.sort()
+        usb.sort()
+        return acm + usb
 
     @staticmethod
-    def auto_detect_port() -> Optional[str]:
-        """Auto-detect a Meshtastic device port."""
+    def _probe_port(candidate: str) -> str:
+        """Quick test connection; returns the port or raises."""
         from meshtastic.serial_interface import SerialInterface
 
+        interface = SerialInterface(candidate, noProto=True)
+        interface.close()
+        return candidate
+
+    @staticmethod
+    def auto_detect_port(parallel: bool = True) -> Optional[str]:
+        """Auto-detect a Meshtastic device port.
+
+        Args:
+            parallel: Probe all candidates at once and take the first that
+                answers. Pass False to probe one at a time, in port order.
+        """
         candidates = MeshtasticConnection.find_ports()
+        if not candidates:
+            return None
 
-        for candidate in candidates:
-            try:
-                # Quick test connection
-                interface = SerialInterface(candidate, noProto=True)
-                interface.close()
-                return candidate
-            except Exception:
-                continue
+        if not parallel or len(candidates) == 1:
+            for candidate in candidates:
+                try:
+                    return MeshtasticConnection._probe_port(candidate)
+                except Exception:
+                    continue
+            return None
 
-        return None
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="meshterm-probe")
+        try:
+            futures = [executor.submit(MeshtasticConnection._probe_port, c) for c in candidates]
+            for future in as_completed(futures):
+                if future.exception() is None:
+                    return future.result()
+            return None
+        finally:
+            # Don't wait on slower probes; they close their own interface
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def connect(self, port: Optional[str] = None) -> bool:
         """Connect to Meshtastic device."""
@@ -327,10 +470,12 @@ class MeshtasticConnection:
 
     def cleanup(self):
         """Cleanup resources."""
-        pub.unsubscribe(self._on_receive, "meshtastic.receive")
-        pub.unsubscribe(self._on_connected, "meshtastic.connection.established")
-        pub.unsubscribe(self._on_disconnected, "meshtastic.connection.lost")
+        _TOPIC_RECEIVE.unsubscribe(self._on_receive)
+        _TOPIC_CONNECTED.unsubscribe(self._on_connected)
+        _TOPIC_DISCONNECTED.unsubscribe(self._on_disconnected)
+        _TOPIC_NODE_UPDATED.unsubscribe(self._on_node_updated)
         self.disconnect()
+        self.state.stop_storage_worker()
 
     def send_message(self, text: str, dest: Union[int, str] = "^all", channel: int = 0) -> Tuple[bool, Optional[int]]:
         """Send a text message.
@@ -387,6 +532,48 @@ class MeshtasticConnection:
         reply_text = f"[>:{parent_packet_id}] {text}"
         return self.send_message(reply_text, dest, channel)
 
+    def _snapshot_node_config(self, node) -> dict:
+        """Read config sections and channels from the node in one pass.
+
+        The snapshot is shared by get_local_config, export_config and
+        get_shareable_channels, and kept while the node's config objects are
+        unchanged, until the next config write, reconnect or update to the
+        local node. Channel PSKs are left as raw bytes.
+        """
+        cached = self._config_snapshot
+        if (cached is not None and cached[0] is node
+                and cached[1] is node.localConfig and cached[2] is node.moduleConfig):
+            return cached[3]
+
+        snapshot = {}
+        for config, spec in ((node.localConfig, _LOCAL_CONFIG_SPEC),
+                             (node.moduleConfig, _MODULE_CONFIG_SPEC)):
+            if not config:
+                continue
+            for section, fields in spec:
+                values = getattr(config, section, None)
+                if values is not None:
+                    snapshot[section] = {name: getattr(values, name) for name in fields}
+
+        channels = []
+        if node.channels:
+            for ch in node.channels:
+                ch_info = {
+                    'index': ch.index,
+                    'role': ch.role,
+                }
+                if hasattr(ch, 'settings') and ch.settings:
+                    settings = ch.settings
+                    ch_info['name'] = settings.name or ''
+                    ch_info['psk'] = settings.psk
+                    ch_info['uplink_enabled'] = settings.uplink_enabled
+                    ch_info['downlink_enabled'] = settings.downlink_enabled
+                channels.append(ch_info)
+        snapshot['channels'] = channels
+
+        self._config_snapshot = (node, node.localConfig, node.moduleConfig, snapshot)
+        return snapshot
+
     def get_local_config(self) -> Optional[dict]:
         """Get local configuration from device.
 
@@ -397,44 +584,12 @@ class MeshtasticConnection:
             return None
 
         try:
-            node = self.interface.localNode
-            config = {}
-
-            # LoRa config
-            if node.localConfig and hasattr(node.localConfig, 'lora'):
-                lora = node.localConfig.lora
-                config['lora'] = {
-                    'region': lora.region,
-                    'modem_preset': lora.modem_preset,
-                    'tx_power': lora.tx_power,
-                    'hop_limit': lora.hop_limit,
-                    'tx_enabled': lora.tx_enabled,
-                }
-
-            # Position config
-            if node.localConfig and hasattr(node.localConfig, 'position'):
-                pos = node.localConfig.position
-                config['position'] = {
-                    'gps_mode': pos.gps_mode,
-                    'position_broadcast_secs': pos.position_broadcast_secs,
-                    'fixed_position': pos.fixed_position,
-                }
-
-            # Device config
-            if node.localConfig and hasattr(node.localConfig, 'device'):
-                dev = node.localConfig.device
-                config['device'] = {
-                    'role': dev.role,
-                    'rebroadcast_mode': dev.rebroadcast_mode,
-                    'node_info_broadcast_secs': dev.node_info_broadcast_secs,
-                }
-
-            # Telemetry module config
-            if node.moduleConfig and hasattr(node.moduleConfig, 'telemetry'):
-                telem = node.moduleConfig.telemetry
-                config['telemetry'] = {
-                    'device_update_interval': telem.device_update_interval,
-                }
+            snapshot = self._snapshot_node_config(self.interface.localNode)
+            config = {
+                section: dict(snapshot[section])
+                for section in ('lora', 'position', 'device', 'telemetry')
+                if section in snapshot
+            }
 
             # User/owner info (short name, long name)
             if self.state.my_node_id:
@@ -448,18 +603,11 @@ class MeshtasticConnection:
 
             # Channels
             config['channels'] = []
-            if node.channels:
-                for ch in node.channels:
-                    ch_info = {
-                        'index': ch.index,
-                        'role': ch.role,
-                    }
-                    if hasattr(ch, 'settings') and ch.settings:
-                        ch_info['name'] = ch.settings.name or ''
-                        ch_info['psk'] = ch.settings.psk.hex() if ch.settings.psk else ''
-                        ch_info['uplink_enabled'] = ch.settings.uplink_enabled
-                        ch_info['downlink_enabled'] = ch.settings.downlink_enabled
-                    config['channels'].append(ch_info)
+            for ch in snapshot['channels']:
+                ch_info = dict(ch)
+                if 'psk' in ch_info:
+                    ch_info['psk'] = ch_info['psk'].hex() if ch_info['psk'] else ''
+                config['channels'].append(ch_info)
 
             return config
 
@@ -480,20 +628,20 @@ class MeshtasticConnection:
         if not reboot_fields:
             return False
 
-        # Check if any reboot-causing fields are being changed
-        current_config = self.get_local_config()
-        if not current_config:
-            # Can't compare, assume reboot to be safe
-            return bool(reboot_fields & set(values.keys()))
+        changing = reboot_fields & values.keys()
+        if not changing:
+            return False
 
-        current_section = current_config.get(config_type, {})
+        node = self.interface.localNode if self.interface else None
+        if not node:
+            # Can't compare, assume reboot to be safe
+            return True
 
-        for field in reboot_fields:
-            if field in values:
-                current_val = current_section.get(field)
-                new_val = values[field]
-                if current_val != new_val:
-                    return True
+        # Read just the fields being changed instead of building the full config
+        section = getattr(node.localConfig, config_type, None) if node.localConfig else None
+        for field in changing:
+            if getattr(section, field, None) != values[field]:
+                return True
 
         return False
 
@@ -510,6 +658,7 @@ class MeshtasticConnection:
         if not self.interface or not self.interface.localNode:
             return False
 
+        self._config_snapshot = None
         try:
             node = self.interface.localNode
 
@@ -549,6 +698,7 @@ class MeshtasticConnection:
         if not self.interface or not self.interface.localNode:
             return False
 
+        self._config_snapshot = None
         try:
             node = self.interface.localNode
 
@@ -599,6 +749,7 @@ class MeshtasticConnection:
         if not self.interface or not self.interface.localNode:
             return False
 
+        self._config_snapshot = None
         try:
             from meshtastic.protobuf import channel_pb2
 
@@ -618,21 +769,7 @@ class MeshtasticConnection:
             if 'psk' in settings:
                 psk = settings['psk']
                 if isinstance(psk, str):
-                    if psk.lower() == 'default':
-                        # Default Meshtastic key (AQ==)
-                        ch.settings.psk = bytes([1])
-                    elif psk.lower() == 'none':
-                        ch.settings.psk = bytes([0])
-                    elif psk.lower() == 'random':
-                        import secrets
-                        ch.settings.psk = secrets.token_bytes(32)
-                    else:
-                        # Try hex decode, then base64
-                        try:
-                            ch.settings.psk = bytes.fromhex(psk)
-                        except ValueError:
-                            import base64
-                            ch.settings.psk = base64.b64decode(psk)
+                    ch.settings.psk = decode_psk(psk)
                 else:
                     ch.settings.psk = psk
             if 'uplink_enabled' in settings:
@@ -660,25 +797,24 @@ class MeshtasticConnection:
 
         try:
             channels = []
-            node = self.interface.localNode
-            if node.channels:
-                for ch in node.channels:
-                    # Skip disabled channels (role == 0)
-                    if ch.role == 0:
-                        continue
-                    # Only include channels with PSK
-                    if hasattr(ch, 'settings') and ch.settings and ch.settings.psk:
-                        psk_hex = ch.settings.psk.hex()
-                        # Skip empty/default PSK (01 = default unencrypted)
-                        if psk_hex and psk_hex != '00':
-                            channels.append({
-                                'index': ch.index,
-                                'name': ch.settings.name or '',
-                                'role': ch.role,
-                                'psk': psk_hex,
-                                'uplink_enabled': ch.settings.uplink_enabled,
-                                'downlink_enabled': ch.settings.downlink_enabled,
-                            })
+            snapshot = self._snapshot_node_config(self.interface.localNode)
+            for ch in snapshot['channels']:
+                # Skip disabled channels (role == 0)
+                if ch['role'] == 0:
+                    continue
+                # Only include channels with a PSK; skip the 00 "no key" marker
+                # before paying for hex encoding
+                psk = ch.get('psk')
+                if not psk or psk == _NO_PSK:
+                    continue
+                channels.append({
+                    'index': ch['index'],
+                    'name': ch['name'],
+                    'role': ch['role'],
+                    'psk': psk.hex(),
+                    'uplink_enabled': ch['uplink_enabled'],
+                    'downlink_enabled': ch['downlink_enabled'],
+                })
             return channels
 
         except Exception:
@@ -801,38 +937,12 @@ class MeshtasticConnection:
             return False, {}, "Not connected to device"
 
         try:
-            import base64
-            node = self.interface.localNode
-            config = {}
-
-            # LoRa config
-            if node.localConfig and hasattr(node.localConfig, 'lora'):
-                lora = node.localConfig.lora
-                config['lora'] = {
-                    'region': lora.region,
-                    'modem_preset': lora.modem_preset,
-                    'tx_power': lora.tx_power,
-                    'hop_limit': lora.hop_limit,
-                    'tx_enabled': lora.tx_enabled,
-                }
-
-            # Position config
-            if node.localConfig and hasattr(node.localConfig, 'position'):
-                pos = node.localConfig.position
-                config['position'] = {
-                    'gps_mode': pos.gps_mode,
-                    'position_broadcast_secs': pos.position_broadcast_secs,
-                    'fixed_position': pos.fixed_position,
-                }
-
-            # Device config
-            if node.localConfig and hasattr(node.localConfig, 'device'):
-                dev = node.localConfig.device
-                config['device'] = {
-                    'role': dev.role,
-                    'rebroadcast_mode': dev.rebroadcast_mode,
-                    'node_info_broadcast_secs': dev.node_info_broadcast_secs,
-                }
+            snapshot = self._snapshot_node_config(self.interface.localNode)
+            config = {
+                section: dict(snapshot[section])
+                for section in ('lora', 'position', 'device')
+                if section in snapshot
+            }
 
             # Owner info
             if self.interface.myInfo:
@@ -847,19 +957,18 @@ class MeshtasticConnection:
 
             # Channels (with PSK as base64 for portability)
             config['channels'] = []
-            if node.channels:
-                for ch in node.channels:
-                    ch_info = {
-                        'index': ch.index,
-                        'role': ch.role,
-                    }
-                    if hasattr(ch, 'settings') and ch.settings:
-                        ch_info['name'] = ch.settings.name or ''
-                        if ch.settings.psk:
-                            ch_info['psk_b64'] = base64.b64encode(ch.settings.psk).decode('ascii')
-                        ch_info['uplink_enabled'] = ch.settings.uplink_enabled
-                        ch_info['downlink_enabled'] = ch.settings.downlink_enabled
-                    config['channels'].append(ch_info)
+            for ch in snapshot['channels']:
+                ch_info = {
+                    'index': ch['index'],
+                    'role': ch['role'],
+                }
+                if 'name' in ch:
+                    ch_info['name'] = ch['name']
+                    if ch['psk']:
+                        ch_info['psk_b64'] = _b64.b64encode(ch['psk']).decode('ascii')
+                    ch_info['uplink_enabled'] = ch['uplink_enabled']
+                    ch_info['downlink_enabled'] = ch['downlink_enabled']
+                config['channels'].append(ch_info)
 
             return True, config, "Config exported successfully"
 
@@ -878,7 +987,6 @@ class MeshtasticConnection:
         if not self.interface or not self.interface.localNode:
             return False, [], "Not connected to device"
 
-        import base64
         errors = []
 
         try:
@@ -925,9 +1033,11 @@ class MeshtasticConnection:
                             'uplink_enabled': ch_config.get('uplink_enabled', False),
                             'downlink_enabled': ch_config.get('downlink_enabled', False),
                         }
-                        # Decode PSK from base64
+                        # Decode PSK from base64, or hex as written by other tools
                         if 'psk_b64' in ch_config:
-                            ch_settings['psk'] = base64.b64decode(ch_config['psk_b64'])
+                            ch_settings['psk'] = _b64.b64decode(ch_config['psk_b64'])
+                        elif 'psk_hex' in ch_config:
+                            ch_settings['psk'] = bytes.fromhex(ch_config['psk_hex'])
                         self.write_channel(ch_config['index'], ch_settings)
                     except Exception as e:
                         errors.append(f"Channel {ch_config.get('index', '?')}: {e}")
@@ -1,9 +1,11 @@
 """Display formatting - colors, emoji, packet formatting."""
 
-from datetime import datetime
-from math import radians, sin, cos, sqrt, atan2
-from typing import Optional, Tuple
-from rich.text import Text
+import time
+from functools import cache, lru_cache
+from math import radians, sin, cos, sqrt, atan2, isnan
+from typing import Dict, List, Optional, Tuple
+from rich.control import strip_control_codes
+from rich.text import Span, Text
 
 
 class Colors:
@@ -68,48 +70,104 @@ PORTNUM_MAP = {
 
 def get_portnum_name(portnum):
     """Get human-readable name and color for port number."""
-    result = PORTNUM_MAP.get(portnum)
-    if result:
-        return result
+    return PORTNUM_MAP.get(portnum) or _unknown_portnum_name(portnum)
+
+
+@lru_cache(maxsize=128)
+def _unknown_portnum_name(portnum):
+    """Name and color for a portnum missing from PORTNUM_MAP."""
     if isinstance(portnum, str):
         return (portnum.replace('_APP', '')[:10], Colors.UNKNOWN)
     return (f"PORT:{portnum}", Colors.UNKNOWN)
 
 
+@lru_cache(maxsize=256)
+def _portnum_label(portnum):
+    """Centered [NAME] label and its bold style, as shown in the packet log."""
+    portname, color = get_portnum_name(portnum)
+    return (f"[{portname:^10}]", f"{color} bold")
+
+
+# Formatted IDs by node number; a mesh has a bounded set of nodes, so
+# this stops growing once full rather than evicting
+_NODE_ID_CACHE: Dict[int, str] = {}
+_NODE_ID_CACHE_SIZE = 4096
+
+
 def format_node_id(node_id):
     """Format node ID consistently."""
     if isinstance(node_id, int):
-        return f"!{node_id:08x}"
+        formatted = _NODE_ID_CACHE.get(node_id)
+        if formatted is None:
+            formatted = f"!{node_id:08x}"
+            if len(_NODE_ID_CACHE) < _NODE_ID_CACHE_SIZE:
+                _NODE_ID_CACHE[node_id] = formatted
+        return formatted
+    if isinstance(node_id, str):
+        return node_id
     return str(node_id)
 
 
+# Broadcast destination as it appears in packets (toId string or raw number)
+_BROADCAST_IDS = frozenset({'^all', '!ffffffff', 0xffffffff})
+
+
+def node_display_name(node: dict, fallback):
+    """Short name (or long name) of a node dict, or fallback if it has neither."""
+    user = node.get('user')
+    return (user.get('shortName') or user.get('longName') or fallback) if user else fallback
+
+
+def resolve_display_name(node_store, node_id) -> str:
+    """Short name (or long name) of a node, falling back to its formatted ID."""
+    node = node_store.get_node(node_id) if node_store is not None else None
+    fallback = format_node_id(node_id)
+    return node_display_name(node, fallback) if node else fallback
+
+
+@lru_cache(maxsize=256)
+def _clock_time(seconds: int) -> str:
+    """Local HH:MM:SS for a whole-second timestamp; packets cluster in time."""
+    return time.strftime('%H:%M:%S', time.localtime(seconds))
+
+
+def _assemble(pieces) -> Text:
+    """Build a Text from (segment, style) pairs in one pass.
+
+    Equivalent to appending each piece in turn, but the plain string and
+    span list are built up front instead of growing the Text per call.
+    """
+    parts = []
+    spans = []
+    offset = 0
+    for segment, style in pieces:
+        segment = strip_control_codes(segment)
+        if not segment:
+            continue
+        end = offset + len(segment)
+        parts.append(segment)
+        if style:
+            spans.append(Span(offset, end, style))
+        offset = end
+    return Text("".join(parts), spans=spans)
+
+
 def format_packet(packet, node_store=None) -> Text:
     """Format a packet for log display. Returns Rich Text object."""
-    text = Text()
-
     # Use packet's rxTime if available, otherwise fall back to now
     rx_time = packet.get('rxTime')
-    if rx_time:
-        timestamp = datetime.fromtimestamp(rx_time).strftime('%H:%M:%S')
-    else:
-        timestamp = datetime.now().strftime('%H:%M:%S')
+    timestamp = _clock_time(int(rx_time or time.time()))
 
     from_id = packet.get('fromId', packet.get('from', '?'))
     to_id = packet.get('toId', packet.get('to', '?'))
 
-    # Get node names from store if available
-    from_name = format_node_id(packet.get('from', from_id))
-    to_name = format_node_id(packet.get('to', to_id))
-
+    # Get node names from store if available (memoized per node there)
     if node_store:
-        from_node = node_store.get_node(packet.get('from', from_id))
-        to_node = node_store.get_node(packet.get('to', to_id))
-        if from_node:
-            user = from_node.get('user', {})
-            from_name = user.get('shortName') or user.get('longName') or from_name
-        if to_node:
-            user = to_node.get('user', {})
-            to_name = user.get('shortName') or user.get('longName') or to_name
+        from_name = node_store.display_name(packet.get('from', from_id))
+        to_name = node_store.display_name(packet.get('to', to_id))
+    else:
+        from_name = format_node_id(packet.get('from', from_id))
+        to_name = format_node_id(packet.get('to', to_id))
 
     # Get signal info
     snr = packet.get('rxSnr', None)
@@ -120,22 +178,24 @@ def format_packet(packet, node_store=None) -> Text:
     # Determine message type
     decoded = packet.get('decoded', {})
     portnum = decoded.get('portnum', 0)
-    portname, color = get_portnum_name(portnum)
+    label, label_style = _portnum_label(portnum)
 
-    # Build the line
-    text.append(f"[{timestamp}]", style=Colors.TIMESTAMP)
-    text.append(" ")
-    text.append(f"[{portname:^10}]", style=f"{color} bold")
-    text.append(" ")
-    text.append(from_name, style=Colors.FROM_NODE)
-    text.append(" -> ", style=Colors.DIM)
+    to_display = "all" if to_id in _BROADCAST_IDS else to_name
 
-    to_display = "all" if to_id == "^all" or to_id == 4294967295 or str(to_id) == "!ffffffff" else to_name
-    text.append(to_display, style=Colors.FROM_NODE)
+    # Build the line
+    pieces = [
+        (f"[{timestamp}]", Colors.TIMESTAMP),
+        (" ", None),
+        (label, label_style),
+        (" ", None),
+        (from_name, Colors.FROM_NODE),
+        (" -> ", Colors.DIM),
+        (to_display, Colors.FROM_NODE),
+    ]
 
     # Signal info
     if snr is not None or rssi is not None or (hop_limit is not None and hop_start is not None):
-        text.append(" (", style=Colors.DIM)
+        pieces.append((" (", Colors.DIM))
         parts = []
         if snr is not None:
             parts.append((f"SNR:{snr:.1f}", Colors.SNR))
@@ -144,115 +204,140 @@ def format_packet(packet, node_store=None) -> Text:
         if hop_limit is not None and hop_start is not None:
             hops = hop_start - hop_limit
             parts.append((f"hops:{hops}", Colors.DIM))
-        for i, (part, style) in enumerate(parts):
+        for i, part in enumerate(parts):
             if i > 0:
-                text.append(" ", style=Colors.DIM)
-            text.append(part, style=style)
-        text.append(")", style=Colors.DIM)
+                pieces.append((" ", Colors.DIM))
+            pieces.append(part)
+        pieces.append((")", Colors.DIM))
 
-    return text
+    return _assemble(pieces)
 
 
-def format_payload(packet, node_store=None) -> Text:
-    """Format payload details for a packet. Returns Rich Text object."""
-    text = Text()
-    indent = "           "  # 11 spaces to align with [HH:MM:SS]
+_PAYLOAD_INDENT = "           "  # 11 spaces to align with [HH:MM:SS]
 
-    decoded = packet.get('decoded', {})
-    portnum = decoded.get('portnum', 0)
-    _, color = get_portnum_name(portnum)
-    portnum_str = str(portnum)
-
-    if portnum_str in ('TEXT_MESSAGE_APP', '1'):
-        msg = decoded.get('text', '')
-        if msg:
-            text.append(f"{indent}", style=Colors.DIM)
-            text.append(f"[message] {msg}", style=color)
-
-    elif portnum_str in ('POSITION_APP', '3'):
-        pos = decoded.get('position', {})
-        lat = pos.get('latitude', pos.get('latitudeI', 0))
-        lon = pos.get('longitude', pos.get('longitudeI', 0))
+
+def _payload_text(text: Text, decoded: dict, color: str):
+    msg = decoded.get('text', '')
+    if msg:
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        text.append(f"[message] {msg}", style=color)
+
+
+def _payload_position(text: Text, decoded: dict, color: str):
+    pos = decoded.get('position', {})
+    latlon = scale_latlon(pos)
+    if latlon:
+        lat, lon = latlon
         alt = pos.get('altitude', None)
         speed = pos.get('groundSpeed', None)
         sats = pos.get('satsInView', None)
-        if isinstance(lat, int) and abs(lat) > 1000:
-            lat = lat / 1e7
-            lon = lon / 1e7
-        if lat and lon:
-            text.append(f"{indent}", style=Colors.DIM)
-            parts = [f"[position] {lat:.6f}, {lon:.6f}"]
-            if alt:
-                parts.append(f"alt:{alt}m")
-            if speed:
-                parts.append(f"spd:{speed}m/s")
-            if sats:
-                parts.append(f"sats:{sats}")
-            text.append(' '.join(parts), style=color)
-
-    elif portnum_str in ('TELEMETRY_APP', '67'):
-        telem = decoded.get('telemetry', {})
-        device = telem.get('deviceMetrics', {})
-        env = telem.get('environmentMetrics', {})
-        power = telem.get('powerMetrics', {})
-        parts = []
-        if device:
-            if 'batteryLevel' in device:
-                parts.append(f"bat:{device['batteryLevel']}%")
-            if 'voltage' in device:
-                parts.append(f"v:{device['voltage']:.2f}V")
-            if 'channelUtilization' in device:
-                parts.append(f"ch:{device['channelUtilization']:.1f}%")
-            if 'airUtilTx' in device:
-                parts.append(f"tx:{device['airUtilTx']:.1f}%")
-            if 'uptimeSeconds' in device:
-                uptime = device['uptimeSeconds']
-                hrs = uptime // 3600
-                mins = (uptime % 3600) // 60
-                parts.append(f"up:{hrs}h{mins}m")
-        if env:
-            if 'temperature' in env:
-                parts.append(f"temp:{env['temperature']:.1f}C")
-            if 'relativeHumidity' in env:
-                parts.append(f"hum:{env['relativeHumidity']:.0f}%")
-            if 'barometricPressure' in env:
-                parts.append(f"pres:{env['barometricPressure']:.1f}hPa")
-        if power:
-            if 'ch1Voltage' in power:
-                parts.append(f"ch1:{power['ch1Voltage']:.2f}V")
-        if parts:
-            text.append(f"{indent}", style=Colors.DIM)
-            text.append(f"[telemetry] {' '.join(parts)}", style=color)
-
-    elif portnum_str in ('NODEINFO_APP', '4'):
-        user = decoded.get('user', {})
-        long_name = user.get('longName', '')
-        short_name = user.get('shortName', '')
-        hw_model = user.get('hwModel', '')
-        if long_name or short_name:
-            text.append(f"{indent}", style=Colors.DIM)
-            text.append(f"[nodeinfo] {long_name} ({short_name}) [{hw_model}]", style=color)
-
-    elif portnum_str in ('ROUTING_APP', '65'):
-        routing = decoded.get('routing', {})
-        error = routing.get('errorReason', '')
-        if error and error != 'NONE':
-            text.append(f"{indent}", style=Colors.DIM)
-            text.append(f"[error] {error}", style=color)
-        else:
-            ack = decoded.get('requestId', None)
-            if ack:
-                text.append(f"{indent}", style=Colors.DIM)
-                text.append(f"[ack] request {ack}", style=color)
-
-    elif portnum_str in ('NEIGHBORINFO_APP', '71'):
-        neighbor = decoded.get('neighborinfo', {})
-        neighbors = neighbor.get('neighbors', [])
-        if neighbors:
-            neighbor_list = ', '.join([format_node_id(n.get('nodeId', 0)) for n in neighbors[:5]])
-            text.append(f"{indent}", style=Colors.DIM)
-            text.append(f"[neighbors] {len(neighbors)}: {neighbor_list}", style=color)
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        parts = [f"[position] {lat:.6f}, {lon:.6f}"]
+        if alt:
+            parts.append(f"alt:{alt}m")
+        if speed:
+            parts.append(f"spd:{speed}m/s")
+        if sats:
+            parts.append(f"sats:{sats}")
+        text.append(' '.join(parts), style=color)
+
+
+# Telemetry metrics shown in the log, as (field, formatter) in display order
+_DEVICE_FIELDS = (
+    ('batteryLevel', "bat:{}%".format),
+    ('voltage', "v:{:.2f}V".format),
+    ('channelUtilization', "ch:{:.1f}%".format),
+    ('airUtilTx', "tx:{:.1f}%".format),
+)
+_ENV_FIELDS = (
+    ('temperature', "temp:{:.1f}C".format),
+    ('relativeHumidity', "hum:{:.0f}%".format),
+    ('barometricPressure', "pres:{:.1f}hPa".format),
+)
+_POWER_FIELDS = (
+    ('ch1Voltage', "ch1:{:.2f}V".format),
+)
+
+
+def _payload_telemetry(text: Text, decoded: dict, color: str):
+    telem = decoded.get('telemetry', {})
+    device = telem.get('deviceMetrics', {})
+    env = telem.get('environmentMetrics', {})
+    power = telem.get('powerMetrics', {})
+    parts = []
+    if device:
+        parts.extend(fmt(device[key]) for key, fmt in _DEVICE_FIELDS if key in device)
+        if 'uptimeSeconds' in device:
+            uptime = device['uptimeSeconds']
+            hrs = uptime // 3600
+            mins = (uptime % 3600) // 60
+            parts.append(f"up:{hrs}h{mins}m")
+    if env:
+        parts.extend(fmt(env[key]) for key, fmt in _ENV_FIELDS if key in env)
+    if power:
+        parts.extend(fmt(power[key]) for key, fmt in _POWER_FIELDS if key in power)
+    if parts:
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        text.append(f"[telemetry] {' '.join(parts)}", style=color)
+
+
+def _payload_nodeinfo(text: Text, decoded: dict, color: str):
+    user = decoded.get('user', {})
+    long_name = user.get('longName', '')
+    short_name = user.get('shortName', '')
+    hw_model = user.get('hwModel', '')
+    if long_name or short_name:
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        text.append(f"[nodeinfo] {long_name} ({short_name}) [{hw_model}]", style=color)
+
+
+def _payload_routing(text: Text, decoded: dict, color: str):
+    routing = decoded.get('routing', {})
+    error = routing.get('errorReason', '')
+    if error and error != 'NONE':
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        text.append(f"[error] {error}", style=color)
+    else:
+        ack = decoded.get('requestId', None)
+        if ack:
+            text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+            text.append(f"[ack] request {ack}", style=color)
+
+
+def _payload_neighborinfo(text: Text, decoded: dict, color: str):
+    neighbor = decoded.get('neighborinfo', {})
+    neighbors = neighbor.get('neighbors', [])
+    if neighbors:
+        neighbor_list = ', '.join([format_node_id(n.get('nodeId', 0)) for n in neighbors[:5]])
+        text.append(_PAYLOAD_INDENT, style=Colors.DIM)
+        text.append(f"[neighbors] {len(neighbors)}: {neighbor_list}", style=color)
+
+
+# (formatter, color) by portnum name, number and number string
+_PAYLOAD_FORMATTERS = {
+    key: (formatter, get_portnum_name(key)[1])
+    for name, num, formatter in (
+        ('TEXT_MESSAGE_APP', 1, _payload_text),
+        ('POSITION_APP', 3, _payload_position),
+        ('TELEMETRY_APP', 67, _payload_telemetry),
+        ('NODEINFO_APP', 4, _payload_nodeinfo),
+        ('ROUTING_APP', 65, _payload_routing),
+        ('NEIGHBORINFO_APP', 71, _payload_neighborinfo),
+    )
+    for key in (name, num, str(num))
+}
+
+
+def format_payload(packet, node_store=None) -> Text:
+    """Format payload details for a packet. Returns Rich Text object."""
+    decoded = packet.get('decoded', {})
+    entry = _PAYLOAD_FORMATTERS.get(decoded.get('portnum', 0))
+    if entry is None:
+        return Text()
 
+    text = Text()
+    formatter, color = entry
+    formatter(text, decoded, color)
     return text
 
 
@@ -272,7 +357,7 @@ def format_verbose(packet) -> Text:
     if hop_limit is not None:
         info_parts.append(f"hopLim:{hop_limit}")
     if 'rxTime' in packet:
-        info_parts.append(f"rx:{datetime.fromtimestamp(packet['rxTime']).strftime('%H:%M:%S')}")
+        info_parts.append(f"rx:{_clock_time(int(packet['rxTime']))}")
     if decoded.get('requestId'):
         info_parts.append(f"reqId:{decoded['requestId']}")
 
@@ -284,60 +369,77 @@ def format_verbose(packet) -> Text:
 
 def pretty_print_json(obj, indent=0) -> Text:
     """Pretty print an object with colored JSON. Returns Rich Text object."""
-    text = Text()
-
-    def print_value(val, ind):
-        spacing = "  " * ind
-        if isinstance(val, dict):
+    parts = []
+    spans = []
+    offset = 0
+
+    def emit(segment, style):
+        nonlocal offset
+        # Text() would strip these itself and shift every later span
+        segment = strip_control_codes(segment)
+        end = offset + len(segment)
+        parts.append(segment)
+        spans.append(Span(offset, end, style))
+        offset = end
+
+    # Explicit stack instead of recursion. Entries are (value, ind, None) for
+    # values still to render, or (segment, None, style) for literal output;
+    # containers push their pieces in reverse so they pop in order.
+    stack = [(obj, indent, None)]
+    while stack:
+        val, ind, style = stack.pop()
+        if style is not None:
+            if val:
+                emit(val, style)
+        elif isinstance(val, dict):
             if not val:
-                text.append("{}", style=JsonColors.BRACE)
-            else:
-                text.append("{\n", style=JsonColors.BRACE)
-                items = list(val.items())
-                for i, (k, v) in enumerate(items):
-                    text.append(f"{spacing}  ", style="default")
-                    text.append(f'"{k}"', style=JsonColors.KEY)
-                    text.append(": ", style="default")
-                    print_value(v, ind + 1)
-                    if i < len(items) - 1:
-                        text.append(",\n", style="default")
-                    else:
-                        text.append("\n", style="default")
-                text.append(f"{spacing}", style="default")
-                text.append("}", style=JsonColors.BRACE)
+                emit("{}", JsonColors.BRACE)
+                continue
+            spacing = "  " * ind
+            item_spacing = spacing + "  "
+            emit("{\n", JsonColors.BRACE)
+            stack.append(("}", None, JsonColors.BRACE))
+            stack.append((spacing, None, "default"))
+            separator = "\n"
+            for k, v in reversed(list(val.items())):
+                stack.append((separator, None, "default"))
+                stack.append((v, ind + 1, None))
+                stack.append((": ", None, "default"))
+                stack.append((f'"{k}"', None, JsonColors.KEY))
+                stack.append((item_spacing, None, "default"))
+                separator = ",\n"
         elif isinstance(val, list):
             if not val:
-                text.append("[]", style=JsonColors.BRACE)
-            else:
-                text.append("[\n", style=JsonColors.BRACE)
-                for i, item in enumerate(val):
-                    text.append(f"{spacing}  ", style="default")
-                    print_value(item, ind + 1)
-                    if i < len(val) - 1:
-                        text.append(",\n", style="default")
-                    else:
-                        text.append("\n", style="default")
-                text.append(f"{spacing}", style="default")
-                text.append("]", style=JsonColors.BRACE)
+                emit("[]", JsonColors.BRACE)
+                continue
+            spacing = "  " * ind
+            item_spacing = spacing + "  "
+            emit("[\n", JsonColors.BRACE)
+            stack.append(("]", None, JsonColors.BRACE))
+            stack.append((spacing, None, "default"))
+            separator = "\n"
+            for item in reversed(val):
+                stack.append((separator, None, "default"))
+                stack.append((item, ind + 1, None))
+                stack.append((item_spacing, None, "default"))
+                separator = ",\n"
         elif isinstance(val, str):
             display = val if len(val) <= 60 else val[:57] + "..."
-            text.append(f'"{display}"', style=JsonColors.STRING)
+            emit(f'"{display}"', JsonColors.STRING)
         elif isinstance(val, bool):
-            text.append(str(val).lower(), style=JsonColors.BOOL)
+            emit(str(val).lower(), JsonColors.BOOL)
         elif isinstance(val, (int, float)):
-            text.append(str(val), style=JsonColors.NUMBER)
+            emit(str(val), JsonColors.NUMBER)
         elif val is None:
-            text.append("null", style=JsonColors.NULL)
+            emit("null", JsonColors.NULL)
         else:
-            text.append(f'"{val}"', style=JsonColors.STRING)
+            emit(f'"{val}"', JsonColors.STRING)
 
-    print_value(obj, indent)
-    return text
+    return Text("".join(parts), spans=spans)
 
 
 def format_time_ago(timestamp):
     """Format a timestamp as time ago string."""
-    import time
     if not timestamp:
         return "?"
     ago = int(time.time()) - timestamp
@@ -355,15 +457,38 @@ def format_time_ago(timestamp):
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance in km between two lat/lon points using haversine formula."""
     R = 6371  # Earth radius in km
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    # Half-angle sines squared by multiplication; the (1 - cos(x)) / 2 form
+    # would lose precision for nearby nodes
+    half_dlat = sin(radians(lat2 - lat1) * 0.5)
+    half_dlon = sin(radians(lon2 - lon1) * 0.5)
+    a = half_dlat * half_dlat + cos(radians(lat1)) * cos(radians(lat2)) * half_dlon * half_dlon
     c = 2 * atan2(sqrt(a), sqrt(1 - a))
     return R * c
 
 
+def haversine_distance_batch(lat0: float, lon0: float, lats: List[float], lons: List[float]) -> List[float]:
+    """Distances in km from one point to many, in a single vectorized pass.
+
+    Uses NumPy when it is available (pgeocode pulls it in), falling back
+    to haversine_distance per point otherwise.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [haversine_distance(lat0, lon0, lat, lon) for lat, lon in zip(lats, lons)]
+    R = 6371  # Earth radius in km
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    dlat = np.radians(lats - lat0)
+    dlon = np.radians(lons - lon0)
+    a = np.sin(dlat / 2) ** 2 + cos(radians(lat0)) * np.cos(np.radians(lats)) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return (R * c).tolist()
+
+
+@cache
 def _use_imperial() -> bool:
-    """Check if locale uses imperial units (miles)."""
+    """Check if locale uses imperial units (miles). Detected once per process."""
     import locale
     try:
         loc = locale.getlocale()[0] or locale.getdefaultlocale()[0] or ''
@@ -404,19 +529,69 @@ def get_node_position(node: dict) -> Optional[Tuple[float, float]]:
     """Extract normalized lat/lon from a node's position data."""
     if not node:
         return None
-    position = node.get('position', {})
+    return scale_latlon(node.get('position', {}))
+
+
+def get_node_positions(nodes: Dict[str, dict]) -> Tuple[List[str], List[float], List[float]]:
+    """Positions of every node that has one, as parallel (ids, lats, lons) lists.
+
+    Same rules as get_node_position, unrolled into a single pass so the
+    result can go straight to haversine_distance_batch.
+    """
+    node_ids, lats, lons = [], [], []
+    for node_id, node in nodes.items():
+        position = node.get('position') if node else None
+        if not position:
+            continue
+        lat, lon = normalize_latlon(
+            position.get('latitude', position.get('latitudeI', 0)),
+            position.get('longitude', position.get('longitudeI', 0)),
+        )
+        if lat and lon:
+            node_ids.append(node_id)
+            lats.append(lat)
+            lons.append(lon)
+    return node_ids, lats, lons
+
+
+def normalize_latlon(lat, lon) -> Tuple[float, float]:
+    """Convert integer 1e-7 degree coordinates to degrees; floats pass through."""
+    if type(lat) is int and (lat > 1000 or lat < -1000):
+        return lat / 1e7, lon / 1e7
+    return lat, lon
+
+
+def scale_latlon(position: dict) -> Optional[Tuple[float, float]]:
+    """Extract lat/lon in degrees from a position dict.
+
+    Handles both float degrees and the integer 1e-7 degree fields.
+    Returns None if the position is missing or unset (0, 0).
+    """
     if not position:
         return None
-    lat = position.get('latitude', position.get('latitudeI', 0))
-    lon = position.get('longitude', position.get('longitudeI', 0))
-    if isinstance(lat, int) and abs(lat) > 1000:
-        lat = lat / 1e7
-        lon = lon / 1e7
+    lat, lon = normalize_latlon(
+        position.get('latitude', position.get('latitudeI', 0)),
+        position.get('longitude', position.get('longitudeI', 0)),
+    )
     if lat and lon:
         return (lat, lon)
     return None
 
 
+@lru_cache(maxsize=8)
+def _postal_lookup(country: str):
+    """pgeocode lookup for a country; building one loads its postal code table."""
+    import pgeocode
+    return pgeocode.Nominatim(country)
+
+
+@lru_cache(maxsize=1)
+def _reverse_geocoder():
+    """Shared reverse_geocoder instance; building one loads its city dataset."""
+    import reverse_geocoder as rg
+    return rg.RGeocoder(mode=1, verbose=False)
+
+
 def lookup_postal_code(postal_code: str, country: str = 'US') -> Optional[Tuple[float, float]]:
     """Look up coordinates from a postal code.
 
@@ -424,10 +599,8 @@ def lookup_postal_code(postal_code: str, country: str = 'US') -> Optional[Tuple[
     Fails gracefully if pgeocode not installed or lookup fails.
     """
     try:
-        import pgeocode
-        nomi = pgeocode.Nominatim(country)
-        result = nomi.query_postal_code(postal_code)
-        if result is not None and not (result.latitude != result.latitude):  # NaN check
+        result = _postal_lookup(country).query_postal_code(postal_code)
+        if result is not None and not isnan(result.latitude):
             return (float(result.latitude), float(result.longitude))
     except ImportError:
         return None  # Library not installed
@@ -443,8 +616,7 @@ def get_location_name(lat: float, lon: float) -> Optional[str]:
     Fails gracefully if reverse_geocoder not installed or lookup fails.
     """
     try:
-        import reverse_geocoder as rg
-        result = rg.search((lat, lon))
+        result = _reverse_geocoder().query([(lat, lon)])
         if result and len(result) > 0:
             r = result[0]
             city = r.get('name', '')
@@ -1,15 +1,23 @@
 """Shared state - node store, message buffer, settings."""
 
+import logging
+import threading
+import time
+from bisect import bisect_right
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Any, Optional, TYPE_CHECKING
-import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
-    from .storage import LogStorage
+    from .storage import LogStorage, StorageWorker
+
+logger = logging.getLogger(__name__)
 
+# Sentinel for "key not present", distinct from a stored None
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class PendingMessage:
     """Track a sent message awaiting ACK."""
     request_id: int
@@ -18,7 +26,7 @@ class PendingMessage:
     packet_id: Optional[int] = None  # Meshtastic packet ID for delivery tracking
 
 
-@dataclass
+@dataclass(slots=True)
 class Reaction:
     """A reaction (tapback) on a message."""
     emoji: str
@@ -26,7 +34,7 @@ class Reaction:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionState:
     """State for message selection mode in chat."""
     active: bool = False
@@ -44,35 +52,50 @@ SUPPORTED_REACTIONS = {
     '❓': 'Question',
 }
 
-from .formatting import format_node_id, get_node_position  # noqa: E402
+from .formatting import (  # noqa: E402
+    _BROADCAST_IDS,
+    format_node_id,
+    get_node_position,
+    resolve_display_name,
+)
 
 
 class Observable:
     """Mixin for observable pattern - allows views to subscribe to updates."""
 
     def __init__(self):
-        self._listeners: List[Callable] = []
+        # Ordered set of callbacks, plus a tuple copy that notify() iterates so
+        # (un)subscribing from a callback or another thread can't disturb it
+        self._listeners: Dict[Callable, None] = {}
+        self._listener_snapshot: tuple = ()
 
     def subscribe(self, callback: Callable):
         """Subscribe to updates."""
         if callback not in self._listeners:
-            self._listeners.append(callback)
+            self._listeners[callback] = None
+            self._listener_snapshot = tuple(self._listeners)
 
     def unsubscribe(self, callback: Callable):
         """Unsubscribe from updates."""
         if callback in self._listeners:
-            self._listeners.remove(callback)
+            del self._listeners[callback]
+            self._listener_snapshot = tuple(self._listeners)
 
     def notify(self, event_type: str = "update", data: Any = None):
-        """Notify all listeners of an update."""
-        for callback in self._listeners:
+        """Notify all listeners of an update.
+
+        A listener that raises is logged at ERROR and skipped; the rest still
+        run. Widgets unsubscribe on unmount, so a failure here is a bug to see
+        in the error log, not an expected lifecycle race.
+        """
+        for callback in self._listener_snapshot:
             try:
                 callback(event_type, data)
             except Exception:
-                pass
+                logger.exception("Listener %r failed on %s", callback, event_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class DMChannel:
     """Represents an open DM conversation."""
     node_id: str
@@ -84,38 +107,35 @@ class OpenDMsState(Observable):
 
     def __init__(self):
         super().__init__()
-        self._open_dms: List[DMChannel] = []
+        self._open_dms: Dict[str, DMChannel] = {}  # node_id -> DM, in open order
         self._notifications: Dict[str, int] = {}  # node_id -> unread count
 
     def get_open_dms(self) -> List[DMChannel]:
         """Get list of open DM conversations."""
-        return list(self._open_dms)
+        return list(self._open_dms.values())
 
     def open_dm(self, node_id: str, node_name: str) -> bool:
         """Open a DM conversation. Returns True if newly opened."""
         node_id = format_node_id(node_id)
-        if not self.is_dm_open(node_id):
-            self._open_dms.append(DMChannel(node_id=node_id, node_name=node_name))
-            self.notify("dm_opened", node_id)
-            return True
-        return False
+        if node_id in self._open_dms:
+            return False
+        self._open_dms[node_id] = DMChannel(node_id=node_id, node_name=node_name)
+        self.notify("dm_opened", node_id)
+        return True
 
     def close_dm(self, node_id: str) -> bool:
         """Close a DM conversation. Returns True if was open."""
         node_id = format_node_id(node_id)
-        for i, dm in enumerate(self._open_dms):
-            if dm.node_id == node_id:
-                self._open_dms.pop(i)
-                # Clear notifications for this DM
-                self._notifications.pop(node_id, None)
-                self.notify("dm_closed", node_id)
-                return True
-        return False
+        if self._open_dms.pop(node_id, None) is None:
+            return False
+        # Clear notifications for this DM
+        self._notifications.pop(node_id, None)
+        self.notify("dm_closed", node_id)
+        return True
 
     def is_dm_open(self, node_id: str) -> bool:
         """Check if a DM conversation is open."""
-        node_id = format_node_id(node_id)
-        return any(dm.node_id == node_id for dm in self._open_dms)
+        return format_node_id(node_id) in self._open_dms
 
     def increment_notification(self, node_id: str) -> int:
         """Increment unread count for a node. Returns new count."""
@@ -140,19 +160,25 @@ class OpenDMsState(Observable):
     def update_dm_name(self, node_id: str, node_name: str):
         """Update the display name for an open DM."""
         node_id = format_node_id(node_id)
-        for dm in self._open_dms:
-            if dm.node_id == node_id:
-                dm.node_name = node_name
-                self.notify("dm_updated", node_id)
-                break
+        dm = self._open_dms.get(node_id)
+        if dm is not None:
+            dm.node_name = node_name
+            self.notify("dm_updated", node_id)
 
 
 class NodeStore(Observable):
     """Store for node information with auto-updates."""
 
+    # Seconds lastHeard must advance before an otherwise unchanged update is saved
+    LAST_HEARD_RESOLUTION = 30
+
     def __init__(self, storage: "Optional[LogStorage]" = None):
         super().__init__()
         self._nodes: Dict[str, dict] = {}
+        self._display_names: Dict[str, str] = {}
+        # lastHeard as of each node's last write/notify, which the resolution
+        # is measured against; node['lastHeard'] itself moves with every packet
+        self._persisted_heard: Dict[str, int] = {}
         self._storage = storage
 
     def set_storage(self, storage: "LogStorage"):
@@ -166,32 +192,56 @@ class NodeStore(Observable):
             for node_id, node_data in stored_nodes.items():
                 if node_id not in self._nodes:
                     self._nodes[node_id] = node_data
+            self._display_names.clear()
             if stored_nodes:
                 self.notify("nodes_imported", None)
 
-    def update_node(self, node_id, data: dict):
-        """Update a node's data (merges with existing)."""
-        node_id_str = format_node_id(node_id)
+    def update_node(self, node_id, data: dict, timestamp: Optional[float] = None):
+        """Update a node's data (merges with existing).
 
-        if node_id_str not in self._nodes:
-            self._nodes[node_id_str] = {'num': node_id}
+        timestamp is when the node was heard; defaults to now. An update that
+        changes nothing but a recent lastHeard is kept in memory only, without
+        a storage write or notify.
+        """
+        node_id_str = format_node_id(node_id)
 
-        node = self._nodes[node_id_str]
+        node = self._nodes.get(node_id_str)
+        changed = node is None
+        if node is None:
+            node = self._nodes[node_id_str] = {'num': node_id}
 
-        # Merge data
+        # Merge data, noting whether any value actually changes
         for key, value in data.items():
-            if isinstance(value, dict) and key in node and isinstance(node[key], dict):
-                node[key].update(value)
-            else:
+            current = node.get(key, _MISSING)
+            if isinstance(value, dict) and isinstance(current, dict):
+                if not changed:
+                    changed = any(current.get(k, _MISSING) != v for k, v in value.items())
+                current.update(value)
+            elif current != value:
                 node[key] = value
+                changed = True
 
         # Extract PKI status from user data if present
         user = data.get('user', {})
         if 'publicKey' in user:
-            node['has_public_key'] = bool(user.get('publicKey'))
+            has_public_key = bool(user.get('publicKey'))
+            if node.get('has_public_key') != has_public_key:
+                node['has_public_key'] = has_public_key
+                changed = True
+
+        # Update last seen; on its own this only counts once it has moved enough
+        last_heard = int(timestamp if timestamp is not None else time.time())
+        persisted_heard = self._persisted_heard.setdefault(node_id_str, node.get('lastHeard') or 0)
+        if last_heard - persisted_heard >= self.LAST_HEARD_RESOLUTION:
+            changed = True
+        node['lastHeard'] = last_heard
 
-        # Update last seen
-        node['lastHeard'] = int(time.time())
+        # Repeats of what we already know skip the disk write and redraw
+        if not changed:
+            return
+
+        self._persisted_heard[node_id_str] = last_heard
+        self._display_names.pop(node_id_str, None)
 
         # Persist to storage
         if self._storage:
@@ -204,12 +254,26 @@ class NodeStore(Observable):
         node_id_str = format_node_id(node_id)
         return self._nodes.get(node_id_str)
 
+    def display_name(self, node_id) -> str:
+        """Get a node's display name, cached until the node is next updated."""
+        node_id_str = format_node_id(node_id)
+        name = self._display_names.get(node_id_str)
+        if name is None:
+            name = resolve_display_name(self, node_id)
+            self._display_names[node_id_str] = name
+        return name
+
     def get_all_nodes(self) -> Dict[str, dict]:
-        """Get all nodes."""
+        """Get all nodes.
+
+        Returns a shallow copy: update_node runs on the receive thread, so a
+        live view could change size while the UI iterates it.
+        """
         return self._nodes.copy()
 
     def import_nodes(self, nodes: dict):
         """Import nodes from interface (initial population)."""
+        batch = {}
         for node_id, node_data in nodes.items():
             node_id_str = format_node_id(node_data.get('num', node_id))
             node_copy = node_data.copy()
@@ -220,12 +284,17 @@ class NodeStore(Observable):
             user = node_copy.get('user', {})
             if 'publicKey' in user:
                 node_copy['has_public_key'] = bool(user.get('publicKey'))
-            self._nodes[node_id_str] = node_copy
+            batch[node_id_str] = node_copy
+        # One update so readers on other threads see the import all at once
+        self._nodes.update(batch)
+        self._display_names.clear()
         self.notify("nodes_imported", None)
 
     def clear(self):
         """Clear all nodes."""
         self._nodes.clear()
+        self._display_names.clear()
+        self._persisted_heard.clear()
         self.notify("cleared", None)
 
     def is_favorite(self, node_id) -> bool:
@@ -244,6 +313,11 @@ class NodeStore(Observable):
             self.notify("node_updated", node_id_str)
 
 
+# TEXT_MESSAGE_APP as it appears in decoded packets: name, number or number string
+_TEXT_PORTNUMS = frozenset({'TEXT_MESSAGE_APP', 1, '1'})
+_TELEMETRY_PORTNUMS = frozenset({'TELEMETRY_APP', 67, '67'})
+
+
 class MessageBuffer(Observable):
     """Circular buffer for recent packets."""
 
@@ -253,6 +327,12 @@ class MessageBuffer(Observable):
         self._max_size = max_size
         self._pending: Dict[int, PendingMessage] = {}
         self._storage = storage
+        # Side indices over _messages, each an in-order subsequence of it
+        self._text_msgs: deque = deque()
+        self._text_by_node: Dict[str, deque] = {}
+        # Packets are appended from both the receive thread and the UI thread;
+        # the lock keeps _messages and its indices in step
+        self._lock = threading.Lock()
 
     def set_storage(self, storage: "LogStorage"):
         """Set the storage backend."""
@@ -281,13 +361,52 @@ class MessageBuffer(Observable):
             return pending.packet
         return None
 
-    def add(self, packet: dict) -> Optional[int]:
+    def _append(self, entry: dict):
+        """Append an entry to the buffer and its indices.
+
+        The normalized from/to IDs and text/broadcast flags are computed once
+        here and kept on the entry as _from_id, _to_id, _channel, _is_text
+        and _is_broadcast, so queries don't re-derive them per redraw.
+        """
+        packet = entry['packet']
+        from_id = format_node_id(packet.get('from', ''))
+        to_id = format_node_id(packet.get('to', ''))
+        is_text = packet.get('decoded', {}).get('portnum') in _TEXT_PORTNUMS
+        entry['_from_id'] = from_id
+        entry['_to_id'] = to_id
+        entry['_channel'] = packet.get('channel', 0)
+        entry['_is_text'] = is_text
+        entry['_is_broadcast'] = to_id in _BROADCAST_IDS
+
+        with self._lock:
+            # The buffer is about to drop its oldest entry; it heads any index it is in
+            if len(self._messages) == self._max_size:
+                evicted = self._messages[0]
+                if evicted['_is_text']:
+                    self._text_msgs.popleft()
+                    for node_id in {evicted['_from_id'], evicted['_to_id']}:
+                        node_msgs = self._text_by_node[node_id]
+                        node_msgs.popleft()
+                        if not node_msgs:
+                            del self._text_by_node[node_id]
+
+            self._messages.append(entry)
+            if is_text:
+                self._text_msgs.append(entry)
+                for node_id in {from_id, to_id}:
+                    node_msgs = self._text_by_node.get(node_id)
+                    if node_msgs is None:
+                        node_msgs = self._text_by_node[node_id] = deque()
+                    node_msgs.append(entry)
+
+    def add(self, packet: dict, timestamp: Optional[float] = None) -> Optional[int]:
         """Add a packet to the buffer.
 
         Returns:
             Database ID of the stored packet, or None if storage failed
         """
-        timestamp = time.time()
+        if timestamp is None:
+            timestamp = time.time()
         entry = {
             'packet': packet,
             'timestamp': timestamp
@@ -300,26 +419,43 @@ class MessageBuffer(Observable):
                 entry['_db_id'] = db_id
             except Exception:
                 pass  # Don't let storage errors prevent message display
-        self._messages.append(entry)
+        self._append(entry)
         self.notify("message_added", entry)
         return db_id
 
+    def append(self, packet: dict, timestamp: float) -> dict:
+        """Add a packet to the buffer without persisting it.
+
+        Returns:
+            The buffer entry, for handing to a StorageWorker
+        """
+        entry = {
+            'packet': packet,
+            'timestamp': timestamp
+        }
+        self._append(entry)
+        self.notify("message_added", entry)
+        return entry
+
     def get_all(self) -> List[dict]:
         """Get all messages."""
-        return list(self._messages)
+        with self._lock:
+            return list(self._messages)
 
     def get_recent(self, count: int = 100) -> List[dict]:
         """Get most recent N messages."""
-        return list(self._messages)[-count:]
+        with self._lock:
+            messages = list(self._messages)
+        return messages[-count:] if count < len(messages) else messages
 
     def get_for_node(self, node_id) -> List[dict]:
         """Get messages involving a specific node."""
         node_id_str = format_node_id(node_id)
-        return [
-            m for m in self._messages
-            if format_node_id(m['packet'].get('from', '')) == node_id_str
-            or format_node_id(m['packet'].get('to', '')) == node_id_str
-        ]
+        with self._lock:
+            return [
+                m for m in self._messages
+                if m['_from_id'] == node_id_str or m['_to_id'] == node_id_str
+            ]
 
     def get_text_messages(self, channel: Optional[int] = None, broadcast_only: bool = False) -> List[dict]:
         """Get TEXT_MESSAGE_APP messages, optionally filtered by channel.
@@ -328,20 +464,13 @@ class MessageBuffer(Observable):
             channel: Channel to filter by (None for all channels)
             broadcast_only: If True, only return broadcasts (to="^all"), excluding DMs
         """
-        result = []
-        for m in self._messages:
-            packet = m['packet']
-            decoded = packet.get('decoded', {})
-            portnum = str(decoded.get('portnum', ''))
-            if portnum in ('TEXT_MESSAGE_APP', '1'):
-                if channel is None or packet.get('channel', 0) == channel:
-                    if broadcast_only:
-                        # Only include broadcasts, exclude DMs
-                        to_id = format_node_id(packet.get('to', ''))
-                        if to_id not in ('^all', '!ffffffff'):
-                            continue
-                    result.append(m)
-        return result
+        with self._lock:
+            return [
+                m for m in self._text_msgs
+                if (channel is None or m['_channel'] == channel)
+                # Only include broadcasts, exclude DMs
+                and (not broadcast_only or m['_is_broadcast'])
+            ]
 
     def get_text_messages_for_node(self, node_id, channel: Optional[int] = 0, dm_only: bool = True) -> List[dict]:
         """Get TEXT_MESSAGE_APP messages to/from specific node.
@@ -352,33 +481,26 @@ class MessageBuffer(Observable):
             dm_only: If True, exclude broadcasts (to="^all"). Default True.
         """
         node_id_str = format_node_id(node_id)
+        with self._lock:
+            # Text messages from or to this node, in buffer order
+            node_msgs = list(self._text_by_node.get(node_id_str, ()))
         result = []
-        for m in self._messages:
-            packet = m['packet']
-            decoded = packet.get('decoded', {})
-            portnum = str(decoded.get('portnum', ''))
-            if portnum in ('TEXT_MESSAGE_APP', '1'):
-                # Filter by channel if specified
-                if channel is not None and packet.get('channel', 0) != channel:
-                    continue
-                from_id = format_node_id(packet.get('from', ''))
-                to_id = format_node_id(packet.get('to', ''))
-
-                if dm_only:
-                    # DMs only: messages TO this node, or FROM this node but not broadcasts
-                    is_to_node = to_id == node_id_str
-                    is_from_node = from_id == node_id_str
-                    is_broadcast = to_id in ('^all', '!ffffffff')
-                    if is_to_node or (is_from_node and not is_broadcast):
-                        result.append(m)
-                else:
-                    if from_id == node_id_str or to_id == node_id_str:
-                        result.append(m)
+        for m in node_msgs:
+            # Filter by channel if specified
+            if channel is not None and m['_channel'] != channel:
+                continue
+            # DMs only: messages TO this node, or FROM this node but not broadcasts
+            if dm_only and m['_to_id'] != node_id_str and m['_is_broadcast']:
+                continue
+            result.append(m)
         return result
 
     def clear(self):
         """Clear all messages."""
-        self._messages.clear()
+        with self._lock:
+            self._messages.clear()
+            self._text_msgs.clear()
+            self._text_by_node.clear()
         self.notify("cleared", None)
 
     def __len__(self):
@@ -393,14 +515,18 @@ class StatsTracker(Observable):
         self.packet_times: deque = deque(maxlen=100)
         self.channel_util: Dict[int, float] = {}
 
-    def record_packet(self, packet: dict):
-        """Record a packet for stats tracking."""
-        self.packet_times.append(time.time())
+    def record_packet(self, packet: dict, timestamp: Optional[float] = None):
+        """Record a packet for stats tracking (received at timestamp, default now)."""
+        now = timestamp if timestamp is not None else time.time()
+        packet_times = self.packet_times
+        packet_times.append(now)
+        # Drop times that have left the one-minute window
+        while now - packet_times[0] >= 60:
+            packet_times.popleft()
 
         # Extract channel utilization from telemetry
         decoded = packet.get('decoded', {})
-        portnum = str(decoded.get('portnum', ''))
-        if portnum in ('TELEMETRY_APP', '67'):
+        if decoded.get('portnum') in _TELEMETRY_PORTNUMS:
             telemetry = decoded.get('telemetry', {})
             device = telemetry.get('deviceMetrics', {})
             if 'channelUtilization' in device:
@@ -412,16 +538,16 @@ class StatsTracker(Observable):
 
     def get_msgs_per_min(self) -> float:
         """Calculate messages per minute over the last 60 seconds."""
-        now = time.time()
-        recent = [t for t in self.packet_times if now - t < 60]
-        return len(recent)
+        # Copy first: record_packet appends and prunes from the receive thread
+        times = list(self.packet_times)
+        return len(times) - bisect_right(times, time.time() - 60)
 
     def get_channel_util(self, channel: int = 0) -> Optional[float]:
         """Get channel utilization percentage."""
         return self.channel_util.get(channel)
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Application settings."""
     verbose: bool = False
@@ -432,6 +558,8 @@ class Settings:
     manual_location: Optional[tuple[float, float]] = None  # (lat, lon)
     manual_location_label: str = ""  # Display label (e.g., "95051" or "Santa Clara, CA")
     use_gps: bool = True  # If True, prefer GPS; if False, use manual location
+    # Keep packets that can't update any node or message (config.json only)
+    log_all_packets: bool = False
 
     _listeners: List[Callable] = field(default_factory=list, repr=False)
 
@@ -447,10 +575,16 @@ class Settings:
             settings.manual_location_label = loc.get('label', '')
         if 'use_gps' in config:
             settings.use_gps = config['use_gps']
+        if 'log_all_packets' in config:
+            settings.log_all_packets = bool(config['log_all_packets'])
         return settings
 
     def _save_to_config(self):
-        """Save persistent settings to config file."""
+        """Save persistent settings to config file.
+
+        Setters only call this when a persisted value actually changes; the
+        config panel re-applies the current values whenever it loads.
+        """
         from .storage import load_config, save_config
         config = load_config()
         if self.manual_location:
@@ -480,7 +614,7 @@ class Settings:
             try:
                 callback("setting_changed", setting)
             except Exception:
-                pass
+                logger.exception("Listener %r failed on %s", callback, setting)
 
     def toggle_verbose(self):
         """Toggle verbose mode."""
@@ -499,6 +633,8 @@ class Settings:
 
     def set_manual_location(self, lat: float, lon: float, label: str = ""):
         """Set manual location coordinates."""
+        if self.manual_location == (lat, lon) and self.manual_location_label == label:
+            return
         self.manual_location = (lat, lon)
         self.manual_location_label = label
         self._save_to_config()
@@ -506,6 +642,8 @@ class Settings:
 
     def clear_manual_location(self):
         """Clear manual location."""
+        if self.manual_location is None and not self.manual_location_label:
+            return
         self.manual_location = None
         self.manual_location_label = ""
         self._save_to_config()
@@ -513,6 +651,8 @@ class Settings:
 
     def set_use_gps(self, use_gps: bool):
         """Set whether to use GPS (True) or manual location (False)."""
+        if self.use_gps == use_gps:
+            return
         self.use_gps = use_gps
         self._save_to_config()
         self._notify("use_gps")
@@ -529,17 +669,41 @@ class AppState:
         self.open_dms = OpenDMsState()  # Track open DM conversations
         self.connected = False
         self.my_node_id: Optional[str] = None
+        self.my_node_num: Optional[int] = None
         self._my_position: Optional[tuple[float, float]] = None
         self.connection_info: dict = {}
         self.channel_names: Dict[int, str] = {}
         self._storage = storage
         self._text_logger = text_logger
+        self._storage_worker: Optional[StorageWorker] = None
 
     @property
     def storage(self) -> "Optional[LogStorage]":
         """Get the storage backend."""
         return self._storage
 
+    @property
+    def storage_worker(self) -> "Optional[StorageWorker]":
+        """Get the background packet writer, or None if not running."""
+        return self._storage_worker
+
+    def start_storage_worker(self):
+        """Start the background packet writer, if there is anything to write to.
+
+        Called once from the setup thread before packets can arrive; the
+        receive and UI threads only read storage_worker.
+        """
+        if self._storage_worker is None and (self._storage or self._text_logger):
+            from .storage import StorageWorker
+            self._storage_worker = StorageWorker(self._storage, self._text_logger)
+            self._storage_worker.start()
+
+    def stop_storage_worker(self):
+        """Write out queued packets and stop the background writer."""
+        if self._storage_worker:
+            self._storage_worker.stop()
+            self._storage_worker = None
+
     @property
     def text_logger(self):
         """Get the plain text logger."""
@@ -555,6 +719,7 @@ class AppState:
         if info:
             self.connection_info = info
             self.my_node_id = info.get('my_node_id')
+            self.my_node_num = info.get('my_node_num')
 
     @property
     def my_position(self) -> Optional[tuple[float, float]]:
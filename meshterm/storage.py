@@ -3,14 +3,88 @@
 import json
 import logging
 import os
+import queue
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from .formatting import format_node_id
+try:
+    import orjson  # optional faster encoder/decoder for packet and node rows
+except ImportError:
+    orjson = None
+
+from .formatting import format_node_id, normalize_latlon
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj):
+    """Convert a value the JSON encoder can't handle.
+
+    Only called for leaves the encoder doesn't know; plain dicts, lists and
+    scalars are walked by the encoder itself.
+    """
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, Enum):
+        return obj.name
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        return vars(obj)
+    return str(obj)
+
+
+def _json_dumps(obj) -> str:
+    """Encode obj as JSON text for a database column."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass  # e.g. an int beyond 64 bits; the stdlib encoder copes
+    return json.dumps(obj, default=_json_default)
+
+
+def _safe_json(obj) -> str:
+    """Encode obj as JSON text, falling back to its string form."""
+    try:
+        return _json_dumps(obj)
+    except (TypeError, ValueError):
+        return _json_dumps(str(obj))
+
+
+def _json_loads(text):
+    """Decode JSON text read from a database column."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by the stdlib encoder in older rows
+    return json.loads(text)
+
+
+# INSERT ... RETURNING needs SQLite 3.35+, newer than some system libraries
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Placeholder counts that IN (...) lists are padded up to, so a handful of
+# statement texts cover every batch size and stay in the statement cache
+_IN_LIST_SIZES = (8, 32, 128, 512)
+
+
+def _in_list(values: list) -> Tuple[str, list]:
+    """Return (placeholders, params) for an IN list, padded with NULLs."""
+    size = next((n for n in _IN_LIST_SIZES if n >= len(values)), None)
+    if size is None:
+        size = -(-len(values) // _IN_LIST_SIZES[-1]) * _IN_LIST_SIZES[-1]
+    return ','.join('?' * size), list(values) + [None] * (size - len(values))
 
 
 def get_data_dir() -> Path:
@@ -56,7 +130,7 @@ def save_config(config: dict):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredMessage:
     """A message retrieved from storage."""
     id: int
@@ -87,6 +161,8 @@ class StoredMessage:
 class LogStorage:
     """SQLite-based persistent storage for packets."""
 
+    PACKET_ID_CACHE_SIZE = 4096
+
     SCHEMA = """
     CREATE TABLE IF NOT EXISTS packets (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -103,7 +179,8 @@ class LogStorage:
         hops INTEGER,
         is_tx BOOLEAN DEFAULT 0,
         delivered BOOLEAN,
-        error_reason TEXT
+        error_reason TEXT,
+        text TEXT
     );
 
     CREATE INDEX IF NOT EXISTS idx_timestamp ON packets(timestamp);
@@ -111,6 +188,9 @@ class LogStorage:
     CREATE INDEX IF NOT EXISTS idx_from_node ON packets(from_node);
     CREATE INDEX IF NOT EXISTS idx_portnum ON packets(portnum);
     CREATE INDEX IF NOT EXISTS idx_to_node ON packets(to_node);
+    -- Text messages by channel in id order, so history pages stop at LIMIT
+    CREATE INDEX IF NOT EXISTS idx_text_channel_id ON packets(channel, id)
+        WHERE portnum IN ('TEXT_MESSAGE_APP', '1');
 
     CREATE TABLE IF NOT EXISTS nodes (
         node_id TEXT PRIMARY KEY,
@@ -141,17 +221,59 @@ class LogStorage:
     CREATE INDEX IF NOT EXISTS idx_reply_refs_parent ON reply_refs(parent_db_id);
     """
 
+    # Trigram full-text index over text message bodies. It answers the
+    # substring LIKE used by search from the index instead of scanning every
+    # row; needs SQLite 3.34+ built with FTS5, otherwise search scans.
+    FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS packets_fts USING fts5(text, tokenize='trigram');
+
+    CREATE TRIGGER IF NOT EXISTS packets_fts_insert AFTER INSERT ON packets
+    WHEN new.portnum IN ('TEXT_MESSAGE_APP', '1')
+    BEGIN
+        INSERT INTO packets_fts (rowid, text) VALUES (new.id, new.text);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS packets_fts_delete AFTER DELETE ON packets
+    WHEN old.portnum IN ('TEXT_MESSAGE_APP', '1')
+    BEGIN
+        DELETE FROM packets_fts WHERE rowid = old.id;
+    END;
+    """
+
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
             db_path = get_data_dir() / 'messages.db'
         self.db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        self._has_fts = False
+        # Recently seen Meshtastic packet ID -> database ID (LRU)
+        self._packet_db_ids: OrderedDict[int, int] = OrderedDict()
+        self._packet_db_ids_lock = threading.Lock()
+        # Per-thread batched() nesting depth; see _commit
+        self._batch = threading.local()
         self._init_db()
 
+    # Connection tuning applied before the schema. WAL with synchronous=NORMAL
+    # fsyncs at checkpoints instead of on every commit: the database can't be
+    # corrupted by a crash, but a power loss may drop the last few commits.
+    # mmap stays off so a large history doesn't grow the address space.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA mmap_size=0",
+    )
+
     def _init_db(self):
         """Initialize the database."""
-        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
         self._conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.executescript(self.SCHEMA)
         self._conn.commit()
 
@@ -162,6 +284,70 @@ class LogStorage:
         except sqlite3.OperationalError:
             pass  # Column already exists
 
+        # Migration: add text column if it doesn't exist, filled from stored payloads
+        try:
+            self._conn.execute("ALTER TABLE packets ADD COLUMN text TEXT")
+            self._conn.execute(
+                """
+                UPDATE packets SET text = json_extract(payload, '$.text')
+                WHERE portnum IN ('TEXT_MESSAGE_APP', '1')
+                """
+            )
+            self._conn.commit()
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+        self._has_fts = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        """Create the text search index if SQLite supports it, indexing existing rows."""
+        try:
+            existed = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'packets_fts'"
+            ).fetchone()
+            self._conn.executescript(self.FTS_SCHEMA)
+            if not existed:
+                # Migration: index messages stored before the table existed
+                self._conn.execute(
+                    """
+                    INSERT INTO packets_fts (rowid, text)
+                    SELECT id, text FROM packets
+                    WHERE portnum IN ('TEXT_MESSAGE_APP', '1')
+                    """
+                )
+            self._conn.commit()
+            return True
+        except sqlite3.OperationalError:
+            logger.debug("Full-text search unavailable, using scans", exc_info=True)
+            return False
+
+    def _text_match_sql(self) -> str:
+        """SQL condition matching text messages whose body is LIKE the one parameter."""
+        if self._has_fts:
+            return "id IN (SELECT rowid FROM packets_fts WHERE text LIKE ?)"
+        return "(portnum IN ('TEXT_MESSAGE_APP', '1') AND text LIKE ? COLLATE NOCASE)"
+
+    @contextmanager
+    def batched(self):
+        """Group the writes made inside the block into a single commit.
+
+        Store methods called from this thread skip their own commit until the
+        outermost block exits. Other threads sharing the connection still
+        commit as usual.
+        """
+        self._batch.depth = getattr(self._batch, 'depth', 0) + 1
+        try:
+            yield self
+        finally:
+            self._batch.depth -= 1
+            if not self._batch.depth:
+                self._conn.commit()
+
+    def _commit(self):
+        """Commit, unless this thread is inside batched()."""
+        if not getattr(self._batch, 'depth', 0):
+            self._conn.commit()
+
     def close(self):
         """Close the database connection."""
         if self._conn:
@@ -170,6 +356,22 @@ class LogStorage:
 
     def store_packet(self, packet: dict, timestamp: float) -> int:
         """Store a packet and return its database ID."""
+        db_id = self._insert_packet(packet, timestamp)
+        self._commit()
+        return db_id
+
+    def store_packets(self, packets: List[Tuple[dict, float]]) -> List[int]:
+        """Store (packet, timestamp) pairs in one transaction.
+
+        Returns:
+            Database IDs in the same order as the input
+        """
+        db_ids = [self._insert_packet(packet, timestamp) for packet, timestamp in packets]
+        self._commit()
+        return db_ids
+
+    def _insert_packet(self, packet: dict, timestamp: float) -> int:
+        """Insert a packet row without committing."""
         decoded = packet.get('decoded', {})
         portnum = str(decoded.get('portnum', ''))
 
@@ -183,39 +385,15 @@ class LogStorage:
         if hop_start is not None and hop_limit is not None:
             hops = hop_start - hop_limit
 
-        # Safely serialize to JSON (handle non-serializable objects)
-        def json_serializable(obj):
-            """Convert object to JSON-serializable form."""
-            from enum import Enum
-            if isinstance(obj, dict):
-                return {k: json_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [json_serializable(item) for item in obj]
-            elif isinstance(obj, bytes):
-                return obj.hex()
-            elif isinstance(obj, Enum):
-                return obj.name
-            elif hasattr(obj, '__dict__') and not isinstance(obj, type):
-                return json_serializable(vars(obj))
-            else:
-                try:
-                    json.dumps(obj)
-                    return obj
-                except (TypeError, ValueError):
-                    return str(obj)
-
-        def safe_json(obj):
-            try:
-                return json.dumps(json_serializable(obj))
-            except (TypeError, ValueError):
-                return json.dumps(str(obj))
+        # Message body kept in its own column for search
+        text = decoded.get('text') if portnum in ('TEXT_MESSAGE_APP', '1') else None
 
         cursor = self._conn.execute(
             """
             INSERT INTO packets (
                 timestamp, packet_id, from_node, to_node, channel, portnum,
-                payload, raw_packet, snr, rssi, hops, is_tx, delivered
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                payload, raw_packet, snr, rssi, hops, is_tx, delivered, text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 timestamp,
@@ -224,56 +402,75 @@ class LogStorage:
                 format_node_id(to_id),
                 packet.get('channel', 0),
                 portnum,
-                safe_json(decoded),
-                safe_json(packet),
+                _safe_json(decoded),
+                _safe_json(packet),
                 packet.get('rxSnr'),
                 packet.get('rxRssi'),
                 hops,
                 1 if packet.get('_tx') else 0,
-                packet.get('_delivered')
+                packet.get('_delivered'),
+                text if isinstance(text, str) else None
             )
         )
-        self._conn.commit()
+        self._remember_packet_id(packet.get('id'), cursor.lastrowid)
         return cursor.lastrowid
 
+    def _remember_packet_id(self, packet_id: Optional[int], db_id: int):
+        """Cache a packet ID -> database ID mapping, keeping the first row seen."""
+        if not packet_id:
+            return
+        with self._packet_db_ids_lock:
+            if packet_id in self._packet_db_ids:
+                self._packet_db_ids.move_to_end(packet_id)
+                return
+            self._packet_db_ids[packet_id] = db_id
+            if len(self._packet_db_ids) > self.PACKET_ID_CACHE_SIZE:
+                self._packet_db_ids.popitem(last=False)
+
     def update_delivery_status(self, packet_id: int, delivered: bool, error_reason: str = None):
         """Update the delivery status for a packet by its Meshtastic packet ID."""
         self._conn.execute(
             "UPDATE packets SET delivered = ?, error_reason = ? WHERE packet_id = ? AND is_tx = 1",
             (1 if delivered else 0, error_reason, packet_id)
         )
-        self._conn.commit()
+        self._commit()
 
     def _row_to_stored_message(self, row: sqlite3.Row) -> StoredMessage:
         """Convert a database row to a StoredMessage."""
-        raw_packet = json.loads(row['raw_packet'])
-        payload = json.loads(row['payload']) if row['payload'] else {}
-
-        # Restore delivery status in raw_packet for rendering
-        if row['is_tx']:
-            raw_packet['_tx'] = True
-            if row['delivered'] is not None:
-                raw_packet['_delivered'] = bool(row['delivered'])
-                if not row['delivered'] and row['error_reason']:
-                    raw_packet['_error_reason'] = row['error_reason']
-
-        return StoredMessage(
-            id=row['id'],
-            timestamp=row['timestamp'],
-            packet_id=row['packet_id'],
-            from_node=row['from_node'],
-            to_node=row['to_node'],
-            channel=row['channel'],
-            portnum=row['portnum'],
-            payload=payload,
-            raw_packet=raw_packet,
-            snr=row['snr'],
-            rssi=row['rssi'],
-            hops=row['hops'],
-            is_tx=bool(row['is_tx']),
-            delivered=bool(row['delivered']) if row['delivered'] is not None else None,
-            error_reason=row['error_reason'] if row['is_tx'] and not row['delivered'] else None
-        )
+        return self._rows_to_stored_messages((row,))[0]
+
+    def _rows_to_stored_messages(self, rows) -> List[StoredMessage]:
+        """Convert packets rows (SELECT *) to StoredMessages.
+
+        Columns are unpacked by position; migrations add columns in schema
+        order, so the layout is the same for new and upgraded databases. The
+        payload is the 'decoded' dict already parsed from raw_packet rather
+        than a second parse of the same JSON.
+        """
+        messages = []
+        for row in rows:
+            (db_id, timestamp, packet_id, from_node, to_node, channel, portnum,
+             payload_json, raw_json, snr, rssi, hops, is_tx, delivered, error_reason) = row[:15]
+            raw_packet = _json_loads(raw_json)
+            payload = raw_packet.get('decoded')
+            if not isinstance(payload, dict):
+                payload = _json_loads(payload_json) if payload_json else {}
+
+            # Restore delivery status in raw_packet for rendering
+            if is_tx:
+                raw_packet['_tx'] = True
+                if delivered is not None:
+                    raw_packet['_delivered'] = bool(delivered)
+                    if not delivered and error_reason:
+                        raw_packet['_error_reason'] = error_reason
+
+            messages.append(StoredMessage(
+                db_id, timestamp, packet_id, from_node, to_node, channel, portnum,
+                payload, raw_packet, snr, rssi, hops, bool(is_tx),
+                bool(delivered) if delivered is not None else None,
+                error_reason if is_tx and not delivered else None,
+            ))
+        return messages
 
     def get_text_messages(
         self,
@@ -314,7 +511,7 @@ class LogStorage:
         cursor = self._conn.execute(query, params)
         rows = cursor.fetchall()
         # Reverse to get chronological order
-        return [self._row_to_stored_message(row) for row in reversed(rows)]
+        return self._rows_to_stored_messages(reversed(rows))
 
     def get_messages_for_node(
         self,
@@ -368,7 +565,7 @@ class LogStorage:
 
         cursor = self._conn.execute(query, params)
         rows = cursor.fetchall()
-        return [self._row_to_stored_message(row) for row in reversed(rows)]
+        return self._rows_to_stored_messages(reversed(rows))
 
     def get_all_packets(
         self,
@@ -394,7 +591,7 @@ class LogStorage:
 
         cursor = self._conn.execute(query, params)
         rows = cursor.fetchall()
-        return [self._row_to_stored_message(row) for row in reversed(rows)]
+        return self._rows_to_stored_messages(reversed(rows))
 
     def get_oldest_id(self) -> Optional[int]:
         """Get the oldest message ID in the database."""
@@ -426,7 +623,7 @@ class LogStorage:
 
         Only searches human-readable fields:
         - Node shortName and longName (via nodes table)
-        - Text message content (extracted from payload JSON)
+        - Text message content (via the full-text index when available)
 
         Args:
             term: Search term (case-insensitive LIKE match)
@@ -442,12 +639,10 @@ class LogStorage:
         matching_node_ids = self._find_nodes_by_name(term)
 
         # Search only text messages by content, or packets from/to matching nodes
-        query = """
+        query = f"""
             SELECT * FROM packets
             WHERE (
-                -- Text message content (using json_extract for SQLite)
-                (portnum IN ('TEXT_MESSAGE_APP', '1')
-                 AND json_extract(payload, '$.text') LIKE ? COLLATE NOCASE)
+                {self._text_match_sql()}
         """
         params = [search_pattern]
 
@@ -469,14 +664,14 @@ class LogStorage:
         params.append(limit)
 
         cursor = self._conn.execute(query, params)
-        return [self._row_to_stored_message(row) for row in cursor.fetchall()]
+        return self._rows_to_stored_messages(cursor.fetchall())
 
     def count_search_results(self, term: str) -> int:
         """Count total matching packets for a search term.
 
         Only counts matches in human-readable fields:
         - Node shortName and longName (via nodes table)
-        - Text message content (extracted from payload JSON)
+        - Text message content (via the full-text index when available)
 
         Args:
             term: Search term (case-insensitive LIKE match)
@@ -490,12 +685,10 @@ class LogStorage:
         matching_node_ids = self._find_nodes_by_name(term)
 
         # Count only text messages by content, or packets from/to matching nodes
-        query = """
+        query = f"""
             SELECT COUNT(*) FROM packets
             WHERE (
-                -- Text message content (using json_extract for SQLite)
-                (portnum IN ('TEXT_MESSAGE_APP', '1')
-                 AND json_extract(payload, '$.text') LIKE ? COLLATE NOCASE)
+                {self._text_match_sql()}
         """
         params = [search_pattern]
 
@@ -517,29 +710,8 @@ class LogStorage:
         node_id_str = format_node_id(node_id)
         timestamp = time.time()
 
-        # Safely serialize to JSON
-        def json_serializable(obj):
-            """Convert object to JSON-serializable form."""
-            from enum import Enum
-            if isinstance(obj, dict):
-                return {k: json_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [json_serializable(item) for item in obj]
-            elif isinstance(obj, bytes):
-                return obj.hex()
-            elif isinstance(obj, Enum):
-                return obj.name
-            elif hasattr(obj, '__dict__') and not isinstance(obj, type):
-                return json_serializable(vars(obj))
-            else:
-                try:
-                    json.dumps(obj)
-                    return obj
-                except (TypeError, ValueError):
-                    return str(obj)
-
         try:
-            data_json = json.dumps(json_serializable(data))
+            data_json = _json_dumps(data)
             self._conn.execute(
                 """
                 INSERT OR REPLACE INTO nodes (node_id, data, last_updated)
@@ -547,7 +719,7 @@ class LogStorage:
                 """,
                 (node_id_str, data_json, timestamp)
             )
-            self._conn.commit()
+            self._commit()
         except Exception:
             pass  # Don't let storage errors break the app
 
@@ -562,7 +734,7 @@ class LogStorage:
         nodes = {}
         for row in rows:
             try:
-                nodes[row['node_id']] = json.loads(row['data'])
+                nodes[row['node_id']] = _json_loads(row['data'])
             except (json.JSONDecodeError, KeyError):
                 pass
         return nodes
@@ -578,7 +750,7 @@ class LogStorage:
             "DELETE FROM nodes WHERE last_updated < ?",
             (cutoff,)
         )
-        self._conn.commit()
+        self._commit()
 
     # Reactions methods
 
@@ -609,7 +781,7 @@ class LogStorage:
         if existing:
             # Toggle off - remove the reaction
             self._conn.execute("DELETE FROM reactions WHERE id = ?", (existing['id'],))
-            self._conn.commit()
+            self._commit()
             return False
         else:
             # Insert new reaction
@@ -620,7 +792,7 @@ class LogStorage:
                 """,
                 (message_db_id, message_packet_id, reactor_node, emoji, timestamp)
             )
-            self._conn.commit()
+            self._commit()
             return True
 
     def get_reactions_for_message(self, message_db_id: int) -> List[dict]:
@@ -655,7 +827,7 @@ class LogStorage:
         if not message_db_ids:
             return {}
 
-        placeholders = ','.join('?' for _ in message_db_ids)
+        placeholders, params = _in_list(message_db_ids)
         cursor = self._conn.execute(
             f"""
             SELECT message_db_id, emoji, reactor_node, timestamp
@@ -663,7 +835,7 @@ class LogStorage:
             WHERE message_db_id IN ({placeholders})
             ORDER BY message_db_id, timestamp
             """,
-            message_db_ids
+            params
         )
 
         result = {db_id: [] for db_id in message_db_ids}
@@ -690,6 +862,31 @@ class LogStorage:
             return self._row_to_stored_message(row)
         return None
 
+    def find_db_id_by_packet_id(self, packet_id: int) -> Optional[int]:
+        """Find a message's database ID by its Meshtastic packet ID.
+
+        Recently stored packets are answered from memory; older ones fall
+        back to a database lookup.
+
+        Returns:
+            Database ID if found, None otherwise
+        """
+        with self._packet_db_ids_lock:
+            db_id = self._packet_db_ids.get(packet_id)
+            if db_id is not None:
+                self._packet_db_ids.move_to_end(packet_id)
+                return db_id
+
+        cursor = self._conn.execute(
+            "SELECT id FROM packets WHERE packet_id = ? LIMIT 1",
+            (packet_id,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        self._remember_packet_id(packet_id, row['id'])
+        return row['id']
+
     # Reply refs methods
 
     def store_reply_ref(
@@ -708,9 +905,38 @@ class LogStorage:
         Returns:
             The parent's database ID if found, None if parent not in DB
         """
-        # Try to find the parent message by packet ID
-        parent = self.find_message_by_packet_id(parent_packet_id)
-        parent_db_id = parent.id if parent else None
+        parent_db_id = self._insert_reply_ref(reply_db_id, parent_packet_id, timestamp)
+        self._commit()
+        return parent_db_id
+
+    def store_reply_refs(self, refs: List[Tuple[int, int, float]]):
+        """Store (reply_db_id, parent_packet_id, timestamp) refs in one transaction."""
+        for reply_db_id, parent_packet_id, timestamp in refs:
+            self._insert_reply_ref(reply_db_id, parent_packet_id, timestamp)
+        self._commit()
+
+    def _insert_reply_ref(self, reply_db_id: int, parent_packet_id: int, timestamp: float) -> Optional[int]:
+        """Insert a reply reference without committing. Returns the parent's database ID."""
+        with self._packet_db_ids_lock:
+            parent_db_id = self._packet_db_ids.get(parent_packet_id)
+
+        if parent_db_id is None and _SQLITE_HAS_RETURNING:
+            # Resolve the parent inside the INSERT rather than with a separate SELECT
+            cursor = self._conn.execute(
+                """
+                INSERT INTO reply_refs (reply_db_id, parent_db_id, parent_packet_id, timestamp)
+                VALUES (?, (SELECT id FROM packets WHERE packet_id = ? LIMIT 1), ?, ?)
+                RETURNING parent_db_id
+                """,
+                (reply_db_id, parent_packet_id, parent_packet_id, timestamp)
+            )
+            parent_db_id = cursor.fetchone()[0]
+            if parent_db_id is not None:
+                self._remember_packet_id(parent_packet_id, parent_db_id)
+            return parent_db_id
+
+        if parent_db_id is None:
+            parent_db_id = self.find_db_id_by_packet_id(parent_packet_id)
 
         self._conn.execute(
             """
@@ -719,7 +945,6 @@ class LogStorage:
             """,
             (reply_db_id, parent_db_id, parent_packet_id, timestamp)
         )
-        self._conn.commit()
         return parent_db_id
 
     def get_reply_ref(self, reply_db_id: int) -> Optional[dict]:
@@ -757,14 +982,14 @@ class LogStorage:
         if not message_db_ids:
             return {}
 
-        placeholders = ','.join('?' for _ in message_db_ids)
+        placeholders, params = _in_list(message_db_ids)
         cursor = self._conn.execute(
             f"""
             SELECT reply_db_id, parent_db_id, parent_packet_id, timestamp
             FROM reply_refs
             WHERE reply_db_id IN ({placeholders})
             """,
-            message_db_ids
+            params
         )
 
         return {
@@ -813,7 +1038,9 @@ class LogStorage:
         self._conn.execute("DELETE FROM reply_refs")
         self._conn.execute("DELETE FROM reactions")
         self._conn.execute("DELETE FROM packets")
-        self._conn.commit()
+        self._commit()
+        with self._packet_db_ids_lock:
+            self._packet_db_ids.clear()
 
         return count
 
@@ -827,7 +1054,7 @@ class LogStorage:
         count = cursor.fetchone()[0]
 
         self._conn.execute("DELETE FROM nodes")
-        self._conn.commit()
+        self._commit()
 
         return count
 
@@ -865,15 +1092,99 @@ class LogStorage:
         cursor = self._conn.execute("SELECT COUNT(*) FROM reactions")
         stats['reactions'] = cursor.fetchone()[0]
 
-        # Database file size
-        if self.db_path.exists():
-            stats['db_size_mb'] = self.db_path.stat().st_size / (1024 * 1024)
-        else:
-            stats['db_size_mb'] = 0
+        # Database file size, including writes not yet checkpointed from the WAL
+        size = 0
+        for path in (self.db_path, Path(f"{self.db_path}-wal")):
+            if path.exists():
+                size += path.stat().st_size
+        stats['db_size_mb'] = size / (1024 * 1024)
 
         return stats
 
 
+class StorageWorker(threading.Thread):
+    """Background writer for received packets.
+
+    Entries are queued by the receive thread and written in batches, one
+    transaction per batch including its reply references. Each entry gets its '_db_id' once written, and
+    reply references are linked right after their packet is inserted.
+    """
+
+    BATCH_SIZE = 64
+    BATCH_WINDOW = 0.01  # seconds to wait for more entries after the first
+
+    def __init__(self, storage: Optional[LogStorage], text_logger=None):
+        super().__init__(name="meshterm-storage", daemon=True)
+        self._storage = storage
+        self._text_logger = text_logger
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def submit(self, entry: dict):
+        """Queue a buffer entry ({'packet', 'timestamp'}) for persistence."""
+        self._queue.put_nowait(entry)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far has been written."""
+        if not self.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put_nowait(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """Write any queued entries and stop the thread."""
+        if self.is_alive():
+            self._queue.put_nowait(None)
+            self.join(timeout)
+
+    def run(self):
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            entries = [item for item in batch if isinstance(item, dict)]
+            if entries:
+                try:
+                    self._write(entries)
+                except Exception:
+                    logger.exception("Failed to write %d packets", len(entries))
+
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+
+    def _write(self, entries: List[dict]):
+        """Persist one batch of entries, then link replies and log them."""
+        if self._storage:
+            with self._storage.batched():
+                db_ids = self._storage.store_packets(
+                    [(entry['packet'], entry['timestamp']) for entry in entries]
+                )
+                refs = []
+                for entry, db_id in zip(entries, db_ids):
+                    entry['_db_id'] = db_id
+                    parent_packet_id = entry['packet'].get('_reply_to_packet_id')
+                    if parent_packet_id:
+                        refs.append((db_id, parent_packet_id, entry['timestamp']))
+                if refs:
+                    self._storage.store_reply_refs(refs)
+
+        if self._text_logger:
+            for entry in entries:
+                self._text_logger.log_packet(entry['packet'], entry['timestamp'])
+
+
 class PlainTextLogger:
     """Rotating plain text logs for external tool access."""
 
@@ -900,7 +1211,6 @@ class PlainTextLogger:
 
     def log_packet(self, packet: dict, timestamp: float):
         """Log a packet to the plain text log file."""
-        from datetime import datetime
         decoded = packet.get('decoded', {})
         portnum = str(decoded.get('portnum', ''))
 
@@ -918,11 +1228,10 @@ class PlainTextLogger:
             parts.append(f"text={repr(text)}")
         elif portnum in ('POSITION_APP', '3'):
             pos = decoded.get('position', {})
-            lat = pos.get('latitude', pos.get('latitudeI', 0))
-            lon = pos.get('longitude', pos.get('longitudeI', 0))
-            if isinstance(lat, int) and abs(lat) > 1000:
-                lat = lat / 1e7
-                lon = lon / 1e7
+            lat, lon = normalize_latlon(
+                pos.get('latitude', pos.get('latitudeI', 0)),
+                pos.get('longitude', pos.get('longitudeI', 0)),
+            )
             parts.append(f"lat={lat:.6f} lon={lon:.6f}")
         elif portnum in ('TELEMETRY_APP', '67'):
             telemetry = decoded.get('telemetry', {})
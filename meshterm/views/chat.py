@@ -6,7 +6,7 @@ from textual.containers import Container
 from textual.binding import Binding
 
 from ..state import AppState
-from ..formatting import format_node_id
+from ..formatting import format_node_id, node_display_name
 from ..widgets.chat_log import ChatLog
 from ..widgets.chat_input import ChatInput
 from ..widgets.reaction_picker import ReactionPicker
@@ -195,8 +195,7 @@ class ChatView(Container):
         if from_id:
             node = self.state.nodes.get_node(from_id)
             if node:
-                user = node.get('user', {})
-                sender_name = user.get('shortName') or user.get('longName') or sender_name
+                sender_name = node_display_name(node, sender_name)
         return sender_name
 
     def on_chat_log_message_selected(self, event: ChatLog.MessageSelected):
@@ -8,6 +8,7 @@ from textual.widgets import Static, Input
 from textual.message import Message
 from textual.binding import Binding
 
+from ..formatting import node_display_name
 from ..state import AppState
 from ..widgets.node_table import NodeTable
 
@@ -179,8 +180,7 @@ class NodesView(Container):
         node = self.state.nodes.get_node(node_id)
         name = node_id
         if node:
-            user = node.get('user', {})
-            name = user.get('shortName') or user.get('longName') or node_id
+            name = node_display_name(node, node_id)
 
         # Check current favorite status
         is_fav = self.state.nodes.is_favorite(node_id)
@@ -225,8 +225,7 @@ class NodesView(Container):
         # Get node info for display
         node = self.state.nodes.get_node(node_id)
         if node:
-            user = node.get('user', {})
-            target_name = user.get('shortName') or user.get('longName') or node_id
+            target_name = node_display_name(node, node_id)
             target_num = node.get('num')
         else:
             target_name = node_id
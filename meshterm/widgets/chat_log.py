@@ -10,8 +10,8 @@ from textual.message import Message
 from rich.text import Text
 from rich.cells import cell_len
 
-from ..state import AppState
-from ..formatting import Colors, format_node_id
+from ..state import AppState, _TEXT_PORTNUMS
+from ..formatting import Colors, format_node_id, node_display_name
 
 if TYPE_CHECKING:
     from ..storage import LogStorage
@@ -92,32 +92,26 @@ class ChatLog(RichLog):
         """Handle new message, delivery update, or reaction update."""
         if event_type == "message_added" and data:
             packet = data['packet']
-            decoded = packet.get('decoded', {})
-            portnum = str(decoded.get('portnum', ''))
 
             # Only handle TEXT_MESSAGE_APP
-            if portnum in ('TEXT_MESSAGE_APP', '1'):
-                packet_channel = packet.get('channel', 0)
+            if data['_is_text']:
+                packet_channel = data['_channel']
                 rendered = False
 
                 if self.dm_node_id:
                     # DM mode: only show messages to/from the DM node on channel 0
                     if packet_channel != 0:
                         return
-                    from_id = format_node_id(packet.get('from', ''))
-                    to_id = format_node_id(packet.get('to', ''))
                     dm_node_id = format_node_id(self.dm_node_id)
-                    if from_id == dm_node_id or to_id == dm_node_id:
+                    if data['_from_id'] == dm_node_id or data['_to_id'] == dm_node_id:
                         self._render_message(data)
                         rendered = True
                 else:
                     # Broadcast mode: show messages on the current channel
                     if packet_channel == self.channel:
                         # On channel 0, only show broadcasts (to=^all), not DMs
-                        if self.channel == 0:
-                            to_id = format_node_id(packet.get('to', ''))
-                            if to_id not in ('^all', '!ffffffff'):
-                                return  # Skip DMs on channel 0
+                        if self.channel == 0 and not data['_is_broadcast']:
+                            return  # Skip DMs on channel 0
                         self._render_message(data)
                         rendered = True
 
@@ -130,8 +124,7 @@ class ChatLog(RichLog):
             # (RichLog doesn't support updating individual lines)
             packet = data
             decoded = packet.get('decoded', {})
-            portnum = str(decoded.get('portnum', ''))
-            if portnum in ('TEXT_MESSAGE_APP', '1'):
+            if decoded.get('portnum') in _TEXT_PORTNUMS:
                 packet_channel = packet.get('channel', 0)
                 if self.dm_node_id:
                     if packet_channel == 0:
@@ -194,8 +187,7 @@ class ChatLog(RichLog):
             if from_id:
                 node = self.state.nodes.get_node(from_id)
                 if node:
-                    user = node.get('user', {})
-                    sender_name = user.get('shortName') or user.get('longName') or sender_name
+                    sender_name = node_display_name(node, sender_name)
             name_style = "bold bright_cyan"
 
         # Build prefix parts and calculate width for wrapping
@@ -293,8 +285,7 @@ class ChatLog(RichLog):
                 sender_name = parent.from_node
                 node = self.state.nodes.get_node(parent.from_node)
                 if node:
-                    user = node.get('user', {})
-                    sender_name = user.get('shortName') or user.get('longName') or sender_name
+                    sender_name = node_display_name(node, sender_name)
 
                 # Get message preview (truncated)
                 text = parent.payload.get('text', '')
@@ -691,8 +682,7 @@ class ChatLog(RichLog):
             if from_id:
                 node = self.state.nodes.get_node(from_id)
                 if node:
-                    user = node.get('user', {})
-                    sender_name = user.get('shortName') or user.get('longName') or sender_name
+                    sender_name = node_display_name(node, sender_name)
             name_style = "bold bright_cyan"
 
         # Build prefix parts
@@ -96,6 +96,15 @@ class HeaderBar(Static):
         if event_type in ("dm_opened", "dm_closed", "notification_updated", "notification_cleared"):
             self.refresh()
 
+    def on_mount(self):
+        """Redraw on settings changes that affect the tab list."""
+        self.state.settings.subscribe(self._handle_settings_event)
+
+    def _handle_settings_event(self, event_type: str, data):
+        """Redraw only for settings the header actually renders."""
+        if data == "selected_node":
+            self.refresh()
+
     def _get_chat_tabs(self) -> List[str]:
         """Get dynamic list of chat tabs based on active channels and open DMs.
 
@@ -310,3 +319,4 @@ class HeaderBar(Static):
     def on_unmount(self):
         """Cleanup subscriptions."""
         self.state.open_dms.unsubscribe(self._handle_dm_event)
+        self.state.settings.unsubscribe(self._handle_settings_event)
@@ -1,7 +1,7 @@
 """Sortable node table widget."""
 
 import time
-from typing import Optional
+from typing import Dict, Optional
 from textual.widgets import DataTable
 from textual.message import Message
 from textual.binding import Binding
@@ -10,7 +10,8 @@ from rich.cells import cell_len
 
 from ..state import AppState
 from ..formatting import (
-    format_time_ago, Colors, haversine_distance, format_distance, get_node_position
+    format_time_ago, Colors, haversine_distance, haversine_distance_batch, format_distance,
+    get_node_position, get_node_positions
 )
 
 
@@ -86,6 +87,14 @@ class NodeTable(DataTable):
             return float('inf')
         return haversine_distance(my_pos[0], my_pos[1], node_pos[0], node_pos[1])
 
+    @staticmethod
+    def _calc_distances(nodes: Dict[str, dict], my_pos: Optional[tuple]) -> Dict[str, float]:
+        """Calculate distance from my node to every node with a position, in one batch."""
+        if not my_pos:
+            return {}
+        node_ids, lats, lons = get_node_positions(nodes)
+        return dict(zip(node_ids, haversine_distance_batch(my_pos[0], my_pos[1], lats, lons)))
+
     def __init__(self, state: AppState, **kwargs):
         super().__init__(**kwargs)
         self.state = state
@@ -212,25 +221,15 @@ class NodeTable(DataTable):
         my_pos = self.state.my_position
         current_time = int(time.time())
 
+        # Distances for the dist column and sort, computed for all nodes at once
+        distances = self._calc_distances(nodes, my_pos)
+
         # Get the sort key function for current column
         col_name = self.COLUMNS[self._sort_column_idx][0].lower().replace(" ", "_")
         sort_func = self.SORT_KEYS.get(col_name)
 
-        def sort_key(item):
-            node_id, node = item
-            # Own node always first (is_me = 0 means first when sorted)
-            is_me = 0 if node_id == my_node_id else 1
-            if sort_func:
-                sort_val = sort_func(node, current_time, my_pos)
-            else:
-                sort_val = 0
-            return (is_me, sort_val)
-
-        sorted_nodes = sorted(nodes.items(), key=sort_key, reverse=not self._sort_ascending)
-
-        # But we need own node always at top, so re-sort with own node priority
-        # Since reverse affects everything, we handle it differently:
-        # Sort others by column, then prepend own node
+        # Own node always goes at the top regardless of sort direction:
+        # sort others by column, then prepend own node
         own_node = None
         other_nodes = []
         for node_id, node in nodes.items():
@@ -240,7 +239,12 @@ class NodeTable(DataTable):
                 other_nodes.append((node_id, node))
 
         # Sort other nodes by current column
-        if sort_func:
+        if col_name == "dist":
+            other_nodes.sort(
+                key=lambda item: distances.get(item[0], float('inf')),
+                reverse=not self._sort_ascending
+            )
+        elif sort_func:
             other_nodes.sort(
                 key=lambda item: sort_func(item[1], current_time, my_pos),
                 reverse=not self._sort_ascending
@@ -254,7 +258,7 @@ class NodeTable(DataTable):
 
         for node_id, node in sorted_nodes:
             if self._matches_filter(node_id, node):
-                self._add_node_row(node_id, node)
+                self._add_node_row(node_id, node, distances.get(node_id))
 
         # Restore scroll position after refresh
         self.scroll_x = saved_scroll_x
@@ -267,8 +271,11 @@ class NodeTable(DataTable):
                     self.move_cursor(row=idx)
                     break
 
-    def _add_node_row(self, node_id: str, node: dict):
-        """Add a row for a node."""
+    def _add_node_row(self, node_id: str, node: dict, dist_km: Optional[float] = None):
+        """Add a row for a node.
+
+        dist_km is the precomputed distance from my node, if it has one.
+        """
         user = node.get('user', {})
         metrics = node.get('deviceMetrics', {})
         last_heard = node.get('lastHeard')
@@ -339,13 +346,8 @@ class NodeTable(DataTable):
         hw_text = Text(hw or '', style=Colors.DIM)
         hw_text.truncate(14)
 
-        # Calculate distance from my node
-        dist_str = ''
-        my_pos = self.state.my_position
-        node_pos = get_node_position(node)
-        if my_pos and node_pos:
-            dist_km = haversine_distance(my_pos[0], my_pos[1], node_pos[0], node_pos[1])
-            dist_str = format_distance(dist_km, short=True)
+        # Distance from my node
+        dist_str = format_distance(dist_km, short=True) if dist_km is not None else ''
 
         row = [
             online_text,
@@ -1,5 +1,6 @@
 """Core test fixtures for meshterm tests."""
 
+import logging
 import time
 from pathlib import Path
 from typing import Any, List, Tuple
@@ -10,6 +11,25 @@ import pytest
 from meshterm.storage import LogStorage
 from meshterm.state import AppState, NodeStore, MessageBuffer, OpenDMsState, Settings
 
+# ============================================================================
+# Logging Fixtures
+# ============================================================================
+
+
+@pytest.fixture(autouse=True, scope="session")
+def detach_error_log():
+    """Keep tests that exercise error paths out of the app's tmp/error.log."""
+    import meshterm.app
+
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if h.get_name() == meshterm.app._FILE_HANDLER_NAME]
+    for handler in handlers:
+        root.removeHandler(handler)
+    yield
+    for handler in handlers:
+        root.addHandler(handler)
+
+
 # ============================================================================
 # Storage Fixtures
 # ============================================================================
@@ -311,3 +311,143 @@ class TestStorageRoundtrip:
         assert stored["user"]["longName"] == "Test Node with Unicode: 测试"
         assert stored["position"]["latitude"] == 37.7749
         assert stored["deviceMetrics"]["batteryLevel"] == 85
+
+
+@pytest.fixture
+def receiving_connection(in_memory_storage):
+    """MeshtasticConnection wired to a fresh state, unsubscribed afterwards."""
+    from meshterm.connection import MeshtasticConnection
+
+    state = AppState(storage=in_memory_storage)
+    connection = MeshtasticConnection(state)
+    yield connection
+    connection.cleanup()
+
+
+def _text_packet(packet_id, text):
+    return {
+        "id": packet_id,
+        "from": 0x12345678,
+        "to": 0xFFFFFFFF,
+        "channel": 0,
+        "decoded": {"portnum": "TEXT_MESSAGE_APP", "text": text},
+    }
+
+
+class TestReceiveFlow:
+    """Tests for received text packets going through MeshtasticConnection."""
+
+    def test_plain_text_is_stored_unchanged(self, receiving_connection):
+        """Text without a protocol prefix should be stored as-is."""
+        receiving_connection._on_receive(_text_packet(1, "[Rough] day"), None)
+
+        entry = receiving_connection.state.messages.get_all()[-1]
+        assert entry["packet"]["decoded"]["text"] == "[Rough] day"
+        assert "_reply_to_packet_id" not in entry["packet"]
+
+    def test_numeric_portnum_is_dispatched(self, receiving_connection):
+        """Integer portnums should be handled like their names."""
+        packet = _text_packet(8, "[>:1] numeric")
+        packet["decoded"]["portnum"] = 1
+        receiving_connection._on_receive(packet, None)
+
+        entry = receiving_connection.state.messages.get_all()[-1]
+        assert entry["packet"]["decoded"]["text"] == "numeric"
+
+    def test_uninteresting_packets_are_only_counted(self, receiving_connection):
+        """Unhandled portnums without signal data should skip the buffer."""
+        state = receiving_connection.state
+        packet = {"from": 0x12345678, "to": 0xFFFFFFFF, "decoded": {"portnum": "NEIGHBORINFO_APP"}}
+
+        receiving_connection._on_receive(dict(packet), None)
+        assert len(state.messages) == 0
+        assert len(state.stats.packet_times) == 1
+
+        receiving_connection._on_receive(dict(packet, rxSnr=5.0), None)
+        assert len(state.messages) == 1
+
+        state.settings.log_all_packets = True
+        receiving_connection._on_receive(dict(packet), None)
+        assert len(state.messages) == 2
+
+    def test_hop_only_packets_update_the_node(self, receiving_connection):
+        """Hop counts without signal data should still reach the node store."""
+        state = receiving_connection.state
+        receiving_connection._on_receive(
+            {
+                "from": 0x12345678,
+                "to": 0xFFFFFFFF,
+                "hopStart": 3,
+                "hopLimit": 1,
+                "decoded": {"portnum": "NEIGHBORINFO_APP"},
+            },
+            None,
+        )
+
+        node = state.nodes.get_node("!12345678")
+        assert node["hops"] == 2
+        assert node["lastHeard"]
+
+    def test_reply_prefix_is_stripped(self, receiving_connection):
+        """Reply prefix should be parsed and removed from the display text."""
+        receiving_connection._on_receive(_text_packet(2, "[>:1] sure"), None)
+
+        entry = receiving_connection.state.messages.get_all()[-1]
+        assert entry["packet"]["decoded"]["text"] == "sure"
+        assert entry["packet"]["_reply_to_packet_id"] == 1
+
+    def test_reply_ref_is_written_in_background(self, receiving_connection):
+        """The storage worker should persist the reply and link it to its parent."""
+        receiving_connection._on_receive(_text_packet(6, "first"), None)
+        receiving_connection._on_receive(_text_packet(7, "[>:6] second"), None)
+        receiving_connection.state.storage_worker.flush()
+
+        parent, reply = receiving_connection.state.messages.get_all()
+        ref = receiving_connection.state.storage.get_reply_ref(reply["_db_id"])
+        assert ref["parent_db_id"] == parent["_db_id"]
+
+    def test_own_position_updates_my_position(self, receiving_connection):
+        """A position packet from our own node should update my_position."""
+        state = receiving_connection.state
+        state.set_connected(True, {"my_node_id": "!12345678", "my_node_num": 0x12345678})
+
+        receiving_connection._on_receive(
+            {
+                "from": 0x12345678,
+                "to": 0xFFFFFFFF,
+                "decoded": {
+                    "portnum": "POSITION_APP",
+                    "position": {"latitudeI": 375000000, "longitudeI": -1225000000},
+                },
+            },
+            None,
+        )
+
+        assert state.my_position == (37.5, -122.5)
+
+    def test_reaction_is_not_logged(self, receiving_connection):
+        """Reaction packets should not be added to the message buffer."""
+        receiving_connection._on_receive(_text_packet(3, "hello"), None)
+        receiving_connection._on_receive(_text_packet(4, "[R:3:👍]"), None)
+
+        assert len(receiving_connection.state.messages) == 1
+        reactions = receiving_connection.state.storage.get_reactions_for_message(
+            receiving_connection.state.messages.get_all()[0]["_db_id"]
+        )
+        assert len(reactions) == 1
+
+    def test_incoming_dm_notifies_after_buffering(self, receiving_connection, event_collector):
+        """A DM to our node should be buffered first, then announced."""
+        state = receiving_connection.state
+        state.my_node_id = "!87654321"
+        state.messages.subscribe(event_collector.callback)
+
+        packet = _text_packet(5, "psst")
+        packet["to"] = 0x87654321
+        receiving_connection._on_receive(packet, None)
+
+        assert event_collector.count("message_added") == 1
+        assert event_collector.count("dm_received") == 1
+        types = [event_type for event_type, _ in event_collector.events]
+        assert types.index("message_added") < types.index("dm_received")
+        assert state.open_dms.is_dm_open("!12345678")
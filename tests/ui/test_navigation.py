@@ -37,7 +37,7 @@ class TestAppStartupAndComponents:
     @pytest.mark.asyncio
     async def test_app_starts_with_expected_components(self, test_app):
         """App should start with all expected UI components and state."""
-        async with test_app.run_test():
+        async with test_app.run_test() as pilot:
             # App is running
             assert test_app.is_running
 
@@ -58,6 +58,13 @@ class TestAppStartupAndComponents:
             # Default tab is nodes
             assert test_app.query_one("#main-tabs").active == "nodes"
 
+            # Only the initial view is composed until another tab is opened
+            assert len(test_app.query("#nodes-view")) == 1
+            assert len(test_app.query("#settings-view")) == 0
+            test_app.action_switch_tab("settings")
+            await pilot.pause()
+            assert len(test_app.query("#settings-view")) == 1
+
 
 class TestTabNavigation:
     """Tests for tab switching via keyboard."""
@@ -92,6 +99,32 @@ class TestTabNavigation:
             await pilot.press("n")
             assert tabs.active == "nodes"
 
+            # next/prev cycle through the main tabs and wrap around
+            test_app.action_prev_tab()
+            assert tabs.active == "settings"
+            test_app.action_next_tab()
+            assert tabs.active == "nodes"
+            test_app.action_next_tab()
+            assert tabs.active == "log"
+
+    @pytest.mark.asyncio
+    async def test_keyboard_switch_updates_header_once(self, test_app):
+        """A tab hotkey should update the header context exactly once."""
+        async with test_app.run_test() as pilot:
+            header = test_app.query_one("#header-bar")
+            calls = []
+            original = header.set_context
+
+            def counting_set_context(*args, **kwargs):
+                calls.append(args)
+                return original(*args, **kwargs)
+
+            header.set_context = counting_set_context
+            await pilot.press("l")
+            await pilot.pause()
+
+            assert calls == [("main",)]
+
 
 class TestHelpModal:
     """Tests for help modal behavior."""
@@ -161,3 +194,88 @@ class TestKeyboardBehavior:
             # Ctrl+C triggers quit
             await pilot.press("ctrl+c")
             # Test framework handles the exit gracefully
+
+
+class TestDMNotifications:
+    """Tests for incoming DM toast coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_dm_burst_produces_single_toast(self, test_app):
+        """A burst of DMs should be announced with one toast."""
+        async with test_app.run_test() as pilot:
+            await pilot.pause()
+            before = len(test_app._notifications)
+
+            for name in ("ALPH", "BETA", "ALPH"):
+                test_app._handle_message_event("dm_received", {"from_name": name, "preview": "hi"})
+
+            await pilot.pause(0.5)
+
+            assert len(test_app._notifications) == before + 1
+            assert not test_app._pending_dms
+
+
+class TestConnectionStatus:
+    """Tests for connection status handling."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_status_is_ignored(self, test_app):
+        """A repeated status callback should not toast again."""
+        async with test_app.run_test() as pilot:
+            test_app._intentional_disconnect = True
+            before = len(test_app._notifications)
+
+            test_app._on_connection_status("disconnected", None)
+            test_app._on_connection_status("disconnected", None)
+            await pilot.pause()
+
+            assert len(test_app._notifications) == before + 1
+
+
+class TestSentMessages:
+    """Tests for buffering and persisting sent messages."""
+
+    @pytest.mark.asyncio
+    async def test_sent_reply_is_stored_in_background(self, test_app):
+        """Sent packets should be buffered, then stored with their reply link."""
+        from meshterm.app import _build_tx_packet
+
+        test_app.state.start_storage_worker()
+        async with test_app.run_test() as pilot:
+            storage = test_app.state.storage
+            storage.store_packet(
+                {"id": 100, "decoded": {"portnum": "TEXT_MESSAGE_APP", "text": "q"}}, 1.0
+            )
+            test_app._queue_tx(
+                _build_tx_packet("!00000001", "^all", "a", 0, 101, reply_to=100), 2.0
+            )
+            await pilot.pause(test_app.TX_BATCH_DELAY * 4)
+
+            entry = test_app.state.messages.get_all()[-1]
+            assert entry["packet"]["id"] == 101
+            assert test_app.state.storage_worker.flush()
+            refs = storage.get_reply_refs_for_messages([entry["_db_id"]])
+            assert refs[entry["_db_id"]]["parent_packet_id"] == 100
+            test_app.state.stop_storage_worker()
+
+
+class TestErrorLogging:
+    """Tests for the module-level error log handler."""
+
+    def test_reimport_does_not_duplicate_handler(self, monkeypatch):
+        """Reloading the app module should keep a single error file handler."""
+        import importlib
+        import logging
+
+        import meshterm.app as app_module
+
+        # Restored afterwards so later tests stay detached from tmp/error.log
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", list(root.handlers))
+
+        importlib.reload(app_module)
+        importlib.reload(app_module)
+
+        handlers = [h for h in root.handlers if h.get_name() == app_module._FILE_HANDLER_NAME]
+        assert len(handlers) == 1
+        handlers[0].close()
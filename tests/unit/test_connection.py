@@ -0,0 +1,259 @@
+"""Tests for MeshtasticConnection helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from meshterm.connection import MeshtasticConnection, decode_psk
+
+
+@pytest.fixture
+def connection(empty_state):
+    """MeshtasticConnection with a fake local node, unsubscribed afterwards."""
+    conn = MeshtasticConnection(empty_state)
+    conn.interface = MagicMock()
+    conn.interface.localNode.localConfig = SimpleNamespace(
+        lora=SimpleNamespace(region=1, modem_preset=0, tx_power=20),
+        device=SimpleNamespace(role=0),
+    )
+    yield conn
+    conn.interface = None
+    conn.cleanup()
+
+
+def test_handlers_stay_subscribed(connection, empty_state):
+    """pubsub should still deliver to a slotted connection."""
+    from pubsub import pub
+
+    assert not hasattr(connection, "__dict__")
+    pub.sendMessage(
+        "meshtastic.receive",
+        packet={
+            "from": 0x12345678,
+            "to": 0xFFFFFFFF,
+            "decoded": {"portnum": "TEXT_MESSAGE_APP", "text": "hi"},
+        },
+        interface=None,
+    )
+    assert len(empty_state.messages) == 1
+
+
+def test_cleanup_unsubscribes(empty_state):
+    """After cleanup the connection should no longer receive packets."""
+    from pubsub import pub
+
+    conn = MeshtasticConnection(empty_state)
+    conn.cleanup()
+    pub.sendMessage(
+        "meshtastic.receive",
+        packet={
+            "from": 0x12345678,
+            "to": 0xFFFFFFFF,
+            "decoded": {"portnum": "TEXT_MESSAGE_APP", "text": "hi"},
+        },
+        interface=None,
+    )
+    assert len(empty_state.messages) == 0
+
+
+class TestWillCauseReboot:
+    """Tests for will_cause_reboot."""
+
+    def test_unchanged_reboot_field(self, connection):
+        """Writing the current value of a reboot field should not reboot."""
+        assert connection.will_cause_reboot("lora", {"region": 1}) is False
+
+    def test_changed_reboot_field(self, connection):
+        """Changing a reboot field should reboot."""
+        assert connection.will_cause_reboot("lora", {"region": 2}) is True
+
+    def test_non_reboot_field(self, connection):
+        """Fields outside the reboot set never reboot."""
+        assert connection.will_cause_reboot("lora", {"tx_power": 5}) is False
+        assert connection.will_cause_reboot("telemetry", {"device_update_interval": 60}) is False
+
+    def test_not_connected_assumes_reboot(self, connection):
+        """Without a device the answer errs on the side of a reboot."""
+        connection.interface = None
+        assert connection.will_cause_reboot("device", {"role": 0}) is True
+        assert connection.will_cause_reboot("device", {}) is False
+
+
+class TestAutoDetectPort:
+    """Tests for auto_detect_port."""
+
+    @pytest.fixture
+    def ports(self, monkeypatch):
+        """Three candidate ports, of which only ttyACM1 answers."""
+
+        def probe(candidate):
+            if candidate != "/dev/ttyACM1":
+                raise OSError("no device")
+            return candidate
+
+        monkeypatch.setattr(
+            MeshtasticConnection,
+            "find_ports",
+            staticmethod(lambda: ["/dev/ttyACM0", "/dev/ttyACM1", "/dev/ttyUSB0"]),
+        )
+        monkeypatch.setattr(MeshtasticConnection, "_probe_port", staticmethod(probe))
+
+    def test_find_ports_orders_acm_before_usb(self, monkeypatch):
+        """ttyACM ports come first, each group sorted; other devices are ignored."""
+
+        class FakeScandir(list):
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        names = ["ttyUSB1", "null", "ttyACM1", "ttyS0", "ttyUSB0", "ttyACM0"]
+        monkeypatch.setattr(
+            "meshterm.connection.os.scandir",
+            lambda path: FakeScandir(SimpleNamespace(name=name) for name in names),
+        )
+
+        assert MeshtasticConnection.find_ports() == [
+            "/dev/ttyACM0",
+            "/dev/ttyACM1",
+            "/dev/ttyUSB0",
+            "/dev/ttyUSB1",
+        ]
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_finds_responding_port(self, ports, parallel):
+        """The one port that answers the probe should be returned."""
+        assert MeshtasticConnection.auto_detect_port(parallel=parallel) == "/dev/ttyACM1"
+
+    def test_no_ports(self, monkeypatch):
+        """No candidates means no port."""
+        monkeypatch.setattr(MeshtasticConnection, "find_ports", staticmethod(list))
+        assert MeshtasticConnection.auto_detect_port() is None
+
+
+class TestDecodePsk:
+    """Tests for decode_psk."""
+
+    def test_named_keys(self):
+        """Named keys map to their fixed values; 'random' is 32 fresh bytes."""
+        assert decode_psk("default") == bytes([1])
+        assert decode_psk("NONE") == bytes([0])
+        assert len(decode_psk("random")) == 32
+        assert decode_psk("random") != decode_psk("random")
+
+    def test_hex_and_base64(self):
+        """Even-length hex is decoded as hex, anything else as base64."""
+        key = bytes(range(16))
+        assert decode_psk(key.hex()) == key
+        assert decode_psk(key.hex().upper()) == key
+        assert decode_psk("AQ==") == bytes([1])
+        assert decode_psk("AQID") == bytes([1, 2, 3])
+
+
+class TestConfigSnapshot:
+    """Tests for the shared config snapshot behind the config getters."""
+
+    @pytest.fixture
+    def node(self, connection):
+        node = connection.interface.localNode
+        node.localConfig = SimpleNamespace(
+            lora=SimpleNamespace(
+                region=1, modem_preset=0, tx_power=20, hop_limit=3, tx_enabled=True
+            ),
+        )
+        node.moduleConfig = None
+        node.channels = [
+            SimpleNamespace(
+                index=0,
+                role=1,
+                settings=SimpleNamespace(
+                    name="", psk=bytes([1]), uplink_enabled=False, downlink_enabled=False
+                ),
+            ),
+            SimpleNamespace(
+                index=1,
+                role=2,
+                settings=SimpleNamespace(
+                    name="ops", psk=bytes(range(16)), uplink_enabled=True, downlink_enabled=False
+                ),
+            ),
+            SimpleNamespace(
+                index=2,
+                role=0,
+                settings=SimpleNamespace(
+                    name="", psk=b"", uplink_enabled=False, downlink_enabled=False
+                ),
+            ),
+            SimpleNamespace(
+                index=3,
+                role=2,
+                settings=SimpleNamespace(
+                    name="open", psk=bytes([0]), uplink_enabled=False, downlink_enabled=False
+                ),
+            ),
+        ]
+        connection.interface.myInfo = None
+        return node
+
+    def test_views_of_one_snapshot(self, connection, node):
+        """Local config, export and shareable channels should agree."""
+        local = connection.get_local_config()
+        assert local["lora"]["hop_limit"] == 3
+        assert "position" not in local
+        assert local["channels"][1]["psk"] == bytes(range(16)).hex()
+        assert local["channels"][2]["psk"] == ""
+
+        ok, exported, _ = connection.export_config()
+        assert ok
+        assert "telemetry" not in exported
+        assert exported["channels"][0]["psk_b64"] == "AQ=="
+        assert "psk_b64" not in exported["channels"][2]
+
+        shareable = connection.get_shareable_channels()
+        assert [ch["index"] for ch in shareable] == [0, 1]
+        assert shareable[1]["name"] == "ops"
+
+    def test_write_invalidates_snapshot(self, connection, node):
+        """A config write should be visible in the next read."""
+        assert connection.get_local_config()["lora"]["hop_limit"] == 3
+
+        assert connection.write_config("lora", {"hop_limit": 5})
+        assert connection.get_local_config()["lora"]["hop_limit"] == 5
+
+    def test_outside_changes_invalidate_snapshot(self, connection, node, empty_state):
+        """Config changed by another client should show once the device reports it."""
+        from pubsub import pub
+
+        empty_state.my_node_num = 0x12345678
+        assert connection.get_local_config()["lora"]["hop_limit"] == 3
+
+        node.localConfig.lora.hop_limit = 6
+        pub.sendMessage("meshtastic.node.updated", node={"num": 0x87654321}, interface=None)
+        assert connection.get_local_config()["lora"]["hop_limit"] == 3
+        pub.sendMessage("meshtastic.node.updated", node={"num": 0x12345678}, interface=None)
+        assert connection.get_local_config()["lora"]["hop_limit"] == 6
+
+        node.localConfig = SimpleNamespace(lora=SimpleNamespace(**vars(node.localConfig.lora)))
+        node.localConfig.lora.hop_limit = 7
+        assert connection.get_local_config()["lora"]["hop_limit"] == 7
+
+    def test_import_accepts_base64_and_hex_psks(self, connection, node):
+        """Imported channels may carry their PSK as base64 or hex."""
+        config = {
+            "channels": [
+                {"index": 1, "psk_b64": "AAEC"},
+                {"index": 2, "psk_hex": "000102"},
+            ]
+        }
+        with patch.object(MeshtasticConnection, "write_channel", return_value=True) as write:
+            ok, errors, _ = connection.import_config(config)
+
+        assert ok and errors == []
+        assert [c.args[1]["psk"] for c in write.call_args_list] == [b"\x00\x01\x02"] * 2
+
+    def test_returned_config_is_a_copy(self, connection, node):
+        """Mutating a returned config should not leak into later reads."""
+        connection.get_local_config()["lora"]["region"] = 99
+        assert connection.get_local_config()["lora"]["region"] == 1
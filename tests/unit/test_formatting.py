@@ -1,7 +1,8 @@
 """Tests for meshterm.formatting module - pure functions."""
 
+import sys
 import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,8 +13,22 @@ from meshterm.formatting import (
     format_node_id,
     format_time_ago,
     haversine_distance,
+    haversine_distance_batch,
     format_distance,
+    _use_imperial,
+    _postal_lookup,
+    _reverse_geocoder,
+    get_location_name,
+    lookup_postal_code,
+    format_packet,
+    format_payload,
+    format_verbose,
+    pretty_print_json,
     get_node_position,
+    get_node_positions,
+    node_display_name,
+    normalize_latlon,
+    scale_latlon,
     PORTNUM_MAP,
 )
 
@@ -48,6 +63,11 @@ class TestFormatNodeId:
         """Already formatted IDs should remain unchanged."""
         assert format_node_id("!aabbccdd") == "!aabbccdd"
 
+    def test_repeated_ids_reuse_cached_string(self):
+        """Formatting the same node number twice should return the cached string."""
+        assert format_node_id(0x0BADF00D) is format_node_id(0x0BADF00D)
+        assert format_node_id(None) == "None"
+
 
 class TestFormatTimeAgo:
     """Tests for format_time_ago function."""
@@ -128,10 +148,32 @@ class TestHaversineDistance:
         dist = haversine_distance(0, 0, 0, 180)
         assert dist == pytest.approx(20015, rel=0.01)  # Half Earth circumference
 
+    def test_batch_matches_scalar(self):
+        """Batch distances should match the scalar formula point by point."""
+        lats = [37.8044, 34.0522, 0.0]
+        lons = [-122.2712, -118.2437, 180.0]
+        batch = haversine_distance_batch(37.7749, -122.4194, lats, lons)
+        expected = [
+            haversine_distance(37.7749, -122.4194, lat, lon) for lat, lon in zip(lats, lons)
+        ]
+        assert batch == pytest.approx(expected)
+        assert haversine_distance_batch(0, 0, [], []) == []
+
 
 class TestFormatDistance:
     """Tests for format_distance function."""
 
+    def test_locale_detected_once(self):
+        """The unit system should be looked up once, not per distance."""
+        _use_imperial.cache_clear()
+        try:
+            with patch("locale.getlocale", return_value=("en_US", "UTF-8")) as getlocale:
+                assert _use_imperial() is True
+                assert _use_imperial() is True
+            assert getlocale.call_count == 1
+        finally:
+            _use_imperial.cache_clear()
+
     @patch("meshterm.formatting._use_imperial", return_value=False)
     def test_metric_meters(self, mock_imperial):
         """Distances < 1km should show meters (metric)."""
@@ -245,6 +287,56 @@ class TestGetNodePosition:
         assert get_node_position(node) is None
 
 
+class TestNodeDisplayName:
+    """Tests for node_display_name function."""
+
+    def test_prefers_short_then_long_name(self):
+        """Short name wins, then long name, then the fallback."""
+        assert node_display_name({"user": {"shortName": "AB", "longName": "Alpha"}}, "!1") == "AB"
+        assert node_display_name({"user": {"shortName": "", "longName": "Alpha"}}, "!1") == "Alpha"
+        assert node_display_name({"user": {}}, "!1") == "!1"
+        assert node_display_name({"user": None}, "!1") == "!1"
+        assert node_display_name({}, "!1") == "!1"
+
+
+class TestGetNodePositions:
+    """Tests for get_node_positions function."""
+
+    def test_matches_get_node_position(self):
+        """Bulk extraction should agree with the per-node function."""
+        nodes = {
+            "!1": {"position": {"latitudeI": 375000000, "longitudeI": -1225000000}},
+            "!2": {"position": {"latitude": 40.7, "longitude": -74.0}},
+            "!3": {"position": {"latitudeI": 0, "longitudeI": 0}},
+            "!4": {"user": {"shortName": "NOPO"}},
+            "!5": {},
+        }
+        ids, lats, lons = get_node_positions(nodes)
+
+        assert ids == ["!1", "!2"]
+        assert list(zip(lats, lons)) == [get_node_position(nodes[i]) for i in ids]
+
+
+class TestScaleLatlon:
+    """Tests for scale_latlon function."""
+
+    def test_integer_and_float_fields(self):
+        """Both the 1e-7 integer fields and float degrees should be accepted."""
+        assert scale_latlon({"latitudeI": 375000000, "longitudeI": -1225000000}) == (37.5, -122.5)
+        assert scale_latlon({"latitude": 37.5, "longitude": -122.5}) == (37.5, -122.5)
+
+    def test_unset_position(self):
+        """Missing or zero coordinates should return None."""
+        assert scale_latlon({}) is None
+        assert scale_latlon({"latitudeI": 0, "longitudeI": 0}) is None
+
+    def test_normalize_latlon(self):
+        """Only large integers should be treated as 1e-7 degree values."""
+        assert normalize_latlon(-375000000, 1225000000) == (-37.5, 122.5)
+        assert normalize_latlon(37, -122) == (37, -122)
+        assert normalize_latlon(3750.0, 1.0) == (3750.0, 1.0)
+
+
 class TestGetPortnumName:
     """Tests for get_portnum_name function."""
 
@@ -296,6 +388,167 @@ class TestGetPortnumName:
             assert color is not None
 
 
+class TestFormatPayload:
+    """Tests for format_payload function."""
+
+    def test_name_int_and_str_portnums_match(self):
+        """A portnum name, number and number string should format the same."""
+        outputs = {
+            format_payload({"decoded": {"portnum": portnum, "text": "hello"}}).plain
+            for portnum in ("TEXT_MESSAGE_APP", 1, "1")
+        }
+        assert outputs == {"           [message] hello"}
+
+    def test_position_payload(self):
+        """Integer coordinates should be scaled and extras appended."""
+        packet = {
+            "decoded": {
+                "portnum": "POSITION_APP",
+                "position": {
+                    "latitudeI": 375000000,
+                    "longitudeI": -1225000000,
+                    "satsInView": 7,
+                },
+            }
+        }
+        assert format_payload(packet).plain.strip() == "[position] 37.500000, -122.500000 sats:7"
+
+    def test_telemetry_payload(self):
+        """Present telemetry fields should be listed in a fixed order."""
+        packet = {
+            "decoded": {
+                "portnum": "TELEMETRY_APP",
+                "telemetry": {
+                    "deviceMetrics": {"voltage": 4.1, "batteryLevel": 90, "uptimeSeconds": 7384},
+                    "environmentMetrics": {"relativeHumidity": 40.4, "temperature": 21.5},
+                    "powerMetrics": {"ch1Voltage": 5.0},
+                },
+            }
+        }
+        assert format_payload(packet).plain.strip() == (
+            "[telemetry] bat:90% v:4.10V up:2h3m temp:21.5C hum:40% ch1:5.00V"
+        )
+
+    def test_unhandled_portnum_is_empty(self):
+        """Portnums without a payload formatter should produce no text."""
+        assert format_payload({"decoded": {"portnum": "ADMIN_APP"}}).plain == ""
+        assert format_payload({}).plain == ""
+
+
+class TestPacketTimes:
+    """Tests for the HH:MM:SS times in packet formatting."""
+
+    def test_rx_time_is_local_clock_time(self):
+        """rxTime should be shown as local wall-clock time."""
+        rx_time = 1700000000
+        expected = time.strftime("%H:%M:%S", time.localtime(rx_time))
+
+        assert f"rx:{expected}" in format_verbose({"rxTime": rx_time}).plain
+
+
+class TestFormatPacket:
+    """Tests for format_packet function."""
+
+    def test_line_layout_and_styles(self):
+        """Segments should be styled in place, with signal info last."""
+        packet = {
+            "from": 1,
+            "to": 4294967295,
+            "rxTime": 1700000000,
+            "rxSnr": 5.25,
+            "rxRssi": -80,
+            "hopLimit": 2,
+            "hopStart": 3,
+            "decoded": {"portnum": "TEXT_MESSAGE_APP"},
+        }
+        text = format_packet(packet)
+
+        assert text.plain.endswith("!00000001 -> all (SNR:5.2 RSSI:-80 hops:1)")
+        styles = {text.plain[s.start : s.end]: s.style for s in text.spans}
+        assert styles["[   TEXT   ]"] == f"{Colors.TEXT} bold"
+        assert styles["!00000001"] == Colors.FROM_NODE
+        assert styles["RSSI:-80"] == Colors.RSSI
+        assert styles[")"] == Colors.DIM
+
+    def test_broadcast_destinations_shown_as_all(self):
+        """Every broadcast form of the destination should read as 'all'."""
+        for to in ({"to": 0xFFFFFFFF}, {"toId": "^all"}, {"toId": "!ffffffff"}):
+            assert format_packet({"from": 1, "rxTime": 1, **to}).plain.endswith("-> all")
+        assert format_packet({"from": 1, "to": 2, "rxTime": 1}).plain.endswith("-> !00000002")
+
+    def test_control_codes_do_not_shift_spans(self):
+        """Control characters in names should be stripped without misaligning styles."""
+        text = format_packet({"fromId": "AB\rC", "toId": "!def", "rxTime": 1})
+
+        styles = {text.plain[s.start : s.end]: s.style for s in text.spans}
+        assert styles["ABC"] == Colors.FROM_NODE
+        assert styles["!def"] == Colors.FROM_NODE
+
+
+class TestPrettyPrintJson:
+    """Tests for pretty_print_json function."""
+
+    def test_nested_layout_and_styles(self):
+        """Nested containers should be indented, with keys and values styled."""
+        text = pretty_print_json({"a": [1, None], "b": {}, "c": True}, indent=1)
+        assert (
+            text.plain
+            == '{\n    "a": [\n      1,\n      null\n    ],\n    "b": {},\n    "c": true\n  }'
+        )
+        styles = {text.plain[span.start : span.end]: span.style for span in text.spans}
+        assert styles['"a"'] == JsonColors.KEY
+        assert styles["null"] == JsonColors.NULL
+        assert styles["true"] == JsonColors.BOOL
+
+    def test_long_strings_truncated_and_unknown_types_quoted(self):
+        """Long strings are cut at 60 chars; other objects render as strings."""
+        assert pretty_print_json("x" * 100).plain == '"' + "x" * 57 + '..."'
+        assert pretty_print_json(b"\x01").plain == "\"b'\\x01'\""
+
+    def test_deep_nesting(self):
+        """Deeply nested values should not hit the recursion limit."""
+        deep = []
+        for _ in range(5000):
+            deep = [deep]
+        assert pretty_print_json(deep).plain.count("[") == 5001
+
+    def test_control_codes_do_not_shift_styles(self):
+        """Control characters in values should not misalign later spans."""
+        text = pretty_print_json({"text": "a\rb", "n": 5})
+        styles = {text.plain[span.start : span.end]: span.style for span in text.spans}
+        assert styles['"ab"'] == JsonColors.STRING
+        assert styles['"n"'] == JsonColors.KEY
+        assert styles["5"] == JsonColors.NUMBER
+
+
+class TestGeoLookups:
+    """Tests for the optional postal code and reverse geocoding lookups."""
+
+    def test_geocoders_built_once(self):
+        """Geocoder datasets should be loaded once and reused across lookups."""
+        pgeocode = MagicMock()
+        pgeocode.Nominatim.return_value.query_postal_code.return_value = MagicMock(
+            latitude=37.5, longitude=-122.5
+        )
+        rg = MagicMock()
+        rg.RGeocoder.return_value.query.return_value = [
+            {"name": "Oakland", "admin1": "California", "cc": "US"}
+        ]
+
+        _postal_lookup.cache_clear()
+        _reverse_geocoder.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"pgeocode": pgeocode, "reverse_geocoder": rg}):
+                for _ in range(3):
+                    assert lookup_postal_code("94607") == (37.5, -122.5)
+                    assert get_location_name(37.8, -122.3) == "Oakland, California, US"
+            assert pgeocode.Nominatim.call_count == 1
+            assert rg.RGeocoder.call_count == 1
+        finally:
+            _postal_lookup.cache_clear()
+            _reverse_geocoder.cache_clear()
+
+
 class TestColors:
     """Tests for color constants."""
 
@@ -1,5 +1,6 @@
 """Unit tests for log search functionality."""
 
+import sqlite3
 import time
 from pathlib import Path
 
@@ -164,6 +165,53 @@ class TestStorageSearch:
         count = storage_with_data.count_search_results("Dog")
         assert count >= 1
 
+    def test_text_search_matches_without_fts(self, storage_with_data):
+        """The scan fallback should find the same substrings as the full-text index."""
+        assert storage_with_data._has_fts
+        with_fts = [r.id for r in storage_with_data.search_packets("ello")]
+
+        storage_with_data._has_fts = False
+        assert [r.id for r in storage_with_data.search_packets("ello")] == with_fts
+        assert storage_with_data.count_search_results("ello") == len(with_fts) == 2
+
+    def test_fts_backfills_existing_messages(self, tmp_path):
+        """Messages stored before the index existed should become searchable."""
+        storage = LogStorage(db_path=tmp_path / "messages.db")
+        storage._conn.executescript("DROP TABLE packets_fts; DROP TRIGGER packets_fts_insert;")
+        storage.store_packet(
+            {"id": 1, "from": 1, "to": 2, "decoded": {"portnum": "TEXT_MESSAGE_APP", "text": "backlog"}},
+            time.time(),
+        )
+        storage.close()
+
+        storage = LogStorage(db_path=tmp_path / "messages.db")
+        try:
+            assert storage.count_search_results("klo") == 1
+            storage.clear_messages()
+            assert storage._conn.execute("SELECT COUNT(*) FROM packets_fts").fetchone()[0] == 0
+        finally:
+            storage.close()
+
+    def test_text_column_migrated_from_payload(self, tmp_path):
+        """Databases without the text column should gain it, filled from payloads."""
+        db_path = tmp_path / "messages.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(LogStorage.SCHEMA.replace(",\n        text TEXT", ""))
+        conn.execute(
+            "INSERT INTO packets (timestamp, from_node, to_node, portnum, payload, raw_packet)"
+            " VALUES (1.0, '!00000001', '^all', 'TEXT_MESSAGE_APP', '{\"text\": \"old news\"}', '{}')"
+        )
+        conn.commit()
+        conn.close()
+
+        storage = LogStorage(db_path=db_path)
+        try:
+            assert storage._conn.execute("SELECT text FROM packets").fetchone()[0] == "old news"
+            storage._has_fts = False
+            assert storage.count_search_results("NEWS") == 1
+        finally:
+            storage.close()
+
 
 class TestLogPanelSearch:
     """Tests for LogPanel search methods."""
@@ -1,6 +1,6 @@
 """Tests for protocol patterns in meshterm.connection module."""
 
-from meshterm.connection import REACTION_PATTERN, REPLY_PATTERN
+from meshterm.connection import REACTION_PATTERN, REPLY_PATTERN, parse_reaction, parse_reply
 from meshterm.state import SUPPORTED_REACTIONS
 
 
@@ -245,3 +245,52 @@ class TestPatternEdgeCases:
         assert match is not None
         assert "你好世界" in match.group(2)
         assert "🌍" in match.group(2)
+
+
+# Inputs the string parsers must treat exactly like the regexes
+PARSER_CORPUS = [
+    "[R:123456:👍]",
+    "[R:0:❤️]",
+    "[R:123:thumbs up]",
+    "[R:123:a:b]",
+    "[R:123:👍]\n",
+    "[R:123:👍]\n\n",
+    "[R:123:👍] trailing",
+    "[R:123:]",
+    "[R:abc:👍]",
+    "[R:123👍]",
+    "[R::👍]",
+    "[R:123:👍",
+    "[R:123:x]y]",
+    "[>:123456] Hello!",
+    "[>:0] ",
+    "[>:123]",
+    "[>:123]NoSpace",
+    "[>:123]    multiple spaces",
+    "[>:123] line one\nline two",
+    "[>:123]\n\tindented",
+    "[>:abc] Hello",
+    "[>:] Hello",
+    "[>:123 Hello",
+    "[>:12]3] x",
+    "[>:１２] fullwidth digits",
+    "[>:²] superscript",
+    "Hello world",
+    "",
+]
+
+
+class TestStringParsers:
+    """parse_reaction/parse_reply must agree with the compiled patterns."""
+
+    def test_parse_reaction_matches_pattern(self):
+        for text in PARSER_CORPUS:
+            match = REACTION_PATTERN.match(text)
+            expected = (int(match.group(1)), match.group(2)) if match else None
+            assert parse_reaction(text) == expected, text
+
+    def test_parse_reply_matches_pattern(self):
+        for text in PARSER_CORPUS:
+            match = REPLY_PATTERN.match(text)
+            expected = (int(match.group(1)), match.group(2)) if match else None
+            assert parse_reply(text) == expected, text
@@ -1,14 +1,20 @@
 """Tests for meshterm.state module - state management classes."""
 
+import sys
+import threading
 import time
+from unittest.mock import MagicMock, patch
 
 
 from meshterm.state import (
     Observable,
     DMChannel,
+    MessageBuffer,
     PendingMessage,
     Reaction,
     SelectionState,
+    Settings,
+    StatsTracker,
     SUPPORTED_REACTIONS,
 )
 
@@ -67,6 +73,21 @@ class TestObservable:
         obs = Observable()
         obs.unsubscribe(event_collector.callback)  # Should not raise
 
+    def test_unsubscribe_during_notify(self, event_collector):
+        """A callback unsubscribing itself should not cause others to be skipped."""
+        obs = Observable()
+
+        def one_shot(event_type, data):
+            obs.unsubscribe(one_shot)
+
+        obs.subscribe(one_shot)
+        obs.subscribe(event_collector.callback)
+
+        obs.notify("event", None)
+        obs.notify("event", None)
+
+        assert event_collector.count() == 2
+
     def test_callback_exception_handled(self):
         """Callback exceptions should not stop other callbacks."""
         obs = Observable()
@@ -86,6 +107,19 @@ class TestObservable:
         # Working callback should still be called
         assert len(calls) == 1
 
+    def test_callback_exception_logged(self, caplog):
+        """A failing listener should be logged rather than silently dropped."""
+        obs = Observable()
+
+        def failing_callback(event_type, data):
+            raise ValueError("Test error")
+
+        obs.subscribe(failing_callback)
+        with caplog.at_level("ERROR", logger="meshterm.state"):
+            obs.notify("event", None)
+
+        assert "Test error" in caplog.text
+
 
 class TestNodeStore:
     """Tests for NodeStore class."""
@@ -116,10 +150,64 @@ class TestNodeStore:
         node = node_store.get_node(0x12345678)
         assert before <= node["lastHeard"] <= after
 
+    def test_update_uses_given_timestamp(self, node_store):
+        """A receive timestamp passed in should become lastHeard."""
+        node_store.update_node(0x12345678, {"snr": 5.0}, timestamp=1700000000.7)
+
+        assert node_store.get_node(0x12345678)["lastHeard"] == 1700000000
+
+    def test_repeated_update_skips_write_and_notify(self, node_store, event_collector):
+        """An update that changes nothing should not be saved or announced."""
+        node_store._storage = MagicMock()
+        node_store.subscribe(event_collector.callback)
+
+        node_store.update_node(
+            0x12345678, {"snr": 5.0, "user": {"shortName": "TEST"}}, timestamp=1000.0
+        )
+        node_store.update_node(
+            0x12345678, {"snr": 5.0, "user": {"shortName": "TEST"}}, timestamp=1010.0
+        )
+        assert event_collector.count("node_updated") == 1
+        assert node_store._storage.store_node.call_count == 1
+        assert node_store.get_node(0x12345678)["lastHeard"] == 1010
+
+        node_store.update_node(0x12345678, {"snr": 6.0}, timestamp=1015.0)
+        node_store.update_node(0x12345678, {"snr": 6.0}, timestamp=1050.0)
+        assert event_collector.count("node_updated") == 3
+        assert node_store._storage.store_node.call_count == 3
+
+    def test_frequent_updates_still_refresh_last_heard(self, node_store, event_collector):
+        """A node heard more often than the resolution should still be saved now and then."""
+        saved = []
+        node_store._storage = MagicMock()
+        node_store._storage.store_node.side_effect = lambda node_id, node: saved.append(
+            node["lastHeard"]
+        )
+        node_store.subscribe(event_collector.callback)
+
+        for timestamp in range(1000, 1200, 10):
+            node_store.update_node(0x12345678, {"snr": 5.0}, timestamp=float(timestamp))
+
+        assert saved == [1000, 1030, 1060, 1090, 1120, 1150, 1180]
+        assert event_collector.count("node_updated") == len(saved)
+
     def test_get_nonexistent_node(self, node_store):
         """Getting non-existent node should return None."""
         assert node_store.get_node(0x99999999) is None
 
+    def test_display_name_follows_node_updates(self, node_store):
+        """Cached display names should be refreshed when the node changes."""
+        assert node_store.display_name(0x12345678) == "!12345678"
+
+        node_store.update_node(0x12345678, {"user": {"longName": "Test Node"}})
+        assert node_store.display_name(0x12345678) == "Test Node"
+
+        node_store.update_node(0x12345678, {"user": {"shortName": "TEST"}})
+        assert node_store.display_name("!12345678") == "TEST"
+
+        node_store.clear()
+        assert node_store.display_name(0x12345678) == "!12345678"
+
     def test_get_all_nodes(self, node_store):
         """Should return all stored nodes."""
         node_store.update_node(0x11111111, {"user": {"shortName": "ONE"}})
@@ -238,6 +326,68 @@ class TestMessageBuffer:
         # 3 messages: text broadcast, DM received, telemetry
         assert len(node_msgs) >= 2
 
+    def test_indexed_queries_match_full_scan_after_eviction(self):
+        """Text and per-node queries should track the buffer as it wraps."""
+        buffer = MessageBuffer(max_size=7)
+        nodes = [1, 2, 3, 0xFFFFFFFF]
+        for i in range(40):
+            buffer.append(
+                {
+                    "from": nodes[i % 3],
+                    "to": nodes[(i * 5) % 4],
+                    "channel": i % 2,
+                    "decoded": {"portnum": ("TEXT_MESSAGE_APP", 1, "POSITION_APP")[i % 3]},
+                },
+                float(i),
+            )
+
+            window = buffer.get_all()
+            texts = [m for m in window if m["_is_text"]]
+            assert buffer.get_text_messages() == texts
+            assert buffer.get_text_messages(channel=1, broadcast_only=True) == [
+                m for m in texts if m["_channel"] == 1 and m["_is_broadcast"]
+            ]
+            for node in ("!00000001", "!00000002"):
+                involved = [m for m in texts if node in (m["_from_id"], m["_to_id"])]
+                assert (
+                    buffer.get_text_messages_for_node(node, channel=None, dm_only=False) == involved
+                )
+                assert buffer.get_text_messages_for_node(node, channel=None) == [
+                    m for m in involved if m["_to_id"] == node or not m["_is_broadcast"]
+                ]
+
+    def test_concurrent_appends_keep_indices_in_step(self):
+        """Appends from two threads should not corrupt the eviction indices."""
+        buffer = MessageBuffer(max_size=5)
+
+        def writer(sender):
+            for i in range(2000):
+                buffer.append(
+                    {
+                        "from": sender,
+                        "to": 0xFFFFFFFF,
+                        "decoded": {"portnum": "TEXT_MESSAGE_APP"},
+                    },
+                    float(i),
+                )
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=writer, args=(n,)) for n in (1, 2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert buffer.get_text_messages() == buffer.get_all()
+        for node in ("!00000001", "!00000002"):
+            assert buffer.get_text_messages_for_node(node, channel=None, dm_only=False) == [
+                m for m in buffer.get_all() if m["_from_id"] == node
+            ]
+
     def test_pending_message_tracking(self, message_buffer, text_message_packet):
         """Should track pending messages."""
         message_buffer.add(text_message_packet)
@@ -282,6 +432,39 @@ class TestMessageBuffer:
         assert event_collector.count("message_added") == 1
 
 
+class TestStatsTracker:
+    """Tests for StatsTracker class."""
+
+    def test_msgs_per_min_counts_last_minute(self):
+        """Only packets from the last 60 seconds should count, and older ones are pruned."""
+        stats = StatsTracker()
+        with patch("meshterm.state.time.time", return_value=1000.0):
+            stats.record_packet({})
+        with patch("meshterm.state.time.time", return_value=1030.0):
+            stats.record_packet({})
+            assert stats.get_msgs_per_min() == 2
+        with patch("meshterm.state.time.time", return_value=1070.0):
+            assert stats.get_msgs_per_min() == 1
+            stats.record_packet({})
+            assert len(stats.packet_times) == 2
+            assert stats.get_msgs_per_min() == 2
+
+    def test_channel_util_from_numeric_portnum(self):
+        """Telemetry should be recognised whether portnum is a name or a number."""
+        stats = StatsTracker()
+        for channel, portnum in ((0, "TELEMETRY_APP"), (1, 67), (2, "67")):
+            stats.record_packet(
+                {
+                    "channel": channel,
+                    "decoded": {
+                        "portnum": portnum,
+                        "telemetry": {"deviceMetrics": {"channelUtilization": 5.0}},
+                    },
+                }
+            )
+        assert stats.channel_util == {0: 5.0, 1: 5.0, 2: 5.0}
+
+
 class TestOpenDMsState:
     """Tests for OpenDMsState class."""
 
@@ -425,6 +608,18 @@ class TestSettings:
 
         assert len(changes) == 0
 
+    def test_unchanged_location_settings_are_not_saved(self, settings):
+        """Re-applying the current location settings should not rewrite the config."""
+        with patch.object(Settings, "_save_to_config") as save:
+            settings.set_use_gps(True)
+            settings.clear_manual_location()
+            assert save.call_count == 0
+
+            settings.set_manual_location(37.0, -122.0, "95051")
+            settings.set_manual_location(37.0, -122.0, "95051")
+            settings.set_use_gps(False)
+            assert save.call_count == 2
+
 
 class TestAppState:
     """Tests for AppState container class."""
@@ -439,10 +634,25 @@ class TestAppState:
 
     def test_set_connected(self, empty_state):
         """Should set connection status."""
-        empty_state.set_connected(True, {"my_node_id": "!12345678"})
+        empty_state.set_connected(True, {"my_node_id": "!12345678", "my_node_num": 0x12345678})
 
         assert empty_state.connected is True
         assert empty_state.my_node_id == "!12345678"
+        assert empty_state.my_node_num == 0x12345678
+
+    def test_storage_worker_lifecycle(self, empty_state):
+        """The worker should only run between start and stop, never restarting lazily."""
+        assert empty_state.storage_worker is None
+
+        empty_state.start_storage_worker()
+        worker = empty_state.storage_worker
+        empty_state.start_storage_worker()
+        assert empty_state.storage_worker is worker
+        assert worker.is_alive()
+
+        empty_state.stop_storage_worker()
+        assert not worker.is_alive()
+        assert empty_state.storage_worker is None
 
     def test_channel_names(self, empty_state):
         """Should track channel names."""
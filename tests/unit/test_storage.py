@@ -1,9 +1,10 @@
 """Tests for meshterm.storage module - persistence layer."""
 
+import sqlite3
 import time
+from unittest.mock import patch
 
-
-from meshterm.storage import StoredMessage
+from meshterm.storage import LogStorage, StorageWorker, StoredMessage
 
 
 class TestLogStorageSchema:
@@ -32,6 +33,30 @@ class TestLogStorageSchema:
         assert "idx_channel" in indexes
         assert "idx_from_node" in indexes
         assert "idx_portnum" in indexes
+        assert "idx_text_channel_id" in indexes
+
+    def test_channel_history_uses_text_index(self, in_memory_storage):
+        """Channel history should walk the text index instead of sorting."""
+        plan = in_memory_storage._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM packets"
+            " WHERE portnum IN ('TEXT_MESSAGE_APP', '1') AND channel = ?"
+            " ORDER BY id DESC LIMIT ?",
+            (0, 100),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+
+        assert "idx_text_channel_id" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """On-disk databases should use the WAL journal with NORMAL sync."""
+        storage = LogStorage(db_path=tmp_path / "messages.db")
+        try:
+            assert storage._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert storage._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert storage.get_stats()["db_size_mb"] > 0
+        finally:
+            storage.close()
 
 
 class TestLogStoragePackets:
@@ -51,6 +76,17 @@ class TestLogStoragePackets:
 
         assert id2 == id1 + 1
 
+    def test_store_packets_batch(self, in_memory_storage, text_message_packet):
+        """store_packets should return one ID per packet, in order."""
+        now = time.time()
+        ids = in_memory_storage.store_packets(
+            [(text_message_packet, now), (text_message_packet, now + 1)]
+        )
+
+        assert len(ids) == 2
+        assert ids[1] == ids[0] + 1
+        assert len(in_memory_storage.get_text_messages()) == 2
+
     def test_get_text_messages(self, in_memory_storage, sample_packets):
         """Should retrieve TEXT_MESSAGE_APP messages."""
         for packet in sample_packets:
@@ -169,6 +205,22 @@ class TestLogStoragePackets:
         assert found.delivered is False
         assert found.error_reason == "NO_ROUTE"
 
+    def test_batched_commits_once_on_exit(self, tmp_path, text_message_packet):
+        """Writes inside batched() should only become visible when it exits."""
+        storage = LogStorage(db_path=tmp_path / "messages.db")
+        reader = sqlite3.connect(str(tmp_path / "messages.db"))
+        try:
+            with storage.batched():
+                storage.store_packet(text_message_packet, time.time())
+                storage.store_node("!12345678", {"num": 0x12345678})
+                assert reader.execute("SELECT COUNT(*) FROM packets").fetchone()[0] == 0
+
+            assert reader.execute("SELECT COUNT(*) FROM packets").fetchone()[0] == 1
+            assert reader.execute("SELECT COUNT(*) FROM nodes").fetchone()[0] == 1
+        finally:
+            reader.close()
+            storage.close()
+
 
 class TestLogStorageNodes:
     """Tests for node storage operations."""
@@ -288,6 +340,16 @@ class TestLogStorageReactions:
             assert db_id in reactions
             assert len(reactions[db_id]) == 1
 
+    def test_in_list_pads_to_fixed_sizes(self):
+        """IN lists should be padded with NULLs to a few fixed lengths."""
+        from meshterm.storage import _in_list
+
+        placeholders, params = _in_list([1, 2, 3])
+        assert placeholders.count("?") == 8
+        assert params == [1, 2, 3] + [None] * 5
+        assert _in_list(list(range(33)))[0].count("?") == 128
+        assert _in_list(list(range(600)))[0].count("?") == 1024
+
 
 class TestLogStorageReplyRefs:
     """Tests for reply reference storage operations."""
@@ -311,6 +373,19 @@ class TestLogStorageReplyRefs:
 
         assert parent_db_id == parent_id
 
+    def test_store_reply_ref_resolves_uncached_parent(self, in_memory_storage, text_message_packet):
+        """Parents missing from the packet ID cache should be found in the database."""
+        parent_id = in_memory_storage.store_packet(text_message_packet, time.time())
+        for has_returning in (True, False):
+            in_memory_storage._packet_db_ids.clear()
+            with patch("meshterm.storage._SQLITE_HAS_RETURNING", has_returning):
+                assert (
+                    in_memory_storage.store_reply_ref(10, text_message_packet["id"], 1.0)
+                    == parent_id
+                )
+                assert in_memory_storage.store_reply_ref(11, 999999, 1.0) is None
+            assert in_memory_storage.get_reply_ref(10)["parent_db_id"] == parent_id
+
     def test_get_reply_ref(self, in_memory_storage, text_message_packet):
         """Should retrieve reply reference."""
         parent_id = in_memory_storage.store_packet(text_message_packet, time.time())
@@ -326,6 +401,47 @@ class TestLogStorageReplyRefs:
         assert ref["parent_db_id"] == parent_id
         assert ref["parent_packet_id"] == text_message_packet["id"]
 
+    def test_store_reply_refs_batch(self, in_memory_storage, text_message_packet):
+        """Should store several reply references at once."""
+        parent_id = in_memory_storage.store_packet(text_message_packet, time.time())
+
+        reply_packet = text_message_packet.copy()
+        reply_packet["id"] = 2000
+        reply_ids = in_memory_storage.store_packets(
+            [(reply_packet, time.time()), (reply_packet, time.time())]
+        )
+
+        in_memory_storage.store_reply_refs(
+            [(reply_id, text_message_packet["id"], time.time()) for reply_id in reply_ids]
+        )
+
+        for reply_id in reply_ids:
+            assert in_memory_storage.get_reply_ref(reply_id)["parent_db_id"] == parent_id
+
+    def test_find_db_id_by_packet_id(self, in_memory_storage, text_message_packet):
+        """Should resolve packet IDs from the cache and fall back to the database."""
+        db_id = in_memory_storage.store_packet(text_message_packet, time.time())
+
+        assert in_memory_storage.find_db_id_by_packet_id(text_message_packet["id"]) == db_id
+        assert in_memory_storage.find_db_id_by_packet_id(999999) is None
+
+        # Cold cache, e.g. packets stored in an earlier session
+        in_memory_storage._packet_db_ids.clear()
+        assert in_memory_storage.find_db_id_by_packet_id(text_message_packet["id"]) == db_id
+
+        in_memory_storage.clear_messages()
+        assert in_memory_storage.find_db_id_by_packet_id(text_message_packet["id"]) is None
+
+    def test_packet_id_cache_is_bounded(self, in_memory_storage, text_message_packet):
+        """The packet ID cache should evict the least recently used entries."""
+        in_memory_storage.PACKET_ID_CACHE_SIZE = 2
+        for packet_id in (1, 2, 3):
+            packet = text_message_packet.copy()
+            packet["id"] = packet_id
+            in_memory_storage.store_packet(packet, time.time())
+
+        assert list(in_memory_storage._packet_db_ids) == [2, 3]
+
     def test_get_parent_message(self, in_memory_storage, text_message_packet):
         """Should retrieve parent message from reply."""
         parent_id = in_memory_storage.store_packet(text_message_packet, time.time())
@@ -341,6 +457,34 @@ class TestLogStorageReplyRefs:
         assert parent.id == parent_id
 
 
+class TestStorageWorker:
+    """Tests for the background packet writer."""
+
+    def test_writes_entries_and_links_replies(self, in_memory_storage, text_message_packet):
+        """Queued entries should get database IDs, with replies linked to parents."""
+        worker = StorageWorker(in_memory_storage)
+        worker.start()
+
+        parent = {"packet": text_message_packet, "timestamp": time.time()}
+        reply_packet = text_message_packet.copy()
+        reply_packet["id"] = 2000
+        reply_packet["_reply_to_packet_id"] = text_message_packet["id"]
+        reply = {"packet": reply_packet, "timestamp": time.time()}
+
+        worker.submit(parent)
+        worker.submit(reply)
+        assert worker.flush()
+        worker.stop()
+
+        assert not worker.is_alive()
+        assert (
+            in_memory_storage.find_message_by_packet_id(text_message_packet["id"]).id
+            == parent["_db_id"]
+        )
+        ref = in_memory_storage.get_reply_ref(reply["_db_id"])
+        assert ref["parent_db_id"] == parent["_db_id"]
+
+
 class TestLogStorageDataManagement:
     """Tests for data management operations."""
 
@@ -424,6 +568,19 @@ class TestStoredMessage:
         assert found.channel == 0
         assert found.portnum in ("TEXT_MESSAGE_APP", "1")
 
+    def test_failed_tx_row_restores_flags(self, in_memory_storage, text_message_packet):
+        """A failed sent message should read back with its payload and error."""
+        packet = dict(text_message_packet, _tx=True)
+        in_memory_storage.store_packet(packet, time.time())
+        in_memory_storage.update_delivery_status(packet["id"], False, "NO_ROUTE")
+
+        found = in_memory_storage.get_text_messages()[-1]
+
+        assert found.payload == text_message_packet["decoded"]
+        assert (found.is_tx, found.delivered, found.error_reason) == (True, False, "NO_ROUTE")
+        assert found.raw_packet["_error_reason"] == "NO_ROUTE"
+        assert found.raw_packet["_delivered"] is False
+
 
 class TestLogStorageEnumHandling:
     """Tests for handling enum values in packet data."""
@@ -465,3 +622,38 @@ class TestLogStorageEnumHandling:
 
         db_id = in_memory_storage.store_packet(packet, time.time())
         assert db_id is not None
+
+
+class TestJsonColumns:
+    """Tests for JSON encoding of stored packets and nodes."""
+
+    def test_round_trip_with_and_without_orjson(self, in_memory_storage, text_message_packet):
+        """Packets should read back the same whichever encoder wrote them."""
+        in_memory_storage.store_packet(text_message_packet, time.time())
+        with patch("meshterm.storage.orjson", None):
+            in_memory_storage.store_packet(text_message_packet, time.time())
+
+        first, second = in_memory_storage.get_all_packets(limit=2)
+        assert first.raw_packet == second.raw_packet
+        assert first.payload["text"] == text_message_packet["decoded"]["text"]
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self, in_memory_storage):
+        """Oversized ints and stored NaN should still be written and read."""
+        in_memory_storage.store_node("!12345678", {"num": 2**70, "snr": float("nan")})
+
+        node = in_memory_storage.get_all_nodes()["!12345678"]
+        assert node["num"] == 2**70
+
+    def test_unencodable_values_are_converted(self, in_memory_storage):
+        """bytes, plain objects and other leaves should be stored in readable form."""
+
+        class Point:
+            def __init__(self):
+                self.x = 1
+
+        in_memory_storage.store_node(
+            "!12345678", {"key": b"\x01\xff", "pos": Point(), "tags": {"a"}}
+        )
+
+        node = in_memory_storage.get_all_nodes()["!12345678"]
+        assert node == {"key": "01ff", "pos": {"x": 1}, "tags": "{'a'}"}